@@ -0,0 +1,133 @@
+"""Common helpers for benchmarks - synthetic advanced search reports and timing"""
+import random
+import time
+from typing import Callable, List, Tuple
+
+TORSION_HEADER = "NDB ID,Model ID,Chain ID,Residue Num,Residue Name,O3'-P-O5'-C5',P-O5'-C5'-C4',O5'-C5'-C4'-C3'," \
+                 "C5'-C4'-C3'-O3',C4'-C3'-O3'-P,C3'-O3'-P-O5',O4'-C1'-N1-9-C2-4"
+STEP_HEADER = "NDB ID,Model Number,Step Number,Step Name,Shift,Slide,Rise,Tilt,Roll,Twist,X-Displacement," \
+              "Y-Displacement,Helical Rise,Inclination,Tip,Helical Twist"
+
+
+def torsion_table(rows: int, seed: int=1) -> List[str]:
+    """To make csv lines of NA backbone torsion report
+
+    :param rows: number of rows
+    :type rows: int
+    :param seed: random seed (default value = 1)
+    :type seed: int
+    :return: csv lines with header
+    :rtype: List[str]
+    """
+    rand = random.Random(seed)
+    table = [TORSION_HEADER]
+    for i in range(rows):
+        angles = ','.join('%.1f' % rand.uniform(-180, 180) for _ in range(7))
+        table.append('%dD%02d,1,"%s",%d,D%s,%s' % (1 + i // 5000, i // 100 % 100, 'AB'[i % 2], i % 100,
+                                                   'ACGT'[i % 4], angles))
+    return table
+
+
+def step_table(rows: int, seed: int=1) -> List[str]:
+    """To make csv lines of base pair step parameter report
+
+    :param rows: number of rows
+    :type rows: int
+    :param seed: random seed (default value = 1)
+    :type seed: int
+    :return: csv lines with header
+    :rtype: List[str]
+    """
+    rand = random.Random(seed)
+    table = [STEP_HEADER]
+    for i in range(rows):
+        params = ','.join('%.2f' % rand.uniform(-40, 40) for _ in range(12))
+        table.append('%dD%02d,1,%d,%s/%s,%s' % (1 + i // 5000, i // 100 % 100, i % 100, 'ACGT'[i % 4],
+                                                'TGCA'[i % 4], params))
+    return table
+
+
+def assign_numbers(dic: dict) -> dict:
+    """To convert report values trying int and float on every value, as reports were converted before schema types
+
+    :param dic: report dictionary
+    :type dic: dict
+    :return: report dictionary
+    :rtype: dict
+    """
+    for k, v in dic.items():
+        try:
+            if '.' in v:
+                dic[k] = float(v)
+            else:
+                dic[k] = int(v)
+
+        except ValueError:
+            pass
+    return dic
+
+
+def report_text(table: List[str]) -> str:
+    """To make advanced search response text from csv lines
+
+    :param table: csv lines with header
+    :type table: List[str]
+    :return: response text
+    :rtype: str
+    """
+    return '\n'.join(['Report', 'Number of records: %d' % (len(table) - 1)] + table)
+
+
+def summary_page(structure_id: str='1ABC', chains: int=4, filler: int=500, details: int=10) -> str:
+    """To make summary page html - summary part followed and preceded by menus and tables like on NDB site
+
+    :param structure_id: structure id (default value = '1ABC')
+    :type structure_id: str
+    :param chains: number of sequence chains (default value = 4)
+    :type chains: int
+    :param filler: number of rows of menus and tables outside of summary (default value = 500)
+    :type filler: int
+    :param details: number of additional summary details (default value = 10)
+    :type details: int
+    :return: html string
+    :rtype: str
+    """
+    menu = ''.join('<li class="menuItem"><a href="/menu/%d">Menu item %d</a></li>\n' % (i, i) for i in range(filler))
+    table = ''.join('<tr><td class="cell">%s_%d.cif.gz</td><td>2016-06-08</td><td>%dK</td></tr>\n'
+                    % (structure_id, i, i) for i in range(filler))
+    sequences = ''.join('<span class="blueBoldTxt">Chain %s</span><span>%s</span>' % (chr(65 + i), 'CGCGAATTCGCG' * 4)
+                        for i in range(chains))
+    details = ''.join('<h3 id="dataKey">Detail %d:</h3><p>Value %d</p>' % (i, i) for i in range(details))
+    return '<html><head><title>NDB</title><script>var x = 1;</script></head><body>\n' \
+           '<div id="header"><ul>' + menu + '</ul></div>\n' \
+           '<div id="summary"><h2 class="justHeading">NDB ID: <span>' + structure_id + '</span><span>' + \
+           structure_id + '</span></h2>' \
+           '<h3 id="dataKey">Title:</h3><p>Crystal structure of B-DNA dodecamer</p>' \
+           '<h3 id="dataKey">Nucleic Acid Sequence:</h3><div id="naSeq">' + sequences + '</div>' \
+           '<h3 id="dataKey">Primary Citation:</h3><p>Drew, H.R., Dickerson, R.E.</p>' \
+           '<p>(1981) pp. 535-556, 1981<i>J.Mol.Biol.</i><a href="https://www.ncbi.nlm.nih.gov/pubmed/7265253">' \
+           'Structure of a B-DNA dodecamer</a></p>' \
+           '<h3 id="dataKey">Cell Constants:</h3><p>a = 24.87 b = 40.39 c = 66.20</p>' \
+           '<p>\u03b1 = 90.0 \u03b2 = 90.0 \u03b3 = 90.0</p>' + details + \
+           '<h3 id="dataKey">Release Date:</h3><p>1981-05-01</p><h3 id="dataKey">End</h3></div>\n' \
+           '<div id="footer"><table>' + table + '</table></div></body></html>'
+
+
+def best_of(func: Callable[[], object], repeat: int=3) -> Tuple[float, object]:
+    """To measure best wall time of function
+
+    :param func: function to measure
+    :type func: Callable[[], object]
+    :param repeat: number of runs (default value = 3)
+    :type repeat: int
+    :return: best time in seconds and result of last run
+    :rtype: Tuple[float, object]
+    """
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
@@ -0,0 +1,55 @@
+"""End-to-end benchmark of dna search against live NDB server
+
+Splits NDB.dna_search into its phases - gallery page request, html parsing, result file download and result file
+parsing - so it shows which of them dominates. Response cache is not used. Needs network access.
+
+Usage: python benchmarks/dna_search.py [repeat]
+"""
+import sys
+import time
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from ndb_adapter import report_parser
+from ndb_adapter.html_parser import NDBHtmlExtractor
+from ndb_adapter.ndb_base import NDBBase
+from ndb_adapter.ndb_download import DownloadHelper
+from ndb_adapter.ndb_session import NDBSession
+from ndb_adapter.dna_search_options import DnaSearchOptions
+
+
+def main(repeat: int) -> None:
+    options = DnaSearchOptions()
+    phases = ("gallery request", "html parsing", "file download", "file parsing", "total")
+    best = dict.fromkeys(phases)
+    url = ''
+    count = 0
+    for _ in range(repeat):
+        times = []
+        start = time.perf_counter()
+        resp = NDBSession.get_default().post(NDBBase._dnaUrl, data=options.get())
+        times.append(time.perf_counter())
+
+        html_parser = NDBHtmlExtractor(report_parser._searchTargets)
+        html_parser.analyze(resp.text)
+        url = report_parser.gallery_file_url(html_parser, html_parser.find_one('span', params={'id': 'numRec'}))
+        times.append(time.perf_counter())
+
+        file = DownloadHelper.download_file(NDBBase.siteUrl + url)
+        times.append(time.perf_counter())
+
+        count = len(report_parser.parse_gallery_file(file, url))
+        times.append(time.perf_counter())
+
+        for name, elapsed in zip(phases, [end - begin for begin, end in zip([start] + times, times)] +
+                                 [times[-1] - start]):
+            best[name] = elapsed if best[name] is None else min(best[name], elapsed)
+
+    print("DnaSearchOptions(), %d reports from %s" % (count, url.rpartition('/')[-1] or '-'))
+    for name in phases:
+        print("  %-16s %7.3f s" % (name, best[name]))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
@@ -0,0 +1,55 @@
+"""Benchmark of summary page parsing
+
+Compares parse_summary on whole Tag tree made by NDBHtmlParser with single pass extraction of summary elements by
+NDBHtmlExtractor, on synthetic summary page.
+
+Usage: python benchmarks/html_extract.py [filler rows]
+"""
+import sys
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from benchmarks.common import best_of, summary_page
+from ndb_adapter import report_parser
+from ndb_adapter.html_parser import NDBHtmlParser, NDBHtmlExtractor
+
+
+def count_tags(parser: NDBHtmlParser) -> int:
+    """To count tags of analyzed tree
+
+    :param parser: parser with analyzed html
+    :type parser: NDBHtmlParser
+    :return: number of tags
+    :rtype: int
+    """
+    return len(parser.find_all())
+
+
+def main(filler: int) -> None:
+    html = summary_page(filler=filler)
+
+    def tree() -> object:
+        parser = NDBHtmlParser()
+        parser.analyze(html)
+        return report_parser._parse_summary_tree(parser)
+
+    def extract() -> object:
+        return report_parser.parse_summary(html)
+
+    full_parser = NDBHtmlParser()
+    full_parser.analyze(html)
+    extractor = NDBHtmlExtractor(report_parser._summaryTargets)
+    extractor.analyze(html)
+    assert tree().get_dict() == extract().get_dict()
+
+    print("summary page, %d KB" % (len(html) // 1024))
+    base = None
+    for name, func, parser in (("whole tree", tree, full_parser), ("extracted summary", extract, extractor)):
+        elapsed, _ = best_of(func, repeat=5)
+        base = base or elapsed
+        print("  %-18s %7.4f s  %5.1f x  %6d tags" % (name, elapsed, base / elapsed, count_tags(parser)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
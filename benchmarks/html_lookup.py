@@ -0,0 +1,54 @@
+"""Benchmark of NDBHtmlParser lookups
+
+Compares find_one and find_all on indexed tree with walking the tree tag by tag, as lookups worked before indexes,
+for lookups parse_summary makes per summary detail - range between details and id lookup from root.
+
+Usage: python benchmarks/html_lookup.py [details]
+"""
+import sys
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from benchmarks.common import best_of, summary_page
+from ndb_adapter.html_parser import NDBHtmlParser
+
+
+class WalkingParser(NDBHtmlParser):
+    """Parser without index lookups - every find walks the tree"""
+    def _search(self, name, after, before, params, first):
+        return None
+
+
+def lookups(parser: NDBHtmlParser) -> int:
+    """To make lookups of every summary detail
+
+    :param parser: parser with analyzed summary page
+    :type parser: NDBHtmlParser
+    :return: number of found tags
+    :rtype: int
+    """
+    found = 0
+    details = parser.find_all('h3', params={'id': 'dataKey'})
+    for tag, before in zip(details, details[1:]):
+        found += parser.find_one('p', after=tag, before=before) is not None
+        found += parser.find_one('i', after=tag, before=before) is not None
+        found += parser.find_one('div', params={'id': 'naSeq'}) is not None
+    return found
+
+
+def main(details: int) -> None:
+    html = summary_page(filler=2000, details=details)
+    print("summary page, %d KB, %d details" % (len(html) // 1024, details))
+    base = None
+    for name, parser_class in (("tree walk", WalkingParser), ("indexes", NDBHtmlParser)):
+        parser = parser_class()
+        analyze, _ = best_of(lambda: parser.analyze(html))
+        elapsed, found = best_of(lambda: lookups(parser))
+        base = base or elapsed
+        print("  %-10s analyze %7.4f s  lookups %7.4f s  %7.1f x  %d found" % (name, analyze, elapsed,
+                                                                              base / elapsed, found))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,93 @@
+"""Micro-benchmarks of NDBHtmlParser
+
+Measures analyze and serialization of tree to string on summary pages, compared with data appended to tag by string
+concatenation and recursive serialization, as they worked before. Saved NDB summary pages can be given as arguments,
+otherwise synthetic pages are used.
+
+Usage: python benchmarks/html_parser.py [summary.html ...]
+"""
+import sys
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from benchmarks.common import best_of, summary_page
+from ndb_adapter.html_parser import NDBHtmlParser, Tag
+
+
+class ConcatParser(NDBHtmlParser):
+    """Parser appending data to tag by string concatenation"""
+    def handle_data(self, data) -> None:
+        data = data.translate({ord('\xc5'): '', ord('\xa0'): '', ord('\n'): '',
+                               ord('\t'): '', ord('\r'): '', ord('\f'): ''})
+        data = data.strip()
+        try:
+            self._elementsStack[-1].data += data
+        except IndexError:
+            pass
+
+
+def recursive_str(tag: Tag) -> str:
+    """To serialize tag by recursive string concatenation
+
+    :param tag: tag to serialize
+    :type tag: Tag
+    :return: tag as string
+    :rtype: str
+    """
+    result = "<" + str(tag.name)
+    for key in tag.attrs:
+        result += " " + str(key) + "=\"" + str(tag.attrs[key]) + "\""
+    result += ">" + str(tag.data)
+    for child in tag.children:
+        result += recursive_str(child)
+    result += "</" + str(tag.name) + ">"
+    return result
+
+
+def text_page(chunks: int) -> str:
+    """To make page with paragraph of text split by inline tags, so its data comes in many parts
+
+    :param chunks: number of text parts
+    :type chunks: int
+    :return: html string
+    :rtype: str
+    """
+    text = ''.join('Residue %d of chain&nbsp;A <b>%d</b>\n' % (i, i) for i in range(chunks))
+    return '<html><body><div id="summary"><p>' + text + '</p></div></body></html>'
+
+
+def nested_page(depth: int) -> str:
+    """To make page of nested elements with data
+
+    :param depth: nesting depth
+    :type depth: int
+    :return: html string
+    :rtype: str
+    """
+    return ('<div class="level">' + 'Level data text ' * 60) * depth + '</div>' * depth
+
+
+def main(files: list) -> None:
+    pages = [(path.basename(file), open(file, encoding='utf-8').read()) for file in files]
+    if not pages:
+        pages = [('summary page', summary_page(filler=2000, details=200)), ('long text', text_page(20000)),
+                 ('nested elements', nested_page(900))]
+
+    for name, html in pages:
+        print("%s, %d KB" % (name, len(html) // 1024))
+        parser = NDBHtmlParser()
+        parser.analyze(html)
+        tree = parser.get_tree()
+
+        cases = (("analyze, concatenated data", lambda: ConcatParser().analyze(html)),
+                 ("analyze, joined data", lambda: parser.analyze(html)),
+                 ("str, recursive", lambda: recursive_str(tree)),
+                 ("str, iterative", lambda: str(tree)))
+        for case, func in cases:
+            elapsed, _ = best_of(func, repeat=5)
+            print("  %-28s %8.4f s" % (case, elapsed))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
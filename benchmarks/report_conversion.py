@@ -0,0 +1,45 @@
+"""Benchmark of values conversion of base pair step parameter reports
+
+Compares conversion trying int and float on every value with schema typed conversion, column by column, of report
+objects and of columnar arrays.
+
+Usage: python benchmarks/report_conversion.py [rows]
+"""
+import sys
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from benchmarks.common import assign_numbers, best_of, report_text, step_table
+from ndb_adapter import report_parser
+from ndb_adapter.enums import ReportType
+from ndb_adapter.search_report import BasePairStepParameterReport
+
+
+def main(rows: int) -> None:
+    table = step_table(rows)
+    text = report_text(table)
+
+    def legacy() -> list:
+        return report_parser.parse_csv(table, lambda report: BasePairStepParameterReport(assign_numbers(report)))
+
+    def per_row() -> list:
+        return report_parser.parse_csv(table, lambda report: BasePairStepParameterReport(report))
+
+    def columns() -> list:
+        return report_parser.parse_csv(table, BasePairStepParameterReport)
+
+    def arrays() -> dict:
+        return report_parser.parse_advanced_search_report(text, '', ReportType.BasePairStepParameter).to_arrays()
+
+    print("BasePairStepParameterReport, %d rows" % rows)
+    base = None
+    for name, func in (("int/float on every value", legacy), ("schema types, per row", per_row),
+                       ("schema types, per column", columns), ("schema types, to_arrays", arrays)):
+        elapsed, _ = best_of(func)
+        base = base or elapsed
+        print("  %-26s %7.3f s  %5.1f x" % (name, elapsed, base / elapsed))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,56 @@
+"""Benchmark of memory used by advanced search report objects
+
+Compares slotted reports with per instance dicts pre-filled with defaults, as reports were kept before.
+
+Usage: python benchmarks/report_memory.py [rows]
+"""
+import sys
+import tracemalloc
+from os import path
+from typing import Callable, List
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from benchmarks.common import assign_numbers, torsion_table
+from ndb_adapter import report_parser
+from ndb_adapter.search_report import NABackboneTorsionReport
+
+
+class DictReport(object):
+    """Report kept in per instance dict, like reports before slots"""
+    def __init__(self, report: dict):
+        self._report = dict(zip(NABackboneTorsionReport._schema.names, NABackboneTorsionReport._schema.defaults))
+        self._report.update(assign_numbers(report))
+
+
+def measure(table: List[str], result_class: Callable[[dict], object]) -> int:
+    """To measure memory held by parsed reports
+
+    :param table: csv lines with header
+    :type table: List[str]
+    :param result_class: report class
+    :type result_class: Callable[[dict], object]
+    :return: allocated bytes
+    :rtype: int
+    """
+    tracemalloc.start()
+    reports = report_parser.parse_csv(table, result_class)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del reports
+    return size
+
+
+def main(rows: int) -> None:
+    table = torsion_table(rows)
+    before = measure(table, DictReport)
+    after = measure(table, NABackboneTorsionReport)
+
+    print("NABackboneTorsionReport, %d rows" % rows)
+    print("  dict reports:    %8.1f MB  %6.0f B/row" % (before / 1e6, before / rows))
+    print("  slotted reports: %8.1f MB  %6.0f B/row" % (after / 1e6, after / rows))
+    print("  reduction:       %8.1f x" % (before / after))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -1,4 +1,9 @@
 from ndb_adapter.enums import *
 from ndb_adapter.ndb import NDB, AdvancedSearchOptions, DnaSearchOptions, DownloadType, RnaSearchOptions
+from ndb_adapter.async_ndb import AsyncNDB
+from ndb_adapter.ndb_session import NDBSession
+from ndb_adapter.download_cache import DownloadCache
+from ndb_adapter.mirror import Mirror
+from ndb_adapter.mirror_index import MirrorIndex
+from ndb_adapter.response_cache import MemoryResponseCache, SQLiteResponseCache
 from ndb_adapter.search_report import *
-
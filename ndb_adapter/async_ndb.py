@@ -0,0 +1,129 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from ndb_adapter.advanced_search_options import AdvancedSearchOptions
+from ndb_adapter.dna_search_options import DnaSearchOptions
+from ndb_adapter.ndb import NDB
+from ndb_adapter.ndb_base import NDBBase
+from ndb_adapter.ndb_download import DownloadType
+from ndb_adapter.ndb_session import NDBSession
+from ndb_adapter.rna_search_options import RnaSearchOptions
+from ndb_adapter.search_result import SimpleResult, AdvancedResult
+from ndb_adapter.summary_result import SummaryResult
+
+
+class AsyncNDB(NDBBase):
+    """Class for asynchronous search in NDB - all methods are coroutines mirroring NDB static methods"""
+    def __init__(self, concurrency: int=None):
+        """Default constructor
+
+        :param concurrency: max number of requests in flight at once (default value = None) - pool size of default \
+        session. Larger concurrency needs default session with larger pool, otherwise requests wait for connections
+        :type concurrency: int
+        """
+        if concurrency is None:
+            concurrency = NDBSession.get_default().pool_maxsize
+        if concurrency < 1:
+            raise AttributeError("concurrency must be positive")
+
+        self._concurrency = concurrency
+        self._semaphore = None
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    @property
+    def concurrency(self) -> int:
+        """Gets max number of requests in flight
+
+        :return: concurrency limit
+        :rtype: int
+        """
+        return self._concurrency
+
+    async def _run(self, func, *args):
+        """Private method to run blocking NDB call in executor limited by semaphore
+
+        :param func: function to run
+        :param args: function arguments
+        :return: function result
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    async def advanced_search(self, options: AdvancedSearchOptions=None) -> AdvancedResult:
+        """Advanced search in NDB - coroutine version of NDB.advanced_search
+
+        :param options: options for advanced search (default value = None) - clear AdvancedSearchOptions()
+        :type options: AdvancedSearchOptions
+        :return: search result { count -> int, report -> List[AdvancedReport], statistics -> Statistics }
+        :rtype: AdvancedResult
+        """
+        return await self._run(NDB.advanced_search, options)
+
+    async def dna_search(self, options: DnaSearchOptions=None) -> SimpleResult:
+        """Dna only search in NDB - coroutine version of NDB.dna_search
+
+        :param options: options for dna search (default value = None) - clear DnaSearchOptions()
+        :type options: DnaSearchOptions
+        :return: search simple result { count -> int, report -> List[SimpleReport] }
+        :rtype: SimpleResult
+        """
+        return await self._run(NDB.dna_search, options)
+
+    async def rna_search(self, options: RnaSearchOptions=None) -> SimpleResult:
+        """Rna only search in NDB - coroutine version of NDB.rna_search
+
+        :param options: options for rna search (default value = None) - clear RnaSearchOptions()
+        :type options: RnaSearchOptions
+        :return: search simple result { count -> int, report -> List[SimpleReport] }
+        :rtype: SimpleResult
+        """
+        return await self._run(NDB.rna_search, options)
+
+    async def summary(self, structure_id: str) -> SummaryResult:
+        """Summary search in NDB - coroutine version of NDB.summary
+
+        :param structure_id: structure NDB ID or PDB ID e.g. 4Z6C
+        :type structure_id: str
+        :return: search summary result
+        :rtype: SummaryResult
+        """
+        return await self._run(NDB.summary, structure_id)
+
+    async def download(self, structure_id: str, download_type: DownloadType=DownloadType.Pdb,
+                       save: bool=False, target_dir: str='', raw: bool=False, compressed: bool=False) -> str:
+        """Download PDB from NDB - coroutine version of NDB.download
+
+        :param download_type: file download type (default value is DownloadType.PDB)
+        :type download_type: DownloadType
+        :param target_dir: where to save file (default value is current dir)
+        :type target_dir: str
+        :param save: tells if file should be saved or not (default value = False)
+        :type save: bool
+        :param raw: tells if file should be returned as bytes without decoding (default value = False)
+        :type raw: bool
+        :param compressed: tells if gz compressed files should be returned or saved as they are on server - \
+        implies raw (default value = False)
+        :type compressed: bool
+        :param structure_id: structure NDB ID or PDB ID e.g. 4Z6C
+        :type structure_id: str
+        :return: string, bytes or None
+        :rtype: str
+        """
+        return await self._run(NDB.download, structure_id, download_type, save, target_dir, raw, compressed)
+
+    def close(self) -> None:
+        """To release worker threads
+
+        :return: None
+        """
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> 'AsyncNDB':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
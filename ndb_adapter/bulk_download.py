@@ -0,0 +1,90 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List
+from urllib.parse import urlparse
+import requests
+from ndb_adapter.ndb_download import DownloadHelper, DownloadType
+
+
+class BulkDownloader(object):
+    """Class for parallel download of many structures files with per host concurrency cap"""
+    def __init__(self, max_workers: int=8, per_host: int=4,
+                 progress: Callable[[int, int, str, bool], None]=None):
+        """Default constructor
+
+        :param max_workers: max number of downloads running at once (default value = 8)
+        :type max_workers: int
+        :param per_host: max number of downloads running at once against single host (default value = 4)
+        :type per_host: int
+        :param progress: callback called after every download with (done, total, structure_id, success) \
+        (default value = None)
+        :type progress: Callable[[int, int, str, bool], None]
+        """
+        if max_workers < 1 or per_host < 1:
+            raise AttributeError("max_workers and per_host must be positive")
+
+        self._max_workers = max_workers
+        self._per_host = per_host
+        self._progress = progress
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _host_semaphore(self, download_type: DownloadType) -> threading.Semaphore:
+        """Private method to get semaphore limiting downloads for download type host
+
+        :param download_type: file download type
+        :type download_type: DownloadType
+        :return: host semaphore
+        :rtype: threading.Semaphore
+        """
+        host = urlparse(download_type.value.Url).netloc
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = threading.Semaphore(self._per_host)
+            return self._hosts[host]
+
+    def download(self, structure_ids: Iterable[str], download_type: DownloadType=DownloadType.Pdb,
+                 save: bool=False, target_dir: str='', raw: bool=False, compressed: bool=False) -> List[str]:
+        """Download files of many structures from NDB in parallel
+
+        :param structure_ids: structures NDB IDs or PDB IDs e.g. 4Z6C
+        :type structure_ids: Iterable[str]
+        :param download_type: files download type (default value is DownloadType.PDB)
+        :type download_type: DownloadType
+        :param save: tells if files should be saved or not (default value = False)
+        :type save: bool
+        :param target_dir: where to save files (default value is current dir)
+        :type target_dir: str
+        :param raw: tells if file should be returned as bytes without decoding (default value = False)
+        :type raw: bool
+        :param compressed: tells if gz compressed files should be returned or saved as they are on server - \
+        implies raw (default value = False)
+        :type compressed: bool
+        :return: list of strings, bytes (or None when saved) in input order, failed downloads are left out
+        :rtype: List[str]
+        """
+        structure_ids = list(structure_ids)
+        total = len(structure_ids)
+        semaphore = self._host_semaphore(download_type)
+        state = {'done': 0}
+
+        def task(structure_id: str):
+            success = False
+            try:
+                with semaphore:
+                    file = DownloadHelper.download(structure_id, download_type, save, target_dir, raw, compressed)
+                success = True
+                return success, file
+            except (FileNotFoundError, AttributeError, BufferError, requests.RequestException):
+                return success, None
+            finally:
+                if self._progress:
+                    with self._lock:
+                        state['done'] += 1
+                        done = state['done']
+                    self._progress(done, total, structure_id, success)
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            results = list(executor.map(task, structure_ids))
+
+        return [file for success, file in results if success]
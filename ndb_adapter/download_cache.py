@@ -0,0 +1,246 @@
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from ndb_adapter.ndb_download import DownloadType
+from ndb_adapter.ndb_session import NDBSession
+
+
+class DownloadCache(object):
+    """Class for persistent cache of downloaded files. Files are stored by content hash, entries are keyed by \
+    (DownloadType, structure id), validated with ETag/Last-Modified and evicted least recently used first"""
+    def __init__(self, directory: str, max_size: int=1024 ** 3, max_age: float=3600):
+        """Default constructor
+
+        :param directory: cache directory, created if not exists
+        :type directory: str
+        :param max_size: max size of cached files in bytes (default value = 1 GiB)
+        :type max_size: int
+        :param max_age: seconds after which entry is revalidated with server (default value = 3600)
+        :type max_age: float
+        """
+        self._directory = os.path.abspath(directory)
+        self._max_size = max_size
+        self._max_age = max_age
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.join(self._directory, 'objects'), exist_ok=True)
+        self._db = sqlite3.connect(os.path.join(self._directory, 'index.sqlite'), check_same_thread=False)
+        with self._db:
+            self._db.execute('CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, url TEXT, hash TEXT, '
+                             'size INTEGER, etag TEXT, last_modified TEXT, fetched REAL, used REAL)')
+
+    @property
+    def directory(self) -> str:
+        """Gets cache directory
+
+        :return: cache directory
+        :rtype: str
+        """
+        return self._directory
+
+    @property
+    def size(self) -> int:
+        """Gets size of cached files in bytes
+
+        :return: cache size
+        :rtype: int
+        """
+        with self._lock:
+            return self._db.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+
+    @staticmethod
+    def _key(download_type: DownloadType, structure_id: str) -> str:
+        """Private method to make entry key
+
+        :param download_type: file download type
+        :type download_type: DownloadType
+        :param structure_id: structure id
+        :type structure_id: str
+        :return: entry key
+        :rtype: str
+        """
+        return download_type.name + ':' + structure_id.lower()
+
+    def _path(self, content_hash: str) -> str:
+        """Private method to get path of file with given content hash
+
+        :param content_hash: sha256 of file content
+        :type content_hash: str
+        :return: file path
+        :rtype: str
+        """
+        return os.path.join(self._directory, 'objects', content_hash[:2], content_hash)
+
+    def get(self, download_type: DownloadType, structure_id: str) -> str:
+        """Gets path of cached file without validation or None if not cached
+
+        :param download_type: file download type
+        :type download_type: DownloadType
+        :param structure_id: structure NDB ID or PDB ID e.g. 4Z6C
+        :type structure_id: str
+        :return: cached file path or None
+        :rtype: str
+        """
+        key = DownloadCache._key(download_type, structure_id)
+        with self._lock:
+            row = self._db.execute('SELECT hash FROM entries WHERE key = ?', (key,)).fetchone()
+            if row and os.path.isfile(self._path(row[0])):
+                with self._db:
+                    self._db.execute('UPDATE entries SET used = ? WHERE key = ?', (time.time(), key))
+                return self._path(row[0])
+        return None
+
+    def fetch(self, url: str, download_type: DownloadType, structure_id: str) -> str:
+        """Gets path of file from cache, downloads it or validates cached one with conditional request if needed
+
+        :param url: file url
+        :type url: str
+        :param download_type: file download type
+        :type download_type: DownloadType
+        :param structure_id: structure NDB ID or PDB ID e.g. 4Z6C
+        :type structure_id: str
+        :return: cached file path
+        :rtype: str
+        :raise FileNotFoundError: when file is not present on server
+        """
+        key = DownloadCache._key(download_type, structure_id)
+        with self._lock:
+            row = self._db.execute('SELECT url, hash, etag, last_modified, fetched FROM entries WHERE key = ?',
+                                   (key,)).fetchone()
+
+        headers = {}
+        if row and row[0] == url and os.path.isfile(self._path(row[1])):
+            if time.time() - row[4] < self._max_age:
+                self._touch(key, fetched=False)
+                return self._path(row[1])
+            if row[2]:
+                headers['If-None-Match'] = row[2]
+            if row[3]:
+                headers['If-Modified-Since'] = row[3]
+
+        with NDBSession.get_default().get(url, headers=headers, stream=True) as resp:
+            if headers and resp.status_code == 304:
+                self._touch(key, fetched=True)
+                return self._path(row[1])
+            if resp.status_code == 404:
+                raise FileNotFoundError("No file on server")
+            resp.raise_for_status()
+
+            content_hash, size = self._store(resp.iter_content(64 * 1024))
+            etag = resp.headers.get('ETag')
+            last_modified = resp.headers.get('Last-Modified')
+
+        now = time.time()
+        with self._lock:
+            old = self._db.execute('SELECT hash FROM entries WHERE key = ?', (key,)).fetchone()
+            with self._db:
+                self._db.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                                 (key, url, content_hash, size, etag, last_modified, now, now))
+            if old and old[0] != content_hash:
+                self._remove_unused(old[0])
+            self._evict(keep=content_hash)
+
+        return self._path(content_hash)
+
+    def _touch(self, key: str, fetched: bool) -> None:
+        """Private method to mark entry as used (and validated)
+
+        :param key: entry key
+        :type key: str
+        :param fetched: tells if entry was validated with server
+        :type fetched: bool
+        :return: None
+        """
+        now = time.time()
+        with self._lock:
+            with self._db:
+                if fetched:
+                    self._db.execute('UPDATE entries SET used = ?, fetched = ? WHERE key = ?', (now, now, key))
+                else:
+                    self._db.execute('UPDATE entries SET used = ? WHERE key = ?', (now, key))
+
+    def _store(self, chunks) -> tuple:
+        """Private method to write chunks to content addressed file
+
+        :param chunks: iterable of file bytes chunks
+        :return: tuple of content hash and size
+        :rtype: tuple
+        """
+        sha = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                for chunk in chunks:
+                    sha.update(chunk)
+                    size += len(chunk)
+                    file.write(chunk)
+
+            content_hash = sha.hexdigest()
+            path = self._path(content_hash)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return content_hash, size
+
+    def _evict(self, keep: str=None) -> None:
+        """Private method to remove least recently used entries until cache fits max size, caller holds lock
+
+        :param keep: content hash which should not be removed (default value = None)
+        :type keep: str
+        :return: None
+        """
+        total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        if total <= self._max_size:
+            return
+
+        rows = self._db.execute('SELECT key, hash, size FROM entries ORDER BY used').fetchall()
+        with self._db:
+            for key, content_hash, size in rows:
+                if total <= self._max_size:
+                    break
+                if content_hash == keep:
+                    continue
+
+                self._db.execute('DELETE FROM entries WHERE key = ?', (key,))
+                total -= size
+                self._remove_unused(content_hash)
+
+    def _remove_unused(self, content_hash: str) -> None:
+        """Private method to remove file of content hash if no entry refers to it, caller holds lock
+
+        :param content_hash: sha256 of file content
+        :type content_hash: str
+        :return: None
+        """
+        shared = self._db.execute('SELECT 1 FROM entries WHERE hash = ?', (content_hash,)).fetchone()
+        if not shared and os.path.isfile(self._path(content_hash)):
+            os.remove(self._path(content_hash))
+
+    def clear(self) -> None:
+        """To remove all cached files
+
+        :return: None
+        """
+        with self._lock:
+            rows = self._db.execute('SELECT DISTINCT hash FROM entries').fetchall()
+            with self._db:
+                self._db.execute('DELETE FROM entries')
+            for content_hash, in rows:
+                if os.path.isfile(self._path(content_hash)):
+                    os.remove(self._path(content_hash))
+
+    def close(self) -> None:
+        """To close cache index
+
+        :return: None
+        """
+        with self._lock:
+            self._db.close()
@@ -1,14 +1,28 @@
+from bisect import bisect_left
 from html.parser import HTMLParser
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 
 class NDBHtmlParser(HTMLParser):
-    """Class for html parse"""
+    """Class for html parse - after analyze tags are indexed by name, id and class with their document order \
+    positions, so find_one and find_all don't walk the tree
+
+    :cvar _indexedAttrs: private attributes which values are indexed
+    :cvar _dataTable: private translation table of characters removed from tags data
+    """
+    _indexedAttrs = ('id', 'class')
+    _dataTable = str.maketrans('', '', '\xc5\xa0\n\t\r\f')
+
     def __init__(self):
         """Default constructor"""
         HTMLParser.__init__(self)
-        self.__tree = None
-        self.__elementsStack = []
+        self._tree = None
+        self._elementsStack = []
+        self._dataParts = {}
+        self._order = []
+        self._positions = {}
+        self._names = {}
+        self._attrs = {}
 
     def error(self, message: str):
         """Function for error messages
@@ -25,13 +39,137 @@ class NDBHtmlParser(HTMLParser):
         :type data: str
         :return: None
         """
-        self.__tree = None
-        self.__elementsStack = []
+        self._tree = None
+        self._elementsStack = []
+        self._dataParts = {}
         self.feed(data)
         self.close()
 
-        if self.__elementsStack:
-            self.__tree = self.__elementsStack.pop()
+        if self._elementsStack:
+            self._tree = self._elementsStack.pop()
+
+        self._join_data()
+        self._index()
+
+    def _join_data(self, tag: 'Tag'=None) -> None:
+        """Private method to set data collected in parts to tag - data of every tag if tag is None
+
+        :param tag: closed tag (default value = None)
+        :type tag: Tag
+        :return: None
+        """
+        if tag is None:
+            for open_tag, parts in self._dataParts.items():
+                open_tag.data += ''.join(parts)
+            self._dataParts = {}
+        else:
+            parts = self._dataParts.pop(tag, None)
+            if parts:
+                tag.data += ''.join(parts)
+
+    def _index(self) -> None:
+        """Private method to number tags of tree in document order, as Tag next walks them, and index their \
+        positions by name and by indexed attributes values
+
+        :return: None
+        """
+        self._order = order = []
+        self._positions = positions = {}
+        self._names = names = {}
+        self._attrs = attrs = {}
+
+        stack = [self._tree] if self._tree is not None else []
+        while stack:
+            tag = stack.pop()
+            position = len(order)
+            order.append(tag)
+            positions[tag] = position
+            names.setdefault(tag.name, []).append(position)
+            for key in NDBHtmlParser._indexedAttrs:
+                if key in tag.attrs:
+                    attrs.setdefault((key, tag.attrs[key]), []).append(position)
+            stack.extend(reversed(tag.children))
+
+    def _candidates(self, name: str, params: dict) -> List[int]:
+        """Private method to get sorted positions of tags which may match criteria, None if every tag may match
+
+        :param name: node name
+        :type name: str
+        :param params: node parameters
+        :type params: dict
+        :return: sorted positions or None
+        :rtype: List[int]
+        """
+        if params and all(key in NDBHtmlParser._indexedAttrs for key in params):
+            try:
+                lists = [self._attrs.get((key, value), []) for key, value in params.items()]
+            except TypeError:  # unhashable value never equals attribute value
+                return []
+            return lists[0] if len(lists) == 1 else sorted(set().union(*lists))
+        if name:
+            return self._names.get(name, [])
+        return None
+
+    def _range(self, after: 'Tag', before: 'Tag') -> Tuple[int, int]:
+        """Private method to get positions range from after node (inclusive) to before node (exclusive), None if \
+        nodes are not indexed
+
+        :param after: after node instance
+        :type after: Tag
+        :param before: before node instance
+        :type before: Tag
+        :return: start and end positions
+        :rtype: Tuple[int, int]
+        """
+        start, end = 0, len(self._order)
+        if after is not None:
+            start = self._positions.get(after)
+            if start is None:
+                return None
+        if before is not None:
+            position = self._positions.get(before)
+            if position is None:
+                return None
+            if position >= start:
+                end = position
+        return start, end
+
+    def _search(self, name: str, after: 'Tag', before: 'Tag', params: dict, first: bool) -> List['Tag']:
+        """Private method to get indexed tags matching criteria in document order
+
+        :param name: node name
+        :type name: str
+        :param after: after node instance
+        :type after: Tag
+        :param before: before node instance
+        :type before: Tag
+        :param params: node parameters
+        :type params: dict
+        :param first: tells if search stops at first match
+        :type first: bool
+        :return: matching nodes list, None if nodes are not indexed
+        :rtype: List[Tag]
+        """
+        bounds = self._range(after, before)
+        if bounds is None:
+            return None
+
+        start, end = bounds
+        candidates = self._candidates(name, params)
+        if candidates is None:
+            positions = range(start, end)
+        else:
+            positions = candidates[bisect_left(candidates, start):bisect_left(candidates, end)]
+
+        result = []
+        order = self._order
+        for position in positions:
+            tag = order[position]
+            if (not name or tag.name == name) and tag.has_attr(params):
+                result.append(tag)
+                if first:
+                    break
+        return result
 
     def get_tree(self) -> 'Tag':
         """Function for get tree top element
@@ -39,7 +177,7 @@ class NDBHtmlParser(HTMLParser):
         :rtype: 'Tag'
         :return: Tree top
         """
-        return self.__tree
+        return self._tree
 
     def find_one(self, name: str =None, after: 'Tag'=None, before: 'Tag'=None, params: dict=None) -> 'Tag':
         """Function for get tree node matching criteria
@@ -62,7 +200,11 @@ class NDBHtmlParser(HTMLParser):
         if params and not isinstance(params, dict):
             raise TypeError("Params is not instance of dictionary class")
 
-        root = self.__tree if after is None else after
+        found = self._search(name, after, before, params, True)
+        if found is not None:
+            return found[0] if found else None
+
+        root = self._tree if after is None else after
         next_tag = Tag(name="root", next_sib=root)
         while True:
             try:
@@ -99,7 +241,11 @@ class NDBHtmlParser(HTMLParser):
         if params and not isinstance(params, dict):
             raise TypeError("Params is not instance of dictionary class")
 
-        root = self.__tree if after is None else after
+        found = self._search(name, after, before, params, False)
+        if found is not None:
+            return found
+
+        root = self._tree if after is None else after
         next_tag = Tag(name="root", next_sib=root)
         result = []
         while True:
@@ -124,7 +270,7 @@ class NDBHtmlParser(HTMLParser):
         :return: None
         """
         to_add = Tag(tag, attrs=dict(attrs))
-        self.__elementsStack.append(to_add)
+        self._elementsStack.append(to_add)
 
     def handle_endtag(self, tag) -> None:
         """Function to handle end tag and add to tree
@@ -133,14 +279,15 @@ class NDBHtmlParser(HTMLParser):
         :return: None
         """
         try:
-            poped = self.__elementsStack.pop()
-            if not self.__elementsStack:
-                if not self.__tree:
-                    self.__tree = poped
+            poped = self._elementsStack.pop()
+            self._join_data(poped)
+            if not self._elementsStack:
+                if not self._tree:
+                    self._tree = poped
                 else:
-                    self.__tree.add_child(poped)
+                    self._tree.add_child(poped)
             else:
-                self.__elementsStack[-1].add_child(poped)
+                self._elementsStack[-1].add_child(poped)
         except IndexError:
             pass
 
@@ -151,13 +298,125 @@ class NDBHtmlParser(HTMLParser):
         :return: None
         """
         #   TO DO: rest unicode char to null
-        data = data.translate({ord('\xc5'): '', ord('\xa0'): '', ord('\n'): '',
-                               ord('\t'): '', ord('\r'): '', ord('\f'): ''})
-        data = data.strip()
+        data = data.translate(NDBHtmlParser._dataTable).strip()
+        if data and self._elementsStack:
+            parts = self._dataParts.get(self._elementsStack[-1])
+            if parts is None:
+                self._dataParts[self._elementsStack[-1]] = [data]
+            else:
+                parts.append(data)
+
+
+class NDBHtmlExtractor(NDBHtmlParser):
+    """Class for single pass html extraction - only elements matching registered targets are kept, with their \
+    subtrees, as children of tree root in document order. Rest of document is skipped without making tags, \
+    while find_one and find_all work as in NDBHtmlParser."""
+    def __init__(self, targets: List[Tuple[str, dict]]=None):
+        """Default constructor
+
+        :param targets: list of (node name, node parameters) to extract, None name matches any node \
+        (default value = None)
+        :type targets: List[Tuple[str, dict]]
+        """
+        NDBHtmlParser.__init__(self)
+        self._targets = []
+        for name, params in targets or ():
+            self.register(name, params)
+
+    def register(self, name: str=None, params: dict=None) -> None:
+        """To register target extracted by next analyze - elements nested in already extracted one are part \
+        of its subtree
+
+        :param name: node name (default value = None)
+        :type name: str
+        :param params: node parameters, as in find_one (default value = None)
+        :type params: dict
+        :return: None
+        """
+        if params and not isinstance(params, dict):
+            raise TypeError("Params is not instance of dictionary class")
+        self._targets.append((name, params))
+
+    def analyze(self, data: str) -> None:
+        """Function for extract registered targets from html
+
+        :param data: html string
+        :type data: str
+        :return: None
+        """
+        self._tree = Tag(name="root")
+        self._elementsStack = []
+        self._dataParts = {}
+        self.feed(data)
+        self.close()
+
+        while self._elementsStack:
+            poped = self._elementsStack.pop()
+            if poped is not None:
+                if self._elementsStack and self._elementsStack[-1] is not None:
+                    self._elementsStack[-1].add_child(poped)
+                else:
+                    self._tree.add_child(poped)
+
+        self._join_data()
+        self._index()
+
+    def _is_target(self, tag: str, attrs: list) -> bool:
+        """Private method to check if start tag matches any registered target
+
+        :param tag: tag string
+        :param attrs: attributes list
+        :return: True/False if tag matches
+        """
+        for name, params in self._targets:
+            if name and name != tag:
+                continue
+            if not params:
+                return True
+            for key, value in attrs:
+                if key in params and params[key] == value:
+                    return True
+        return False
+
+    def handle_starttag(self, tag, attrs) -> None:
+        """Function to handle start tag - tag is made only inside extracted element or if it is target
+
+        :param tag: tag string
+        :param attrs: attributes dictionary
+        :return: None
+        """
+        stack = self._elementsStack
+        if (stack and stack[-1] is not None) or self._is_target(tag, attrs):
+            stack.append(Tag(tag, attrs=dict(attrs)))
+        else:
+            stack.append(None)
+
+    def handle_endtag(self, tag) -> None:
+        """Function to handle end tag and add extracted element to its parent or tree root
+
+        :param tag: tag ending
+        :return: None
+        """
         try:
-            self.__elementsStack[-1].data += data
+            poped = self._elementsStack.pop()
         except IndexError:
-            pass
+            return
+
+        if poped is not None:
+            self._join_data(poped)
+            if self._elementsStack and self._elementsStack[-1] is not None:
+                self._elementsStack[-1].add_child(poped)
+            else:
+                self._tree.add_child(poped)
+
+    def handle_data(self, data) -> None:
+        """Function to handle data in extracted tags
+
+        :param data: data inside tag
+        :return: None
+        """
+        if self._elementsStack and self._elementsStack[-1] is not None:
+            NDBHtmlParser.handle_data(self, data)
 
 
 class Tag(object):
@@ -289,15 +548,27 @@ class Tag(object):
         :return: tag as string
         :rtype: str
         """
-        result = "<" + str(self.name)
-
-        for key in self.attrs:
-            result += " " + str(key) + "=\"" + str(self.attrs[key]) + "\""
-        result += ">" + str(self.data)
-
-        for child in self.children:
-            result += str(child)
+        result = []
+        closing = []
+        stack = [iter((self,))]
+        while stack:
+            for tag in stack[-1]:
+                name = str(tag.name)
+                attrs = tag.attrs
+                if attrs:
+                    result.append("<" + name + "".join([" " + str(key) + "=\"" + str(attrs[key]) + "\""
+                                                        for key in attrs]) + ">" + str(tag.data))
+                else:
+                    result.append("<" + name + ">" + str(tag.data))
 
-        result += "</" + str(self.name) + ">"
+                if tag.children:
+                    closing.append("</" + name + ">")
+                    stack.append(iter(tag.children))
+                    break
+                result.append("</" + name + ">")
+            else:
+                stack.pop()
+                if closing:
+                    result.append(closing.pop())
 
-        return result
+        return "".join(result)
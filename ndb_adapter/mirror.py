@@ -0,0 +1,202 @@
+import calendar
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List
+import requests
+import ndb_adapter.report_parser as parser
+from ndb_adapter.ndb_download import DownloadHelper, DownloadType
+from ndb_adapter.ndb_session import NDBSession
+
+
+class Mirror(object):
+    """Class for incremental local copy of NDB download directories - only new or changed files are fetched
+
+    :cvar _manifestName: private name of file keeping listing state of last sync in every directory
+    :cvar _timeFormats: private listing modification time formats
+    """
+    _manifestName = '.manifest.json'
+    _timeFormats = ('%Y-%m-%d %H:%M', '%Y-%m-%d %H:%M:%S', '%d-%b-%Y %H:%M')
+
+    def __init__(self, root: str, max_workers: int=8, progress: Callable[[int, int, str, bool], None]=None):
+        """Default constructor
+
+        :param root: local mirror root directory, every download type is kept in its own subdirectory
+        :type root: str
+        :param max_workers: max number of files fetched at once (default value = 8)
+        :type max_workers: int
+        :param progress: callback called after every fetched file with (done, total, file_name, success) \
+        (default value = None)
+        :type progress: Callable[[int, int, str, bool], None]
+        """
+        self._root = os.path.abspath(root)
+        self._max_workers = max_workers
+        self._progress = progress
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> str:
+        """Gets local mirror root directory
+
+        :return: root directory
+        :rtype: str
+        """
+        return self._root
+
+    def directory(self, download_type: DownloadType) -> str:
+        """Gets local directory of download type e.g. root/na-mmcif
+
+        :param download_type: file download type
+        :type download_type: DownloadType
+        :return: local directory path
+        :rtype: str
+        """
+        return os.path.join(self._root, download_type.value.Url.rstrip('/').rpartition('/')[-1])
+
+    def sync(self, download_types: Iterable[DownloadType]=(DownloadType.Pdb, DownloadType.Cif,
+                                                           DownloadType.CifStructureFactors),
+             delete: bool=False) -> List[str]:
+        """To bring local copy up to date - new files and files which size or modification time in remote \
+        listing changed are fetched in parallel and written atomically
+
+        :param download_types: download types to mirror (default value = (DownloadType.Pdb, DownloadType.Cif, \
+        DownloadType.CifStructureFactors))
+        :type download_types: Iterable[DownloadType]
+        :param delete: tells if local files removed from server should be deleted (default value = False)
+        :type delete: bool
+        :return: list of fetched files paths
+        :rtype: List[str]
+        """
+        fetched = []
+        for download_type in download_types:
+            fetched.extend(self._sync_directory(download_type, delete))
+        return fetched
+
+    def _sync_directory(self, download_type: DownloadType, delete: bool) -> List[str]:
+        """Private method to sync single download type directory
+
+        :param download_type: file download type
+        :type download_type: DownloadType
+        :param delete: tells if local files removed from server should be deleted
+        :type delete: bool
+        :return: list of fetched files paths
+        :rtype: List[str]
+        """
+        url = download_type.value.Url
+        directory = self.directory(download_type)
+        os.makedirs(directory, exist_ok=True)
+
+        resp = NDBSession.get_default().get(url)
+        resp.raise_for_status()
+        remote = parser.parse_listing(resp.text)
+        manifest = self._load_manifest(directory)
+
+        changed = []
+        for name, (modified, size) in remote.items():
+            state = manifest.get(name)
+            path = os.path.join(directory, name)
+            mtime = Mirror._parse_time(modified)
+            if not state or state[:2] != [modified, size] or not os.path.isfile(path) or \
+                    os.path.getsize(path) != state[2] or (mtime is not None and os.path.getmtime(path) != mtime):
+                changed.append(name)
+
+        if delete:
+            for name in set(manifest) - set(remote):
+                path = os.path.join(directory, name)
+                if os.path.isfile(path):
+                    os.remove(path)
+                del manifest[name]
+
+        total = len(changed)
+        counter = {'done': 0}
+
+        def fetch(name: str) -> bool:
+            path = os.path.join(directory, name)
+            success = False
+            try:
+                Mirror._fetch_atomic(url + name, path, remote[name][0])
+                with self._lock:
+                    manifest[name] = list(remote[name]) + [os.path.getsize(path)]
+                success = True
+            except (FileNotFoundError, BufferError, requests.RequestException):
+                pass
+            finally:
+                if self._progress:
+                    with self._lock:
+                        counter['done'] += 1
+                        done = counter['done']
+                    self._progress(done, total, name, success)
+            return success
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            results = list(executor.map(fetch, changed))
+
+        self._save_manifest(directory, manifest)
+        return [os.path.join(directory, name) for name, success in zip(changed, results) if success]
+
+    @staticmethod
+    def _fetch_atomic(url: str, path: str, modified: str) -> None:
+        """Private method to download file to partial file and rename it to target path - interrupted download \
+        is resumed on next sync
+
+        :param url: file url
+        :type url: str
+        :param path: target file path
+        :type path: str
+        :param modified: modification time from listing, set on file if parsable
+        :type modified: str
+        :return: None
+        """
+        DownloadHelper.download_to_file(url, path, decompress=False)
+        mtime = Mirror._parse_time(modified)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+
+    @staticmethod
+    def _parse_time(modified: str) -> float:
+        """Private method to parse listing modification time to timestamp
+
+        :param modified: modification time from listing
+        :type modified: str
+        :return: timestamp or None if not parsable
+        :rtype: float
+        """
+        for time_format in Mirror._timeFormats:
+            try:
+                return calendar.timegm(time.strptime(modified, time_format))
+            except ValueError:
+                pass
+        return None
+
+    @staticmethod
+    def _load_manifest(directory: str) -> dict:
+        """Private method to load listing state of last sync
+
+        :param directory: local directory path
+        :type directory: str
+        :return: dictionary of file name -> [modification time, size, local size]
+        :rtype: dict
+        """
+        path = os.path.join(directory, Mirror._manifestName)
+        if not os.path.isfile(path):
+            return {}
+        with open(path, encoding='utf-8') as file:
+            return json.load(file)
+
+    @staticmethod
+    def _save_manifest(directory: str, manifest: dict) -> None:
+        """Private method to save listing state atomically
+
+        :param directory: local directory path
+        :type directory: str
+        :param manifest: dictionary of file name -> [modification time, size, local size]
+        :type manifest: dict
+        :return: None
+        """
+        path = os.path.join(directory, Mirror._manifestName)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, separators=(',', ':'))
+        os.replace(tmp_path, path)
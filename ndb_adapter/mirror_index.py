@@ -0,0 +1,143 @@
+import gzip
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable, List, Tuple
+import ndb_adapter.report_parser as parser
+from ndb_adapter.ndb_download import DownloadHelper, DownloadType
+from ndb_adapter.ndb_session import NDBSession
+
+
+class MirrorIndex(object):
+    """Class for local index of NDB download directories - listings are fetched once, kept in compressed file \
+    and refreshed after max age, so availability of files is checked without requests"""
+    def __init__(self, path: str, max_age: float=24 * 3600):
+        """Default constructor
+
+        :param path: index file path (gzip compressed json)
+        :type path: str
+        :param max_age: seconds after which directory listing is fetched again (default value = 86400)
+        :type max_age: float
+        """
+        self._path = path
+        self._max_age = max_age
+        self._lock = threading.Lock()
+        self._listings = {}
+
+        if os.path.isfile(path):
+            with gzip.open(path, 'rt', encoding='utf-8') as file:
+                self._listings = json.load(file)
+
+    @property
+    def path(self) -> str:
+        """Gets index file path
+
+        :return: index file path
+        :rtype: str
+        """
+        return self._path
+
+    def refresh(self, download_types: Iterable[DownloadType]=None, force: bool=False) -> None:
+        """To fetch directory listings which are not indexed or older than max age and save index
+
+        :param download_types: download types to refresh (default value = None) - all download types
+        :type download_types: Iterable[DownloadType]
+        :param force: tells if listings should be fetched even if not expired (default value = False)
+        :type force: bool
+        :return: None
+        """
+        download_types = list(DownloadType) if download_types is None else list(download_types)
+        changed = False
+        for download_type in download_types:
+            with self._lock:
+                listing = self._listings.get(download_type.name)
+            if force or not listing or time.time() - listing['fetched'] > self._max_age:
+                self._fetch(download_type)
+                changed = True
+
+        if changed:
+            self.save()
+
+    def _fetch(self, download_type: DownloadType) -> None:
+        """Private method to fetch and parse directory listing of download type
+
+        :param download_type: file download type
+        :type download_type: DownloadType
+        :return: None
+        """
+        resp = NDBSession.get_default().get(download_type.value.Url)
+        resp.raise_for_status()
+        files = parser.parse_listing(resp.text)
+        with self._lock:
+            self._listings[download_type.name] = {'fetched': time.time(), 'files': files}
+
+    def save(self) -> None:
+        """To write index to file atomically
+
+        :return: None
+        """
+        directory = os.path.dirname(os.path.abspath(self._path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.open(raw, 'wt', encoding='utf-8') as file:
+                with self._lock:
+                    json.dump(self._listings, file, separators=(',', ':'))
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def files(self, download_type: DownloadType) -> Dict[str, Tuple[str, str]]:
+        """Gets indexed files of download type, fetches listing if needed
+
+        :param download_type: file download type
+        :type download_type: DownloadType
+        :return: dictionary of file name -> (modification time, size) as shown in listing
+        :rtype: Dict[str, Tuple[str, str]]
+        """
+        self.refresh([download_type])
+        with self._lock:
+            return self._listings[download_type.name]['files']
+
+    def available(self, structure_id: str, download_type: DownloadType=DownloadType.Pdb) -> bool:
+        """To check if file of structure is available on server
+
+        :param structure_id: structure NDB ID or PDB ID e.g. 4Z6C
+        :type structure_id: str
+        :param download_type: file download type (default value is DownloadType.PDB)
+        :type download_type: DownloadType
+        :return: True/False if file is available
+        :rtype: bool
+        """
+        files = self.files(download_type)
+        for name in DownloadHelper.candidate_names(structure_id, download_type):
+            if name in files:
+                return True
+        return False
+
+    def filter(self, structure_ids: Iterable[str], download_type: DownloadType=DownloadType.Pdb) -> List[str]:
+        """To filter structures which files are available on server, keeping order
+
+        :param structure_ids: structures NDB IDs or PDB IDs e.g. 4Z6C
+        :type structure_ids: Iterable[str]
+        :param download_type: file download type (default value is DownloadType.PDB)
+        :type download_type: DownloadType
+        :return: list of available structures ids
+        :rtype: List[str]
+        """
+        return [structure_id for structure_id in structure_ids if self.available(structure_id, download_type)]
+
+    def attach(self, download_types: Iterable[DownloadType]=None) -> None:
+        """To load indexed listings into DownloadHelper, so downloads of missing files fail without requests \
+        and file names are resolved from index
+
+        :param download_types: download types to attach (default value = None) - all download types
+        :type download_types: Iterable[DownloadType]
+        :return: None
+        """
+        download_types = list(DownloadType) if download_types is None else list(download_types)
+        for download_type in download_types:
+            DownloadHelper.load_listing(download_type, self.files(download_type).keys())
@@ -1,16 +1,136 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, Tuple
 import requests
 import ndb_adapter.report_parser as parser
 from ndb_adapter.advanced_search_options import AdvancedSearchOptions
 from ndb_adapter.dna_search_options import DnaSearchOptions
 from ndb_adapter.ndb_base import NDBBase
 from ndb_adapter.ndb_download import DownloadHelper, DownloadType
+from ndb_adapter.ndb_session import NDBSession
+from ndb_adapter.response_cache import ResponseCache
 from ndb_adapter.rna_search_options import RnaSearchOptions
+from ndb_adapter.search_options import SearchOptions
+from ndb_adapter.search_report import AdvancedReport, SimpleReport
 from ndb_adapter.search_result import SimpleResult, AdvancedResult
 from ndb_adapter.summary_result import SummaryResult
 
 
+class _PageSizer(object):
+    """Helper class tuning number of results requested per gallery page from response latency - pages grow while \
+    they are answered faster than target latency, so request overhead is spread over more results, and shrink \
+    when they are slower, so pages in flight keep flowing
+
+    :cvar _minSize: private smallest tuned page size
+    :cvar _maxSize: private largest tuned page size
+    :cvar _startSize: private first tuned page size
+    :cvar _targetLatency: private seconds of page response aimed at
+    """
+    _minSize = 10
+    _maxSize = 2000
+    _startSize = 100
+    _targetLatency = 2.0
+
+    def __init__(self, size: int=None):
+        """Default constructor
+
+        :param size: fixed page size (default value = None) - tuned page size
+        :type size: int
+        """
+        self._fixed = size is not None
+        self._size = size if self._fixed else _PageSizer._startSize
+        self._max = _PageSizer._maxSize
+
+    @property
+    def size(self) -> int:
+        """Gets number of results to request in next page
+
+        :return: page size
+        :rtype: int
+        """
+        return self._size
+
+    def update(self, received: int, elapsed: float) -> None:
+        """To tune page size after page response - size is scaled by ratio of target latency to latency per \
+        result, at most twice up or down at once
+
+        :param received: number of results in page
+        :type received: int
+        :param elapsed: seconds page took
+        :type elapsed: float
+        :return: None
+        """
+        if self._fixed or received < 1:
+            return
+
+        wanted = received * _PageSizer._targetLatency / max(elapsed, 1e-3)
+        wanted = min(max(wanted, self._size / 2), self._size * 2)
+        self._size = int(min(max(wanted, _PageSizer._minSize), self._max))
+
+    def cap(self, size: int) -> None:
+        """To limit page size to number of results server returns at most
+
+        :param size: max page size
+        :type size: int
+        :return: None
+        """
+        self._max = min(self._max, max(size, 1))
+        self._size = min(self._size, self._max)
+
+
 class NDB(NDBBase):
-    """Main class for search in NDB - all methods are static"""
+    """Main class for search in NDB - all methods are static
+
+    :cvar _cache: private search response cache, None if disabled
+    :cvar _streamChunkSize: private size in bytes of chunks read from streamed response
+    """
+    _cache = None
+    _streamChunkSize = 16 * 1024
+
+    @staticmethod
+    def set_cache(cache: ResponseCache) -> None:
+        """Sets response cache used by searches and summary, None disables caching
+
+        :param cache: response cache e.g. MemoryResponseCache or SQLiteResponseCache
+        :type cache: ResponseCache
+        :return: None
+        """
+        NDB._cache = cache
+
+    @staticmethod
+    def get_cache() -> ResponseCache:
+        """Gets response cache used by searches and summary
+
+        :return: response cache or None
+        :rtype: ResponseCache
+        """
+        return NDB._cache
+
+    @staticmethod
+    def _cached(url: str, data: dict, search: Callable[[], object]) -> object:
+        """Private method to get parsed result from cache or run search and cache its result
+
+        :param url: request url
+        :type url: str
+        :param data: request form data
+        :type data: dict
+        :param search: function making request and parsing response
+        :type search: Callable[[], object]
+        :return: parsed result
+        """
+        cache = NDB._cache
+        if cache is None:
+            return search()
+
+        key = ResponseCache.make_key(url, data)
+        result = cache.get(key)
+        if result is None:
+            result = search()
+            cache.set(key, result)
+        return result
+
     @staticmethod
     def advanced_search(options: AdvancedSearchOptions= None) -> AdvancedResult:
         """Advanced search in NDB, if in options "stats= True" returns also statistics - works only in some \
@@ -25,7 +145,8 @@ class NDB(NDBBase):
         if not options:
             options = AdvancedSearchOptions()
 
-        with requests.session() as session:
+        def search() -> AdvancedResult:
+            session = NDBSession.get_default()
             text_stats = ""
             if options.get_statistics():
                 resp = session.post(NDBBase._advancedUrl, data=options.get(stats=True))
@@ -33,8 +154,30 @@ class NDB(NDBBase):
 
             resp = session.post(NDBBase._advancedUrl, data=options.get())
             text = resp.text
-            report = parser.parse_advanced_search_report(text, text_stats, options.get_report_type())
-            return report
+            return parser.parse_advanced_search_report(text, text_stats, options.get_report_type())
+
+        return NDB._cached(NDBBase._advancedUrl, options.get(stats=options.get_statistics()), search)
+
+    @staticmethod
+    def iter_advanced_search(options: AdvancedSearchOptions=None) -> Iterator[AdvancedReport]:
+        """Advanced search in NDB yielding reports while response is downloaded - memory usage doesn't depend \
+        on result size. Statistics and response cache are not used.
+
+        :param options: options for advanced search (default value = None) - clear AdvancedSearchOptions()
+        :type options: AdvancedSearchOptions
+        :return: iterator of advanced reports
+        :rtype: Iterator[AdvancedReport]
+        :raise requests.HTTPError: when server responds with error status
+        """
+        if not options:
+            options = AdvancedSearchOptions()
+
+        with NDBSession.get_default().post(NDBBase._advancedUrl, data=options.get(), stream=True) as resp:
+            resp.raise_for_status()
+            if resp.encoding is None:
+                resp.encoding = 'utf-8'
+            lines = resp.iter_lines(chunk_size=NDB._streamChunkSize, decode_unicode=True)
+            yield from parser.iter_advanced_search_report(lines, options.get_report_type())
 
     @staticmethod
     def dna_search(options: DnaSearchOptions= None) -> SimpleResult:
@@ -48,11 +191,11 @@ class NDB(NDBBase):
         if not options:
             options = DnaSearchOptions()
 
-        with requests.session() as session:
-            resp = session.post(NDBBase._dnaUrl, data=options.get())
-            text = resp.text
-            report = parser.parse_search_report(text)
-            return report
+        def search() -> SimpleResult:
+            resp = NDBSession.get_default().post(NDBBase._dnaUrl, data=options.get())
+            return parser.parse_search_report(resp.text)
+
+        return NDB._cached(NDBBase._dnaUrl, options.get(), search)
 
     @staticmethod
     def rna_search(options: RnaSearchOptions= None) -> SimpleResult:
@@ -66,11 +209,129 @@ class NDB(NDBBase):
         if not options:
             options = RnaSearchOptions()
 
-        with requests.session() as session:
-            resp = session.post(NDBBase._rnaUrl, data=options.get())
-            text = resp.text
-            report = parser.parse_search_report(text)
-            return report
+        def search() -> SimpleResult:
+            resp = NDBSession.get_default().post(NDBBase._rnaUrl, data=options.get())
+            return parser.parse_search_report(resp.text)
+
+        return NDB._cached(NDBBase._rnaUrl, options.get(), search)
+
+    @staticmethod
+    def iter_dna_search(options: DnaSearchOptions=None, page_size: int=None,
+                        max_workers: int=4) -> Iterator[SimpleReport]:
+        """Dna only search in NDB yielding reports of all result pages, starting at options start. Several pages \
+        are requested and their result files downloaded at once, reports are yielded in page order.
+
+        :param options: options for dna search (default value = None) - clear DnaSearchOptions()
+        :type options: DnaSearchOptions
+        :param page_size: number of results requested per page (default value = None) - tuned from response latency
+        :type page_size: int
+        :param max_workers: max number of pages in flight (default value = 4)
+        :type max_workers: int
+        :return: iterator of simple reports
+        :rtype: Iterator[SimpleReport]
+        """
+        if not options:
+            options = DnaSearchOptions()
+
+        return NDB._iter_gallery(NDBBase._dnaUrl, options, page_size, max_workers)
+
+    @staticmethod
+    def iter_rna_search(options: RnaSearchOptions=None, page_size: int=None,
+                        max_workers: int=4) -> Iterator[SimpleReport]:
+        """Rna only search in NDB yielding reports of all result pages, starting at options start. Several pages \
+        are requested and their result files downloaded at once, reports are yielded in page order.
+
+        :param options: options for rna search (default value = None) - clear RnaSearchOptions()
+        :type options: RnaSearchOptions
+        :param page_size: number of results requested per page (default value = None) - tuned from response latency
+        :type page_size: int
+        :param max_workers: max number of pages in flight (default value = 4)
+        :type max_workers: int
+        :return: iterator of simple reports
+        :rtype: Iterator[SimpleReport]
+        """
+        if not options:
+            options = RnaSearchOptions()
+
+        return NDB._iter_gallery(NDBBase._rnaUrl, options, page_size, max_workers)
+
+    @staticmethod
+    def _gallery_page(url: str, data: dict) -> Tuple[SimpleResult, float]:
+        """Private method to request single gallery page and parse it with its result file
+
+        :param url: gallery url
+        :type url: str
+        :param data: request form data with start and limit of page
+        :type data: dict
+        :return: search simple result of page and seconds it took
+        :rtype: Tuple[SimpleResult, float]
+        """
+        def search() -> SimpleResult:
+            resp = NDBSession.get_default().post(url, data=data)
+            return parser.parse_search_report(resp.text)
+
+        begin = time.perf_counter()
+        result = NDB._cached(url, data, search)
+        return result, time.perf_counter() - begin
+
+    @staticmethod
+    def _iter_gallery(url: str, options: SearchOptions, page_size: int,
+                      max_workers: int) -> Iterator[SimpleReport]:
+        """Private generator of reports of consecutive gallery pages - keeps max workers pages in flight, \
+        first ones are requested before count of results is known. Page shorter than requested, before count \
+        is reached, is completed with next request, so server limit of page size doesn't skip results.
+
+        :param url: gallery url
+        :type url: str
+        :param options: search options, start is index of first page
+        :type options: SearchOptions
+        :param page_size: number of results requested per page, None to tune it from response latency
+        :type page_size: int
+        :param max_workers: max number of pages in flight
+        :type max_workers: int
+        :return: iterator of simple reports
+        :rtype: Iterator[SimpleReport]
+        """
+        if (page_size is not None and page_size < 1) or max_workers < 1:
+            raise AttributeError("Page size and max workers must be positive")
+
+        sizer = _PageSizer(page_size) if page_size else _PageSizer()
+        data = options.get()
+        next_start = options.get_start()
+        count = None
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        def submit(start: int, size: int) -> tuple:
+            page_data = dict(data, start=str(start), limit=str(size))
+            return executor.submit(NDB._gallery_page, url, page_data), start, size
+
+        try:
+            while True:
+                while len(pending) < max_workers and (count is None or next_start < count):
+                    size = sizer.size if count is None else min(sizer.size, count - next_start)
+                    pending.append(submit(next_start, size))
+                    next_start += size
+                if not pending:
+                    break
+
+                future, start, size = pending.popleft()
+                result, elapsed = future.result()
+                received = len(result.report)
+                if count is None and result.count:
+                    count = result.count
+                if not received:
+                    break
+
+                sizer.update(received, elapsed)
+                if received < size and count is not None and start + received < count:
+                    sizer.cap(received)
+                    pending.appendleft(submit(start + received, size - received))
+                yield from result.report
+        finally:
+            for future, _, _ in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
 
     @staticmethod
     def summary(structure_id: str) -> SummaryResult:
@@ -85,15 +346,163 @@ class NDB(NDBBase):
             'searchTarget': structure_id
         }
 
-        with requests.session() as session:
-            resp = session.post(NDBBase._summaryUrl, data=params)
-            text = resp.text
-            report = parser.parse_summary(text)
-            return report
+        def search() -> SummaryResult:
+            return NDB._summary_parsed(structure_id)
+
+        return NDB._cached(NDBBase._summaryUrl, params, search)
+
+    @staticmethod
+    def summaries(structure_ids: Iterable[str], max_workers: int=8, processes: int=0,
+                  progress: Callable[[int, int, str, bool], None]=None) -> Dict[str, SummaryResult]:
+        """Summary search in NDB of many structures - pages are fetched concurrently, structures which pages \
+        couldn't be fetched (connection error or error status) are left out
+
+        :param structure_ids: structures NDB IDs or PDB IDs e.g. 4Z6C, repeated ids are fetched once
+        :type structure_ids: Iterable[str]
+        :param max_workers: max number of pages fetched at once (default value = 8)
+        :type max_workers: int
+        :param processes: number of parsing processes, None for number of processors (default value = 0) - \
+        pages are parsed in fetching threads
+        :type processes: int
+        :param progress: callback called after every structure with (done, total, structure_id, success) \
+        (default value = None)
+        :type progress: Callable[[int, int, str, bool], None]
+        :return: dictionary of structure id -> search summary result, in order of given ids
+        :rtype: Dict[str, SummaryResult]
+        """
+        structure_ids = list(dict.fromkeys(structure_ids))
+        results = dict(NDB.iter_summaries(structure_ids, max_workers, processes, progress))
+        return {structure_id: results[structure_id] for structure_id in structure_ids if structure_id in results}
+
+    @staticmethod
+    def iter_summaries(structure_ids: Iterable[str], max_workers: int=8, processes: int=0,
+                       progress: Callable[[int, int, str, bool], None]=None) -> Iterator[Tuple[str, SummaryResult]]:
+        """Summary search in NDB of many structures yielding results as they are parsed - cached results first, \
+        then pages fetched concurrently. Structures which pages couldn't be fetched (connection error or error \
+        status) are left out.
+
+        :param structure_ids: structures NDB IDs or PDB IDs e.g. 4Z6C, repeated ids are fetched once
+        :type structure_ids: Iterable[str]
+        :param max_workers: max number of pages fetched at once (default value = 8)
+        :type max_workers: int
+        :param processes: number of parsing processes, None for number of processors (default value = 0) - \
+        pages are parsed in fetching threads. Pool is never larger than number of pages to parse.
+        :type processes: int
+        :param progress: callback called after every structure with (done, total, structure_id, success) \
+        (default value = None)
+        :type progress: Callable[[int, int, str, bool], None]
+        :return: iterator of (structure id, search summary result)
+        :rtype: Iterator[Tuple[str, SummaryResult]]
+        """
+        if max_workers < 1 or (processes is not None and processes < 0):
+            raise AttributeError("Max workers must be positive and processes not negative")
+
+        structure_ids = list(dict.fromkeys(structure_ids))
+        total = len(structure_ids)
+        state = {'done': 0}
+
+        def report(structure_id: str, success: bool) -> None:
+            if progress:
+                state['done'] += 1
+                progress(state['done'], total, structure_id, success)
+
+        cache = NDB._cache
+        missing = []
+        for structure_id in structure_ids:
+            result = cache.get(NDB._summary_key(structure_id)) if cache is not None else None
+            if result is None:
+                missing.append(structure_id)
+            else:
+                report(structure_id, True)
+                yield structure_id, result
+        if not missing:
+            return
+
+        pool = None
+        if processes != 0:
+            pool = ProcessPoolExecutor(max_workers=min(processes or os.cpu_count() or 1, len(missing)))
+            pool.submit(int).result()  # starts workers before fetching threads, forking them could deadlock
+        threads = ThreadPoolExecutor(max_workers=min(max_workers, len(missing)))
+        fetches = {}
+        parses = {}
+        try:
+            for structure_id in missing:
+                fetch = NDB._summary_page if pool else NDB._summary_parsed
+                fetches[threads.submit(fetch, structure_id, True)] = structure_id
+
+            while fetches or parses:
+                done, _ = wait(list(fetches) + list(parses), return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in fetches:
+                        structure_id = fetches.pop(future)
+                        try:
+                            result = future.result()
+                        except requests.RequestException:
+                            report(structure_id, False)
+                            continue
+                        if pool:
+                            parses[pool.submit(parser.parse_summary, result)] = structure_id
+                            continue
+                    else:
+                        structure_id = parses.pop(future)
+                        result = future.result()
+
+                    if cache is not None:
+                        cache.set(NDB._summary_key(structure_id), result)
+                    report(structure_id, True)
+                    yield structure_id, result
+        finally:
+            for future in list(fetches) + list(parses):
+                future.cancel()
+            threads.shutdown(wait=False)
+            if pool:
+                pool.shutdown(wait=False)
+
+    @staticmethod
+    def _summary_key(structure_id: str) -> str:
+        """Private method to get response cache key of summary search
+
+        :param structure_id: structure NDB ID or PDB ID e.g. 4Z6C
+        :type structure_id: str
+        :return: cache key
+        :rtype: str
+        """
+        return ResponseCache.make_key(NDBBase._summaryUrl, {'searchTarget': structure_id})
+
+    @staticmethod
+    def _summary_page(structure_id: str, check: bool=False) -> str:
+        """Private method to fetch summary page html
+
+        :param structure_id: structure NDB ID or PDB ID e.g. 4Z6C
+        :type structure_id: str
+        :param check: tells if error status should raise (default value = False) - page is returned as it is
+        :type check: bool
+        :return: summary page html
+        :rtype: str
+        :raise requests.HTTPError: when checked and server responds with error status
+        """
+        resp = NDBSession.get_default().post(NDBBase._summaryUrl, data={'searchTarget': structure_id})
+        if check:
+            resp.raise_for_status()
+        return resp.text
+
+    @staticmethod
+    def _summary_parsed(structure_id: str, check: bool=False) -> SummaryResult:
+        """Private method to fetch and parse summary page
+
+        :param structure_id: structure NDB ID or PDB ID e.g. 4Z6C
+        :type structure_id: str
+        :param check: tells if error status should raise (default value = False)
+        :type check: bool
+        :return: search summary result
+        :rtype: SummaryResult
+        :raise requests.HTTPError: when checked and server responds with error status
+        """
+        return parser.parse_summary(NDB._summary_page(structure_id, check))
 
     @staticmethod
     def download(structure_id: str, download_type: DownloadType=DownloadType.Pdb,
-                 save: bool=False, target_dir: str='') -> str:
+                 save: bool=False, target_dir: str='', raw: bool=False, compressed: bool=False) -> str:
         """Download PDB from NDB
 
         :param download_type: file download type (default value is DownloadType.PDB)
@@ -102,9 +511,14 @@ class NDB(NDBBase):
         :type target_dir: str
         :param save: tells if file should be saved or not (default value = False)
         :type save: bool
+        :param raw: tells if file should be returned as bytes without decoding (default value = False)
+        :type raw: bool
+        :param compressed: tells if gz compressed files should be returned or saved as they are on server - \
+        implies raw (default value = False)
+        :type compressed: bool
         :param structure_id: structure NDB ID or PDB ID e.g. 4Z6C
         :type structure_id: str
-        :return: string or None
+        :return: string, bytes or None
         :rtype: str
         """
-        return DownloadHelper.download(structure_id, download_type, save, target_dir)
+        return DownloadHelper.download(structure_id, download_type, save, target_dir, raw, compressed)
@@ -1,11 +1,18 @@
 import os
+import threading
+import time
 import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from enum import Enum
+from functools import partial
 from io import BytesIO
+from typing import BinaryIO, Callable, Iterator, Iterable, List, Tuple, Union
 
 import requests
 
 from ndb_adapter.ndb_base import NDBBase
+from ndb_adapter.ndb_session import NDBSession
 
 
 class _Pdb(NDBBase):
@@ -115,11 +122,142 @@ class DownloadType(Enum):
     XmlHeader = _XmlHeader
 
 
+class _NameResolver(object):
+    """Helper class remembering which file name each structure uses in download directory"""
+    def __init__(self):
+        """Default constructor"""
+        self._names = {}
+        self._listings = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def names(download_type: DownloadType, structure_id: str) -> List[str]:
+        """To get possible file names of structure without extension, most common first
+
+        :param download_type: file download type
+        :type download_type: DownloadType
+        :param structure_id: structure NDB ID or PDB ID e.g. 4Z6C
+        :type structure_id: str
+        :return: list of file names
+        :rtype: List[str]
+        """
+        d_type = download_type.value
+        names = [d_type.PreName + structure_id.lower() + d_type.PostName]
+        if download_type is DownloadType.Pdb:
+            names.append(structure_id.lower() + d_type.PostName)
+        return names
+
+    def candidates(self, download_type: DownloadType, structure_id: str) -> List[str]:
+        """To get file names worth requesting - remembered name or names present in directory listing if loaded
+
+        :param download_type: file download type
+        :type download_type: DownloadType
+        :param structure_id: structure NDB ID or PDB ID e.g. 4Z6C
+        :type structure_id: str
+        :return: list of file names, empty if file is not present on server
+        :rtype: List[str]
+        """
+        d_type = download_type.value
+        with self._lock:
+            known = self._names.get((d_type.Url, structure_id.lower()))
+            if known:
+                return [known]
+
+            names = _NameResolver.names(download_type, structure_id)
+            listing = self._listings.get(d_type.Url)
+            if listing is not None:
+                names = [name for name in names if name + d_type.UrlExt in listing]
+            return names
+
+    def count(self, download_type: DownloadType, name: str) -> int:
+        """To count numbered files of name present in directory listing, numbered from 1 up to first missing one
+
+        :param download_type: file download type
+        :type download_type: DownloadType
+        :param name: file name without extension and number
+        :type name: str
+        :return: number of files or None if listing is not loaded
+        :rtype: int
+        """
+        d_type = download_type.value
+        with self._lock:
+            listing = self._listings.get(d_type.Url)
+        if listing is None:
+            return None
+
+        count = 0
+        while name + d_type.UrlExt + str(count + 1) in listing:
+            count += 1
+        return count
+
+    def remember(self, download_type: DownloadType, structure_id: str, name: str) -> None:
+        """To remember file name of structure
+
+        :param download_type: file download type
+        :type download_type: DownloadType
+        :param structure_id: structure NDB ID or PDB ID e.g. 4Z6C
+        :type structure_id: str
+        :param name: file name without extension
+        :type name: str
+        :return: None
+        """
+        with self._lock:
+            self._names[(download_type.value.Url, structure_id.lower())] = name
+
+    def forget(self, download_type: DownloadType, structure_id: str) -> None:
+        """To forget remembered file name of structure
+
+        :param download_type: file download type
+        :type download_type: DownloadType
+        :param structure_id: structure NDB ID or PDB ID e.g. 4Z6C
+        :type structure_id: str
+        :return: None
+        """
+        with self._lock:
+            self._names.pop((download_type.value.Url, structure_id.lower()), None)
+
+    def load_listing(self, download_type: DownloadType, file_names: Iterable[str]) -> None:
+        """To load directory listing of download type - None file names unloads it
+
+        :param download_type: file download type
+        :type download_type: DownloadType
+        :param file_names: file names present in directory, with extensions
+        :type file_names: Iterable[str]
+        :return: None
+        """
+        with self._lock:
+            if file_names is None:
+                self._listings.pop(download_type.value.Url, None)
+            else:
+                self._listings[download_type.value.Url] = frozenset(file_names)
+
+
 class DownloadHelper(object):
-    """Helper class for downloading form NDB"""
+    """Helper class for downloading form NDB
+
+    :cvar _cache: private persistent download cache, None if disabled
+    :cvar _resolver: private file names resolver
+    :cvar _assemblyBatch: private number of biological assembly files probed at once in first batch
+    :cvar _assemblyBatchMax: private max number of biological assembly files probed at once
+    :cvar _resumeAttempts: private max number of attempts of interrupted transfer, each continues from last byte
+    :cvar _resumeBackoff: private backoff factor in seconds between attempts of interrupted transfer
+    :cvar _validatorExt: private extension of file keeping validator (ETag or Last-Modified) of .part file
+    :cvar _partLocks: private locks of .part files being received, with number of their users
+    :cvar _partLocksLock: private lock guarding part locks
+    """
+    _cache = None
+    _resolver = _NameResolver()
+    _assemblyBatch = 4
+    _assemblyBatchMax = 16
+    _resumeAttempts = 5
+    _resumeBackoff = 0.5
+    _validatorExt = '.validator'
+    _partLocks = {}
+    _partLocksLock = threading.Lock()
+
     @staticmethod
     def download(structure_id: str, download_type: DownloadType = DownloadType.Pdb,
-                 save: bool = False, target_dir: str = '') -> str:
+                 save: bool = False, target_dir: str = '', raw: bool = False, compressed: bool = False) -> str:
         """Download PDB from NDB
 
         :param download_type: file download type (default value is DownloadType.PDB)
@@ -128,9 +266,14 @@ class DownloadHelper(object):
         :type target_dir: str
         :param save: tells if file should be saved or not (default value = False)
         :type save: bool
+        :param raw: tells if file should be returned as bytes without decoding (default value = False)
+        :type raw: bool
+        :param compressed: tells if gz compressed files should be returned or saved as they are on server - \
+        implies raw (default value = False)
+        :type compressed: bool
         :param structure_id: structure NDB ID or PDB ID e.g. 4Z6C
         :type structure_id: str
-        :return: string or None
+        :return: string, bytes or None
         :rtype: str
         :raise AttributeError: when structure id is empty
         :raise FileNotFoundError: when file is not present on server
@@ -139,89 +282,489 @@ class DownloadHelper(object):
             raise AttributeError("structure id is empty")
 
         d_type = download_type.value
-        file_name = d_type.PreName + structure_id.lower() + d_type.PostName
+        decompress = DownloadHelper.is_compressed(download_type) and not compressed
+        ext = d_type.UrlExt if compressed else d_type.Ext
+        raw = raw or compressed
+
+        target = DownloadHelper._target_dir(target_dir) if save else ''
 
         if d_type is not DownloadType.PdbBioAssembly.value:
-            try:
-                proper_url = d_type.Url + file_name + d_type.UrlExt
-                file_text = DownloadHelper._download_prepare(proper_url)
-            except FileNotFoundError as error:
-                if d_type is DownloadType.Pdb.value:
-                    file_name = structure_id.lower() + d_type.PostName
-                    proper_url = d_type.Url + file_name + d_type.UrlExt
-                    file_text = DownloadHelper._download_prepare(proper_url)
-                    pass
-                else:
-                    raise error
+            def fetch(name: str) -> str:
+                proper_url = d_type.Url + name + d_type.UrlExt
+                cache_key = (download_type, structure_id)
+                if save:
+                    DownloadHelper._save(proper_url, target + name + ext, decompress, cache_key=cache_key)
+                    return None
+                return DownloadHelper._download_prepare(proper_url, decompress, cache_key=cache_key, raw=raw)
+
+            # candidates are tried one by one, next only after 404, so exactly one file is downloaded or saved
+            resolver = DownloadHelper._resolver
+            names = resolver.candidates(download_type, structure_id)
+            tried = set()
+            while names:
+                name = names[0]
+                tried.add(name)
+                try:
+                    file = fetch(name)
+                except FileNotFoundError:
+                    resolver.forget(download_type, structure_id)
+                    names = [name for name in resolver.candidates(download_type, structure_id) if name not in tried]
+                    continue
 
-            if save:
-                target = target_dir if target_dir else os.getcwd()
-                target = target + os.path.sep if target[-1] != os.path.sep else target
-                with open(target + file_name + d_type.Ext, 'w') as file:
-                    file.write(file_text)
+                resolver.remember(download_type, structure_id, name)
+                return file
 
-                return None
-            return file_text
+            raise FileNotFoundError("No file on server")
         else:
-            results = []
-            i = 1
-            while True:
-                try:
-                    proper_url = d_type.Url + file_name + d_type.UrlExt + str(i)
-                    file_text = DownloadHelper._download_prepare(proper_url, decompress=False)
-                    results.append(file_text)
-                    i += 1
-                except FileNotFoundError:
+            return DownloadHelper._download_assemblies(structure_id, download_type, save, target, decompress, ext, raw)
+
+    @staticmethod
+    def _download_assemblies(structure_id: str, download_type: DownloadType, save: bool, target: str,
+                             decompress: bool, ext: str, raw: bool) -> List[str]:
+        """To download biological assembly files - numbered from 1 up to first missing one. Numbers are probed \
+        concurrently in speculative batches, each probe fetches file into memory. Only files before first missing \
+        number are saved or returned. Number of files is taken from directory listing if it is loaded, then only \
+        present files are requested.
+
+        :param structure_id: structure NDB ID or PDB ID e.g. 4Z6C
+        :type structure_id: str
+        :param download_type: file download type
+        :type download_type: DownloadType
+        :param save: tells if files should be saved or not
+        :type save: bool
+        :param target: target directory path ending with separator
+        :type target: str
+        :param decompress: tells if decompress files
+        :type decompress: bool
+        :param ext: saved files extension
+        :type ext: str
+        :param raw: tells if return bytes without decoding
+        :type raw: bool
+        :return: list of strings or None
+        :rtype: List[str]
+        """
+        d_type = download_type.value
+        file_name = d_type.PreName + structure_id.lower() + d_type.PostName
+        count = DownloadHelper._resolver.count(download_type, file_name)
+
+        def fetch(i: int) -> bytes:
+            proper_url = d_type.Url + file_name + d_type.UrlExt + str(i)
+            try:
+                with DownloadHelper._open_chunks(proper_url, (download_type, structure_id + '_' + str(i))) as chunks:
+                    return b''.join(chunks)
+            except FileNotFoundError:
+                return None
+
+        files = []
+        start = 1
+        batch = count if count is not None else DownloadHelper._assemblyBatch
+        with ThreadPoolExecutor(max_workers=DownloadHelper._assemblyBatchMax) as executor:
+            while batch:
+                found = list(executor.map(fetch, range(start, start + batch)))
+                gap = next((k for k, file in enumerate(found) if file is None), None)
+                files.extend(found[:gap])
+                if gap is not None or count is not None:
                     break
 
+                start += batch
+                batch = min(batch * 2, DownloadHelper._assemblyBatchMax)
+
+        results = []
+        for i, file in enumerate(files, 1):
+            file = DownloadHelper._prepare(file, decompress, raw=raw or save)
             if save:
-                i = 1
-                target = target_dir if target_dir else os.getcwd()
-                target = target + os.path.sep if target[-1] != os.path.sep else target
-                for text in results:
-                    with open(target + file_name + d_type.Ext + str(i), 'w') as file:
-                        file.write(text)
-                    i += 1
-                return None
+                with open(target + file_name + ext + str(i), 'wb') as saved:
+                    saved.write(file)
+            else:
+                results.append(file)
+
+        if save:
+            return None
+
+        return results
+
+    @staticmethod
+    def load_listing(download_type: DownloadType, file_names: Iterable[str]) -> None:
+        """Loads directory listing of download type, so file names are resolved without requests and files \
+        missing from listing are not requested at all. None file names unloads listing
+
+        :param download_type: file download type
+        :type download_type: DownloadType
+        :param file_names: file names present in directory, with extensions e.g. pdb5dg7.ent.gz
+        :type file_names: Iterable[str]
+        :return: None
+        """
+        DownloadHelper._resolver.load_listing(download_type, file_names)
+
+    @staticmethod
+    def candidate_names(structure_id: str, download_type: DownloadType=DownloadType.Pdb) -> List[str]:
+        """To get possible names of structure file on server, with extensions, most common first. Biological \
+        assemblies are named by their first file e.g. 5dg7.pdb1
+
+        :param structure_id: structure NDB ID or PDB ID e.g. 4Z6C
+        :type structure_id: str
+        :param download_type: file download type (default value is DownloadType.PDB)
+        :type download_type: DownloadType
+        :return: list of file names
+        :rtype: List[str]
+        """
+        url_ext = download_type.value.UrlExt
+        if download_type is DownloadType.PdbBioAssembly:
+            url_ext += '1'
+        return [name + url_ext for name in _NameResolver.names(download_type, structure_id)]
+
+    @staticmethod
+    def is_compressed(download_type: DownloadType) -> bool:
+        """To check if files of download type are gz compressed on server
+
+        :param download_type: file download type
+        :type download_type: DownloadType
+        :return: True/False if files are compressed
+        :rtype: bool
+        """
+        return download_type.value.UrlExt.endswith('.gz')
+
+    @staticmethod
+    def _target_dir(target_dir: str) -> str:
+        """To get target directory path ending with separator
+
+        :param target_dir: target directory, current dir if empty
+        :type target_dir: str
+        :return: target directory path
+        :rtype: str
+        """
+        target = target_dir if target_dir else os.getcwd()
+        return target + os.path.sep if target[-1] != os.path.sep else target
+
+    @staticmethod
+    def set_cache(cache: 'DownloadCache') -> None:
+        """Sets persistent cache used by download, None disables caching
 
-            return results
+        :param cache: download cache
+        :type cache: DownloadCache
+        :return: None
+        """
+        DownloadHelper._cache = cache
 
     @staticmethod
-    def _download_prepare(url: str, decompress: bool=True) -> str:
+    def get_cache() -> 'DownloadCache':
+        """Gets persistent cache used by download
+
+        :return: download cache or None
+        :rtype: DownloadCache
+        """
+        return DownloadHelper._cache
+
+    @staticmethod
+    @contextmanager
+    def _open_chunks(url: str, cache_key: Tuple[DownloadType, str]=None,
+                     chunk_size: int=64 * 1024) -> Iterator[Iterable[bytes]]:
+        """To open file as iterable of raw chunks - from cache if it is set and key given, from server otherwise
+
+        :param url: file url
+        :type url: str
+        :param cache_key: cache entry key - download type and structure id (default value = None)
+        :type cache_key: Tuple[DownloadType, str]
+        :param chunk_size: size of chunks in bytes (default value = 65536)
+        :type chunk_size: int
+        :return: iterable of file chunks
+        :raise FileNotFoundError: when file is not present on server
+        """
+        cache = DownloadHelper._cache
+        if cache is not None and cache_key is not None:
+            with open(cache.fetch(url, *cache_key), 'rb') as file:
+                yield iter(partial(file.read, chunk_size), b'')
+        else:
+            yield [DownloadHelper.download_file(url).getvalue()]
+
+    @staticmethod
+    def _download_prepare(url: str, decompress: bool=True, cache_key: Tuple[DownloadType, str]=None,
+                          raw: bool=False) -> Union[str, bytes]:
         """To download and prepare if needed
 
         :param url: url to download from
         :type url: str
         :param decompress: tells if decompress (default value = True)
         :type decompress: bool
-        :return: file string
+        :param cache_key: cache entry key - download type and structure id (default value = None)
+        :type cache_key: Tuple[DownloadType, str]
+        :param raw: tells if return bytes without decoding (default value = False)
+        :type raw: bool
+        :return: file string or bytes
+        """
+        with DownloadHelper._open_chunks(url, cache_key) as chunks:
+            file = b''.join(chunks)
+        return DownloadHelper._prepare(file, decompress, raw)
+
+    @staticmethod
+    def _prepare(file: bytes, decompress: bool=True, raw: bool=False) -> Union[str, bytes]:
+        """To prepare downloaded file - decompress and decode if needed
+
+        :param file: downloaded file bytes
+        :type file: bytes
+        :param decompress: tells if decompress (default value = True)
+        :type decompress: bool
+        :param raw: tells if return bytes without decoding (default value = False)
+        :type raw: bool
+        :return: file string or bytes
+        :raise BufferError: when file is corrupted
         """
         try:
-            file = DownloadHelper.download_file(url)
             if decompress:
-                file = zlib.decompress(file.read(), 32 + zlib.MAX_WBITS)  # 32 to skip header of gz
-            else:
-                file = file.read()
+                file = zlib.decompress(file, 32 + zlib.MAX_WBITS)  # 32 to skip header of gz
 
-            return file.decode("utf-8")
+            return file if raw else file.decode("utf-8")
 
         except zlib.error:
             raise BufferError("File corrupted")
 
     @staticmethod
     def download_file(url: str) -> BytesIO:
-        """Function to download file and convert to BytesIO
+        """Function to download file and convert to BytesIO - interrupted transfer is continued from last \
+        received byte
 
         :param url: file url
         :type url: str
         :return: file as BytesIO
         :rtype: BytesIO
         """
-        with requests.session() as session:
-            resp = session.get(url)
+        file = BytesIO()
+        DownloadHelper._fetch_resumable(url, file)
+        file.seek(0)
+        return file
+
+    @staticmethod
+    def _fetch_resumable(url: str, file: BinaryIO, chunk_size: int=64 * 1024, validator: str=None,
+                         keep_validator: Callable[[str], None]=None) -> None:
+        """To write file from server to binary file starting at its current position - if transfer is interrupted \
+        it is requested again with Range and If-Range headers, so only missing bytes of the same file version \
+        are sent. Received part without validator is dropped, as its version is unknown.
+
+        :param url: file url
+        :type url: str
+        :param file: binary file opened for writing, positioned at end of already received part
+        :type file: BinaryIO
+        :param chunk_size: size of chunks read from response in bytes (default value = 65536)
+        :type chunk_size: int
+        :param validator: ETag or Last-Modified of file version already received part comes from \
+        (default value = None)
+        :type validator: str
+        :param keep_validator: function called with validator of received file version, None if server sent \
+        none, before its bytes are written (default value = None)
+        :type keep_validator: Callable[[str], None]
+        :return: None
+        :raise FileNotFoundError: when file is not present on server
+        """
+        attempt = 0
+        while True:
+            offset = file.tell()
+            if offset and not validator:  # version of part is unknown - start over
+                file.seek(0)
+                file.truncate()
+                offset = 0
+
+            # identity encoding, so range offsets match received bytes
+            headers = {'Accept-Encoding': 'identity'}
+            if offset:
+                headers['Range'] = 'bytes=%d-' % offset
+                headers['If-Range'] = validator
 
-            if resp.status_code == 404:
-                raise FileNotFoundError("No file on server")
+            try:
+                with NDBSession.get_default().get(url, stream=True, headers=headers) as resp:
+                    if resp.status_code == 404:
+                        raise FileNotFoundError("No file on server")
+                    if resp.status_code == 416 and offset:
+                        if resp.headers.get('Content-Range', '').endswith('/%d' % offset):
+                            return  # part is already complete
+                        file.seek(0)
+                        file.truncate()
+                        continue
+                    resp.raise_for_status()
+                    if resp.status_code != 206 and offset:  # range ignored or file changed - start over
+                        file.seek(0)
+                        file.truncate()
+
+                    validator = DownloadHelper._validator(resp)
+                    if keep_validator:
+                        keep_validator(validator)
+                    for chunk in resp.iter_content(chunk_size):
+                        file.write(chunk)
+                    return
+
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError):
+                attempt += 1
+                if attempt >= DownloadHelper._resumeAttempts:
+                    raise
+                time.sleep(DownloadHelper._resumeBackoff * 2 ** (attempt - 1))
 
-            return BytesIO(resp.content)
-        return None
+    @staticmethod
+    def _validator(resp: requests.Response) -> str:
+        """To get validator usable in If-Range header - strong ETag or Last-Modified
+
+        :param resp: file response
+        :type resp: requests.Response
+        :return: validator or None if server sent none
+        :rtype: str
+        """
+        etag = resp.headers.get('ETag')
+        if etag and not etag.startswith('W/'):
+            return etag
+        return resp.headers.get('Last-Modified')
+
+    @staticmethod
+    @contextmanager
+    def _part_lock(part_path: str) -> Iterator[None]:
+        """To hold lock of .part file, so concurrent downloads to the same path don't write it at once
+
+        :param part_path: .part file path
+        :type part_path: str
+        :return: None
+        """
+        key = os.path.abspath(part_path)
+        with DownloadHelper._partLocksLock:
+            lock, users = DownloadHelper._partLocks.get(key, (None, 0))
+            if lock is None:
+                lock = threading.Lock()
+            DownloadHelper._partLocks[key] = (lock, users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with DownloadHelper._partLocksLock:
+                lock, users = DownloadHelper._partLocks[key]
+                if users > 1:
+                    DownloadHelper._partLocks[key] = (lock, users - 1)
+                else:
+                    del DownloadHelper._partLocks[key]
+
+    @staticmethod
+    def _read_validator(part_path: str) -> str:
+        """To read validator of .part file
+
+        :param part_path: .part file path
+        :type part_path: str
+        :return: validator or None if not stored
+        :rtype: str
+        """
+        try:
+            with open(part_path + DownloadHelper._validatorExt, encoding='utf-8') as file:
+                return file.read() or None
+        except OSError:
+            return None
+
+    @staticmethod
+    def _write_validator(part_path: str, validator: str) -> None:
+        """To store validator of .part file, None removes it
+
+        :param part_path: .part file path
+        :type part_path: str
+        :param validator: ETag or Last-Modified of received file version
+        :type validator: str
+        :return: None
+        """
+        validator_path = part_path + DownloadHelper._validatorExt
+        if validator:
+            with open(validator_path, 'w', encoding='utf-8') as file:
+                file.write(validator)
+        elif os.path.isfile(validator_path):
+            os.remove(validator_path)
+
+    @staticmethod
+    def download_to_file(url: str, path: str, decompress: bool=True, chunk_size: int=64 * 1024) -> None:
+        """Function to stream file to disk chunk by chunk, decompressing on the fly - memory usage doesn't \
+        depend on file size and interrupted download is resumed from partial file
+
+        :param url: file url
+        :type url: str
+        :param path: target file path
+        :type path: str
+        :param decompress: tells if decompress gz stream (default value = True)
+        :type decompress: bool
+        :param chunk_size: size of chunks read from response in bytes (default value = 65536)
+        :type chunk_size: int
+        :return: None
+        :raise FileNotFoundError: when file is not present on server
+        :raise BufferError: when file is corrupted
+        """
+        DownloadHelper._save(url, path, decompress, chunk_size=chunk_size)
+
+    @staticmethod
+    def _save(url: str, path: str, decompress: bool=True, cache_key: Tuple[DownloadType, str]=None,
+              chunk_size: int=64 * 1024) -> None:
+        """To stream file to disk from server or cache, decompressing on the fly - file from server is received \
+        to .part file first, which is kept when transfer fails, so next call continues from its last byte
+
+        :param url: file url
+        :type url: str
+        :param path: target file path
+        :type path: str
+        :param decompress: tells if decompress gz stream (default value = True)
+        :type decompress: bool
+        :param cache_key: cache entry key - download type and structure id (default value = None)
+        :type cache_key: Tuple[DownloadType, str]
+        :param chunk_size: size of chunks in bytes (default value = 65536)
+        :type chunk_size: int
+        :return: None
+        """
+        cache = DownloadHelper._cache
+        if cache is not None and cache_key is not None:
+            DownloadHelper._write_file(cache.fetch(url, *cache_key), path, decompress, chunk_size)
+            return
+
+        # received bytes are kept in .part file with validator of their version, so next download continues \
+        # where this one was interrupted if file on server didn't change
+        part_path = path + '.part'
+        with DownloadHelper._part_lock(part_path):
+            try:
+                with open(part_path, 'ab') as part:
+                    DownloadHelper._fetch_resumable(url, part, chunk_size, DownloadHelper._read_validator(part_path),
+                                                    partial(DownloadHelper._write_validator, part_path))
+            except BaseException:
+                if os.path.isfile(part_path) and not os.path.getsize(part_path):
+                    os.remove(part_path)
+                    DownloadHelper._write_validator(part_path, None)
+                raise
+
+            try:
+                if decompress:
+                    DownloadHelper._write_file(part_path, path, decompress, chunk_size)
+                    os.remove(part_path)
+                else:
+                    os.replace(part_path, path)
+            except BufferError:
+                os.remove(part_path)
+                raise
+            finally:
+                if not os.path.isfile(part_path):
+                    DownloadHelper._write_validator(part_path, None)
+
+    @staticmethod
+    def _write_file(source_path: str, path: str, decompress: bool, chunk_size: int) -> None:
+        """To copy file to target path, decompressing on the fly - target is removed on error
+
+        :param source_path: source file path
+        :type source_path: str
+        :param path: target file path
+        :type path: str
+        :param decompress: tells if decompress gz stream
+        :type decompress: bool
+        :param chunk_size: size of chunks in bytes
+        :type chunk_size: int
+        :return: None
+        :raise BufferError: when file is corrupted
+        """
+        decompressor = zlib.decompressobj(32 + zlib.MAX_WBITS) if decompress else None  # 32 to skip header of gz
+        try:
+            with open(source_path, 'rb') as source, open(path, 'wb') as file:
+                for chunk in iter(partial(source.read, chunk_size), b''):
+                    if decompressor:
+                        chunk = decompressor.decompress(chunk)
+                    file.write(chunk)
+                if decompressor:
+                    file.write(decompressor.flush())
+        except BaseException as error:
+            if os.path.isfile(path):
+                os.remove(path)
+            if isinstance(error, zlib.error):
+                raise BufferError("File corrupted")
+            raise
@@ -0,0 +1,127 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class NDBSession(object):
+    """Class for shared http session - keeps pool of warm connections used by all NDB and DownloadHelper calls
+
+    :cvar _default: private default session instance
+    :cvar _lock: private lock guarding default session creation
+    """
+    _default = None
+    _lock = threading.Lock()
+
+    def __init__(self, pool_connections: int=4, pool_maxsize: int=16, max_retries: int=3,
+                 backoff_factor: float=0.5, keep_alive: bool=True, timeout: float=60):
+        """Default constructor
+
+        :param pool_connections: number of hosts to keep connection pools for (default value = 4)
+        :type pool_connections: int
+        :param pool_maxsize: max number of connections kept per host (default value = 16)
+        :type pool_maxsize: int
+        :param max_retries: number of retries on connection errors and 5xx responses (default value = 3)
+        :type max_retries: int
+        :param backoff_factor: retries backoff factor in seconds (default value = 0.5)
+        :type backoff_factor: float
+        :param keep_alive: tells if connections should be kept alive (default value = True)
+        :type keep_alive: bool
+        :param timeout: request timeout in seconds, None to wait forever (default value = 60)
+        :type timeout: float
+        """
+        self._timeout = timeout
+        self._pool_maxsize = pool_maxsize
+        self._session = requests.Session()
+
+        retry = Retry(total=max_retries, backoff_factor=backoff_factor, status_forcelist=(500, 502, 503, 504),
+                      allowed_methods=False, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+        if not keep_alive:
+            self._session.headers['Connection'] = 'close'
+
+    @property
+    def timeout(self) -> float:
+        """Gets request timeout
+
+        :return: timeout in seconds
+        :rtype: float
+        """
+        return self._timeout
+
+    @property
+    def pool_maxsize(self) -> int:
+        """Gets max number of connections kept per host
+
+        :return: pool size
+        :rtype: int
+        """
+        return self._pool_maxsize
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """To send GET request using pooled connections
+
+        :param url: request url
+        :type url: str
+        :param kwargs: additional requests arguments
+        :return: response
+        :rtype: requests.Response
+        """
+        kwargs.setdefault('timeout', self._timeout)
+        return self._session.get(url, **kwargs)
+
+    def post(self, url: str, data: dict=None, **kwargs) -> requests.Response:
+        """To send POST request using pooled connections
+
+        :param url: request url
+        :type url: str
+        :param data: form data (default value = None)
+        :type data: dict
+        :param kwargs: additional requests arguments
+        :return: response
+        :rtype: requests.Response
+        """
+        kwargs.setdefault('timeout', self._timeout)
+        return self._session.post(url, data=data, **kwargs)
+
+    def close(self) -> None:
+        """To close all pooled connections
+
+        :return: None
+        """
+        self._session.close()
+
+    def __enter__(self) -> 'NDBSession':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @staticmethod
+    def get_default() -> 'NDBSession':
+        """Gets default session shared by all NDB and DownloadHelper calls, creates it if needed
+
+        :return: default session
+        :rtype: NDBSession
+        """
+        if NDBSession._default is None:
+            with NDBSession._lock:
+                if NDBSession._default is None:
+                    NDBSession._default = NDBSession()
+        return NDBSession._default
+
+    @staticmethod
+    def set_default(session: 'NDBSession') -> None:
+        """Sets default session shared by all NDB and DownloadHelper calls, previous one is closed
+
+        :param session: session to be set as default
+        :type session: NDBSession
+        :return: None
+        """
+        with NDBSession._lock:
+            previous, NDBSession._default = NDBSession._default, session
+        if previous is not None and previous is not session:
+            previous.close()
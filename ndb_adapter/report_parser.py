@@ -1,14 +1,42 @@
+import csv
 import re
 from io import BytesIO
-from typing import List, Callable
+from typing import Dict, Iterable, Iterator, List, Callable, Tuple
+from urllib.parse import urlparse
 import xlrd
 from ndb_adapter.enums import ReportType
-from ndb_adapter.html_parser import NDBHtmlParser
+from ndb_adapter.html_parser import NDBHtmlExtractor, NDBHtmlParser, Tag
 from ndb_adapter.ndb_base import NDBBase
 from ndb_adapter.search_report import AdvancedReport, SimpleReport, StatisticReport
-from ndb_adapter.search_result import SearchResult, SimpleResult, AdvancedResult
+from ndb_adapter.search_result import SearchResult, SimpleResult, AdvancedResult, LazyReportList
 from ndb_adapter.summary_result import SummaryResult
 
+try:
+    import numpy
+except ImportError:  # optional columnar backend
+    numpy = None
+
+try:
+    import pyarrow
+    import pyarrow.csv as arrow_csv
+except ImportError:  # optional columnar backend
+    pyarrow = None
+
+_csvBatchSize = 256
+"""Private number of csv rows converted to reports at once"""
+
+_galleryFileId = 'fileGal'
+"""Private id of gallery page link to xls result file"""
+
+_galleryCsvId = 'fileGalCsv'
+"""Private id of gallery page link to csv result file"""
+
+_searchTargets = [('span', {'id': 'numRec'}), ('a', None)]
+"""Private elements extracted from gallery page - results count and links to result file"""
+
+_summaryTargets = [('div', {'id': 'summary'}), ('div', {'id': 'naSeq'}), ('div', {'id': 'protSeq'})]
+"""Private elements extracted from summary page"""
+
 
 def parse_to_table(text: str) -> List[str]:
     """To parse text to list of strings
@@ -20,53 +48,160 @@ def parse_to_table(text: str) -> List[str]:
     return [t.strip() for t in text.splitlines()]
 
 
-def parse_csv(table: List[str], result_class: Callable[[], AdvancedReport]) -> List[AdvancedReport]:
+def parse_csv(table: Iterable[str], result_class: Callable[[], AdvancedReport]) -> List[AdvancedReport]:
     """To parse table of string as csv to list of AdvancedReport
 
     :param table: string table to parse
-    :type table: List[str]
+    :type table: Iterable[str]
     :param result_class: class that init object before adding to results
     :type result_class: Callable[[], AdvancedReport]
     :return: list of advanced report
     :rtype: List[AdvancedReport]
     """
-    result = []
+    return list(iter_csv(table, result_class))
+
+
+def iter_csv(table: Iterable[str], result_class: Callable[[], AdvancedReport]) -> Iterator[AdvancedReport]:
+    """To parse table of string as csv lazily - reports are yielded as lines are read. Reports are made in small \
+    batches, converting values column by column.
+
+    :param table: string table to parse, first line is header
+    :type table: Iterable[str]
+    :param result_class: class that init object before yielding
+    :type result_class: Callable[[], AdvancedReport]
+    :return: iterator of advanced report
+    :rtype: Iterator[AdvancedReport]
+    """
+    reader = csv.reader(table)
+    headers = next(reader, None)
+    if not headers:
+        return
+
+    from_rows = getattr(result_class, '_from_rows', None)
+    if from_rows is None:
+        for row in reader:
+            if row:
+                yield result_class(dict(zip(headers, row)))
+        return
+
+    batch = []
+    for row in reader:
+        if row:
+            batch.append(row)
+            if len(batch) == _csvBatchSize:
+                yield from from_rows(headers, batch)
+                batch = []
+    if batch:
+        yield from from_rows(headers, batch)
+
+
+def parse_csv_columns(table: List[str], types: Dict[str, type]=None) -> Dict[str, list]:
+    """To parse table of string as csv to dictionary of columns - columns are converted to given types, other \
+    numeric columns are converted to numbers. Columns are numpy arrays if numpy is installed (read by pyarrow csv \
+    reader if also pyarrow is installed), lists otherwise
+
+    :param table: string table to parse
+    :type table: List[str]
+    :param types: dictionary of header -> column type (str, int or float) e.g. ReportType.value.column_types() \
+    (default value = None)
+    :type types: Dict[str, type]
+    :return: dictionary of header -> column values
+    :rtype: Dict[str, list]
+    """
+    types = types or {}
+    if pyarrow is not None and numpy is not None:
+        result = _parse_csv_columns_arrow(table, types)
+        if result is not None:
+            return result
+
+    reader = csv.reader(table)
+    headers = next(reader, None)
+    if not headers:
+        return {}
+
+    width = len(headers)
+    rows = [row if len(row) == width else (row + [''] * width)[:width] for row in reader if row]
+    if numpy is not None:
+        matrix = numpy.array(rows, dtype=object).reshape(len(rows), width)
+        columns = [matrix[:, i] for i in range(width)]
+    else:
+        columns = [[row[i] for row in rows] for i in range(width)]
+
+    return {header: _column_to_array(column, types.get(header)) for header, column in zip(headers, columns)}
+
+
+def _parse_csv_columns_arrow(table: List[str], types: Dict[str, type]) -> Dict[str, list]:
+    """Private function to parse table of string as csv to dictionary of numpy arrays with pyarrow
+
+    :param table: string table to parse
+    :type table: List[str]
+    :param types: dictionary of header -> column type
+    :type types: Dict[str, type]
+    :return: dictionary of header -> column values, None if table is not valid for pyarrow
+    :rtype: Dict[str, list]
+    """
+    arrow_types = {str: pyarrow.string(), int: pyarrow.int64(), float: pyarrow.float64()}
+    column_types = {name: arrow_types[column_type] for name, column_type in types.items()}
+    data = '\n'.join(table).encode('utf-8')
     try:
-        headers = table[0].split(',')
-
-        for elem in table[1:]:
-            before = 0
-            last = 0
-            record = {}
-            open_quotes = False
-            values = elem.split(',')
-            values_len = len(values)
-
-            for header in headers:
-                for i in range(last, values_len):
-                    if '"' in values[i]:
-                        if not open_quotes:
-                            before = i
-                            open_quotes = True
-                        else:
-                            record[header] = ",".join(values[before:i+1]).replace('"', '')
-                            open_quotes = False
-                            last = i+1
-                            break
-                    elif not open_quotes:
-                        record[header] = values[i]
-                        last = i+1
-                        break
-
-            result.append(result_class(record))
-    except IndexError:
-        pass
+        arrow_table = arrow_csv.read_csv(BytesIO(data), convert_options=arrow_csv.ConvertOptions(
+            column_types=column_types, strings_can_be_null=False, timestamp_parsers=[]))
+    except pyarrow.ArrowInvalid:
+        return None
+
+    result = {}
+    for name, column in zip(arrow_table.column_names, arrow_table.columns):
+        if pyarrow.types.is_null(column.type):
+            result[name] = numpy.full(len(column), '', dtype=object)
+            continue
+        if not (pyarrow.types.is_integer(column.type) or pyarrow.types.is_floating(column.type)):
+            column = column.cast(pyarrow.string())  # keep dates, booleans etc. as strings like other backends
+        result[name] = column.to_numpy()
 
     return result
 
 
+def _column_to_array(column: list, column_type: type=None) -> list:
+    """Private function to convert column of strings to uniformly typed column for columnar views - whole column \
+    is converted or kept as strings, unlike search_report._convert_column which converts values of report rows one \
+    by one. Column without type is converted to numbers if all values are numeric. Blank values of numpy float \
+    columns are NaN
+
+    :param column: column of strings, numpy object array if numpy is installed
+    :type column: list
+    :param column_type: column type - str, int, float or None if unknown (default value = None)
+    :type column_type: type
+    :return: numpy array if numpy is installed, list otherwise
+    :rtype: list
+    """
+    if column_type is str:
+        return column
+
+    if numpy is not None:
+        for dtype in ((numpy.float64,) if column_type is float else (numpy.int64, numpy.float64)):
+            try:
+                return column.astype(dtype)
+            except (ValueError, OverflowError):
+                pass
+
+        blank = column == ''
+        if blank.any() and not blank.all():
+            try:
+                return numpy.where(blank, 'nan', column).astype(numpy.float64)
+            except ValueError:
+                pass
+        return column
+
+    for number in ((float,) if column_type is float else (int, float)):
+        try:
+            return [number(v) for v in column]
+        except ValueError:
+            pass
+    return column
+
+
 def parse_xls(file: BytesIO) -> List[SimpleReport]:
-    """To parse xls file to list of Simplereport
+    """To parse xls file to list of Simplereport - only first sheet is loaded
 
     :param file: file bytes to parse
     :type file: BytesIO
@@ -75,19 +210,62 @@ def parse_xls(file: BytesIO) -> List[SimpleReport]:
     """
     result = []
     try:
-        book = xlrd.open_workbook(file_contents=file.read())
-        sheet = book.sheet_by_index(0)
-        headers = sheet.row_values(0)
-
-        for row in range(1, sheet.nrows):
-            record = dict(zip(headers, sheet.row_values(row)))
-            result.append(SimpleReport(record))
+        book = xlrd.open_workbook(file_contents=file.read(), on_demand=True)
+        try:
+            sheet = book.sheet_by_index(0)
+            headers = sheet.row_values(0)
+            result = SimpleReport._from_rows(headers, [sheet.row_values(row) for row in range(1, sheet.nrows)])
+        finally:
+            book.release_resources()
     except TypeError:
         pass
 
     return result
 
 
+def parse_gallery_file(file: BytesIO, url: str) -> List[SimpleReport]:
+    """To parse gallery result file to list of SimpleReport - csv or xls depending on url extension
+
+    :param file: file bytes to parse
+    :type file: BytesIO
+    :param url: file url
+    :type url: str
+    :return: list of SimpleReport
+    :rtype: List[SimpleReport]
+    """
+    if urlparse(url).path.lower().endswith('.csv'):
+        return parse_csv(parse_to_table(file.getvalue().decode('utf-8')), SimpleReport)
+    return parse_xls(file)
+
+
+def gallery_file_url(parser: NDBHtmlParser, after: Tag=None) -> str:
+    """To find url of gallery result file in analyzed html - csv file if page links it, xls file otherwise. Csv file \
+    is link with id fileGalCsv or link to xls file of fileGal link with csv extension, other links are not used.
+
+    :param parser: parser with analyzed gallery html
+    :type parser: NDBHtmlParser
+    :param after: tag after which links are searched (default value = None) - whole page
+    :type after: Tag
+    :return: file url, empty if not found
+    :rtype: str
+    """
+    csv_tag = parser.find_one('a', after=after, params={'id': _galleryCsvId})
+    if csv_tag and csv_tag.attrs.get('href'):
+        return csv_tag.attrs['href']
+
+    file_tag = parser.find_one('a', after=after, params={'id': _galleryFileId})
+    file_url = file_tag.attrs.get('href', '') if file_tag else ''
+    file_path = urlparse(file_url).path
+    if file_path.lower().endswith('.xls'):
+        csv_path = file_path[:-len('.xls')].lower() + '.csv'
+        for link in parser.find_all('a', after=after):
+            href = link.attrs.get('href', '')
+            if href and urlparse(href).path.lower() == csv_path:
+                return href
+
+    return file_url
+
+
 def parse_advanced_search_report(text: str, text_stats: str, report_type: ReportType) -> AdvancedResult:
     """To parse advanced search report from text to AdvancedResult
 
@@ -104,7 +282,7 @@ def parse_advanced_search_report(text: str, text_stats: str, report_type: Report
     result_class = report_type.value
     raw_table = parse_to_table(text)
     count = raw_table[1].rpartition(': ')[-1]
-    report = parse_csv(raw_table[2:], result_class)
+    report = LazyReportList(raw_table[2:], result_class)
 
     if text_stats:
         raw_stats = parse_to_table(text_stats)
@@ -117,10 +295,29 @@ def parse_advanced_search_report(text: str, text_stats: str, report_type: Report
         pass
 
     result.report = report
+    result.set_column_types(result_class.column_types())
 
     return result
 
 
+def iter_advanced_search_report(lines: Iterable[str], report_type: ReportType) -> Iterator[AdvancedReport]:
+    """To parse advanced search report lazily from lines - e.g. lines of streamed response
+
+    :param lines: report lines to parse
+    :type lines: Iterable[str]
+    :param report_type: type of report to parse
+    :type report_type: ReportType
+    :return: iterator of advanced report
+    :rtype: Iterator[AdvancedReport]
+    """
+    lines = iter(lines)
+    for _ in range(2):  # report title and count
+        if next(lines, None) is None:
+            return
+
+    yield from iter_csv((line.strip() for line in lines), report_type.value)
+
+
 def parse_search_report(html: str) -> SimpleResult:
     """To parse simple search report from html to SimpleResult
 
@@ -130,17 +327,15 @@ def parse_search_report(html: str) -> SimpleResult:
     :rtype: SimpleResult
     """
     result = SearchResult()
-    parser = NDBHtmlParser()
+    parser = NDBHtmlExtractor(_searchTargets)
 
     parser.analyze(html)
     count_tag = parser.find_one('span', params={'id': 'numRec'})
-
-    file_tag = parser.find_one('a', after=count_tag, params={'id': 'fileGal'})
-    url = file_tag.attrs.get('href', '') if file_tag else ''
+    url = gallery_file_url(parser, count_tag)
 
     from ndb_adapter.ndb_download import DownloadHelper
     file = DownloadHelper.download_file(NDBBase.siteUrl + url)
-    report = parse_xls(file)
+    report = parse_gallery_file(file, url)
 
     try:
         result.count = int(count_tag.data)
@@ -153,17 +348,35 @@ def parse_search_report(html: str) -> SimpleResult:
 
 
 def parse_summary(html: str) -> SummaryResult:
-    """To parse summary search from html to SummaryResult
+    """To parse summary search from html to SummaryResult - only summary elements are extracted from html, \
+    whole tree is made if summary heading is outside of them
 
     :param html: html string to parse
     :type html: str
     :return: summary search result
     :rtype: SummaryResult
     """
+    parser = NDBHtmlExtractor(_summaryTargets)
+    parser.analyze(html)
+
+    summary_tag = parser.find_one('div', params={'id': 'summary'})
+    if summary_tag and not parser.find_one('h2', after=summary_tag, params={'class': 'justHeading'}):
+        parser = NDBHtmlParser()
+        parser.analyze(html)
+
+    return _parse_summary_tree(parser)
+
+
+def _parse_summary_tree(parser: NDBHtmlParser) -> SummaryResult:
+    """Private function to parse summary search from analyzed html to SummaryResult
+
+    :param parser: parser with analyzed summary html - whole tree or extracted summary elements
+    :type parser: NDBHtmlParser
+    :return: summary search result
+    :rtype: SummaryResult
+    """
     report = {}
     result = SummaryResult()
-    parser = NDBHtmlParser()
-    parser.analyze(html)
 
     summary_tag = parser.find_one('div', params={'id': 'summary'})
     if summary_tag:
@@ -254,3 +467,25 @@ def parse_summary(html: str) -> SummaryResult:
 
     result.update(report)
     return result
+
+
+_listing_pattern = re.compile(r'<a href="([^"?/][^"]*)">[^<]*</a>(?:\s*</td>)?\s*(?:<td[^>]*>)?\s*'
+                              r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}(?::\d{2})?|\d{2}-\w{3}-\d{4} \d{2}:\d{2})?'
+                              r'\s*(?:</td>)?\s*(?:<td[^>]*>)?\s*([\d.]+[KMGT]?)?', re.IGNORECASE)
+
+
+def parse_listing(html: str) -> Dict[str, Tuple[str, str]]:
+    """To parse http directory listing to dictionary of files
+
+    :param html: html string to parse
+    :type html: str
+    :return: dictionary of file name -> (modification time, size) as shown in listing, empty strings if not shown
+    :rtype: Dict[str, Tuple[str, str]]
+    """
+    result = {}
+    for match in _listing_pattern.finditer(html):
+        name = match.group(1)
+        if not name.endswith('/'):
+            result[name] = (match.group(2) or '', match.group(3) or '')
+
+    return result
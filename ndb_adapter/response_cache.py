@@ -0,0 +1,202 @@
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResponseCache(object):
+    """Base class for search response cache - stores parsed search results keyed by endpoint and form data"""
+    def __init__(self, ttl: float=3600):
+        """Default constructor
+
+        :param ttl: default time to live of entries in seconds (default value = 3600)
+        :type ttl: float
+        """
+        self._ttl = ttl
+
+    @property
+    def ttl(self) -> float:
+        """Gets default time to live of entries
+
+        :return: time to live in seconds
+        :rtype: float
+        """
+        return self._ttl
+
+    @staticmethod
+    def make_key(url: str, data: dict) -> str:
+        """To make canonical key of request - same endpoint and form data always give same key
+
+        :param url: request url
+        :type url: str
+        :param data: request form data
+        :type data: dict
+        :return: request key
+        :rtype: str
+        """
+        canonical = json.dumps([url, data], sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> object:
+        """Gets cached value
+
+        :param key: request key
+        :type key: str
+        :return: cached value or None if not cached or expired
+        :rtype: object
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value: object, ttl: float=None) -> None:
+        """Sets cached value
+
+        :param key: request key
+        :type key: str
+        :param value: value to cache
+        :type value: object
+        :param ttl: time to live in seconds (default value = None) - cache default ttl
+        :type ttl: float
+        :return: None
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """To remove all cached values
+
+        :return: None
+        """
+        raise NotImplementedError
+
+
+class MemoryResponseCache(ResponseCache):
+    """Class for in memory response cache extending ResponseCache - cached results are shared, not copied"""
+    def __init__(self, ttl: float=3600, max_entries: int=1024):
+        """Default constructor
+
+        :param ttl: default time to live of entries in seconds (default value = 3600)
+        :type ttl: float
+        :param max_entries: max number of entries, least recently used are removed first (default value = 1024)
+        :type max_entries: int
+        """
+        super().__init__(ttl)
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> object:
+        """Gets cached value
+
+        :param key: request key
+        :type key: str
+        :return: cached value or None if not cached or expired
+        :rtype: object
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: object, ttl: float=None) -> None:
+        """Sets cached value
+
+        :param key: request key
+        :type key: str
+        :param value: value to cache
+        :type value: object
+        :param ttl: time to live in seconds (default value = None) - cache default ttl
+        :type ttl: float
+        :return: None
+        """
+        expires = time.time() + (self._ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """To remove all cached values
+
+        :return: None
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteResponseCache(ResponseCache):
+    """Class for persistent SQLite response cache extending ResponseCache - results are stored pickled"""
+    def __init__(self, path: str, ttl: float=3600):
+        """Default constructor
+
+        :param path: database file path
+        :type path: str
+        :param ttl: default time to live of entries in seconds (default value = 3600)
+        :type ttl: float
+        """
+        super().__init__(ttl)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires REAL, value BLOB)')
+
+    def get(self, key: str) -> object:
+        """Gets cached value
+
+        :param key: request key
+        :type key: str
+        :return: cached value or None if not cached or expired
+        :rtype: object
+        """
+        with self._lock:
+            row = self._db.execute('SELECT expires, value FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            if row[0] < time.time():
+                with self._db:
+                    self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                return None
+
+        return pickle.loads(row[1])
+
+    def set(self, key: str, value: object, ttl: float=None) -> None:
+        """Sets cached value
+
+        :param key: request key
+        :type key: str
+        :param value: value to cache
+        :type value: object
+        :param ttl: time to live in seconds (default value = None) - cache default ttl
+        :type ttl: float
+        :return: None
+        """
+        expires = time.time() + (self._ttl if ttl is None else ttl)
+        blob = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            with self._db:
+                self._db.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?)', (key, expires, blob))
+
+    def clear(self) -> None:
+        """To remove all cached values
+
+        :return: None
+        """
+        with self._lock:
+            with self._db:
+                self._db.execute('DELETE FROM responses')
+
+    def close(self) -> None:
+        """To close database
+
+        :return: None
+        """
+        with self._lock:
+            self._db.close()
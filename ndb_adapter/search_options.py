@@ -98,6 +98,44 @@ class SearchOptions(object):
         """
         return self._options['filterTxt']
 
+    def set_start(self, start: int=0) -> None:
+        """Sets index of first result in options - with limit selects page of results
+
+        :param start: index of first result (default value = 0)
+        :type start: int
+        :return: None
+        """
+        if start < 0:
+            raise AttributeError("Start must not be negative")
+        self._options['start'] = str(start)
+
+    def get_start(self) -> int:
+        """Gets index of first result options
+
+        :return: index of first result
+        :rtype: int
+        """
+        return int(self._options['start'])
+
+    def set_limit(self, limit: int=10) -> None:
+        """Sets max number of results in options - page size
+
+        :param limit: max number of results (default value = 10)
+        :type limit: int
+        :return: None
+        """
+        if limit < 1:
+            raise AttributeError("Limit must be positive")
+        self._options['limit'] = str(limit)
+
+    def get_limit(self) -> int:
+        """Gets max number of results options
+
+        :return: max number of results
+        :rtype: int
+        """
+        return int(self._options['limit'])
+
     def get(self) -> dict:
         """Gets dictionary of options
 
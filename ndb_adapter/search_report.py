@@ -1,52 +1,220 @@
-from typing import TypeVar
+import sys
+from typing import Dict, List, Tuple, TypeVar
 from ndb_adapter.ndb_download import DownloadHelper
 from ndb_adapter.ndb_download import DownloadType
 
+_internMaxLength = 16
+"""Private max length of string values shared between reports"""
 
-def _assign_numbers(dic: dict) -> dict:
-    """Private function for assign numbers values to dictionary
 
-    :param dic: report dictionary
-    :type dic: dict
-    :return: report dictionary
-    :rtype: dict
+def _convert_value(value: object, column_type: type) -> object:
+    """Private function to convert string value to column type - value which can't be converted is kept
+
+    :param value: value to convert
+    :type value: object
+    :param column_type: column type
+    :type column_type: type
+    :return: converted value
+    """
+    if value.__class__ is not str:
+        return value
+    if column_type is str:
+        return sys.intern(value) if len(value) <= _internMaxLength else value  # ids and names repeat in many rows
+
+    try:
+        return column_type(value)
+    except ValueError:
+        if column_type is int:
+            try:
+                return float(value)
+            except ValueError:
+                pass
+        return value
+
+
+def _convert_column(column: List[str], column_type: type) -> list:
+    """Private function to convert column of string values to column type - exception is raised at most once \
+    per column, only then values are converted one by one
+
+    :param column: column values
+    :type column: List[str]
+    :param column_type: column type
+    :type column_type: type
+    :return: converted values
+    :rtype: list
+    """
+    try:
+        if column_type is str:
+            return [sys.intern(v) if len(v) <= _internMaxLength else v for v in column]
+        return [column_type(v) for v in column]
+    except (TypeError, ValueError):
+        return [_convert_value(v, column_type) for v in column]
+
+
+class _Schema(object):
+    """Private class for report columns schema - column names, types and positions shared by all reports \
+    of same type"""
+    __slots__ = ('names', 'types', 'defaults', 'index')
+
+    def __init__(self, *columns: Tuple[str, type]):
+        """Default constructor
+
+        :param columns: columns as (name, type) tuples
+        :type columns: Tuple[str, type]
+        """
+        self.names = tuple(name for name, _ in columns)
+        self.types = tuple(column_type for _, column_type in columns)
+        self.defaults = tuple(column_type() for column_type in self.types)
+        self.index = {name: i for i, name in enumerate(self.names)}
+
+    def extend(self, *columns: Tuple[str, type]) -> '_Schema':
+        """To make new schema with additional columns
+
+        :param columns: additional columns as (name, type) tuples
+        :type columns: Tuple[str, type]
+        :return: extended schema
+        :rtype: _Schema
+        """
+        return _Schema(*(tuple(zip(self.names, self.types)) + columns))
+
+
+class _Report(object):
+    """Private base class for reports - values are kept in tuple ordered by class schema instead of \
+    per instance dict. String values are converted to schema column types, columns outside schema are kept as strings.
+
+    :cvar _schema: private columns schema of report
     """
-    for k, v in dic.items():
-        try:
-            if '.' in v:
-                dic[k] = float(v)
+    __slots__ = ('_values', '_extra')
+    _schema = _Schema()
+
+    def __init__(self, report: dict = None):
+        """Default constructor
+
+        :param report: report dictionary (default value = None)
+        :type report: dict
+        """
+        self._extra = None
+        if not report:
+            self._values = self._schema.defaults
+            return
+
+        index = self._schema.index
+        types = self._schema.types
+        values = list(self._schema.defaults)
+        for key, value in report.items():
+            i = index.get(key)
+            if i is not None:
+                values[i] = _convert_value(value, types[i])
             else:
-                dic[k] = int(v)
+                if self._extra is None:
+                    self._extra = {}
+                self._extra[key] = value
+        self._values = tuple(values)
+
+    @classmethod
+    def column_types(cls) -> Dict[str, type]:
+        """Gets report columns types
+
+        :return: dictionary of column name -> type (str, int or float)
+        :rtype: Dict[str, type]
+        """
+        return dict(zip(cls._schema.names, cls._schema.types))
+
+    @classmethod
+    def _from_rows(cls, headers: List[str], rows: List[List[str]]) -> list:
+        """Private method to make many reports from csv rows - values are converted column by column \
+        using schema types
+
+        :param headers: csv headers
+        :type headers: List[str]
+        :param rows: csv rows
+        :type rows: List[List[str]]
+        :return: list of reports
+        :rtype: list
+        """
+        width = len(headers)
+        if any(len(row) != width for row in rows):
+            return [cls(dict(zip(headers, row))) for row in rows]
+
+        schema = cls._schema
+        columns = [[default] * len(rows) for default in schema.defaults]
+        extra = []
+        for position, header in enumerate(headers):
+            column = [row[position] for row in rows]
+            i = schema.index.get(header)
+            if i is not None:
+                columns[i] = _convert_column(column, schema.types[i])
+            else:
+                extra.append((header, column))
+
+        extras = [dict(zip([header for header, _ in extra], values))
+                  for values in zip(*[column for _, column in extra])] if extra else None
+        result = []
+        for row, values in enumerate(zip(*columns)):
+            report = cls.__new__(cls)
+            report._values = values
+            report._extra = extras[row] if extras else None
+            result.append(report)
+        return result
+
+    def _get(self, key: str) -> object:
+        """Private method to get report value
+
+        :param key: column name
+        :type key: str
+        :return: column value
+        """
+        i = self._schema.index.get(key)
+        if i is not None:
+            return self._values[i]
+        return self._extra[key] if self._extra else None
+
+    def get_dict(self) -> dict:
+        """Gets report as dict
+
+        :return: report dict
+        :rtype: dict
+        """
+        report = dict(zip(self._schema.names, self._values))
+        if self._extra:
+            report.update(self._extra)
+        return report
 
-        except ValueError:
-            pass
-    return dic
+    def __getstate__(self) -> tuple:
+        return self._values, self._extra
 
+    def __setstate__(self, state: tuple) -> None:
+        self._values, self._extra = state
 
-class SimpleReport(object):
+    def __str__(self) -> str:
+        return str(self.get_dict())
+
+
+class SimpleReport(_Report):
     """Class for simple result report"""
+    __slots__ = ()
+    _schema = _Schema(
+        ('NDB ID', str),
+        ('PDB ID', str),
+        ('Classification', str),
+        ('Title', str),
+        ('PDB Release Date', str),
+        ('Authors', str),
+        ('Citation Title', str),
+        ('Citation Detail', str),
+        ('Experiment', str),
+        ('Resolution', float),
+        ('R work', float),
+        ('R free', float)
+    )
+
     def __init__(self, report: dict = None):
         """Default constructor
 
         :param report: report dictionary (default value = None)
         :type report: dict
         """
-        self._report = {
-            'NDB ID': '',
-            'PDB ID': '',
-            'Classification': '',
-            'Title': '',
-            'PDB Release Date': '',
-            'Authors': '',
-            'Citation Title': '',
-            'Citation Detail': '',
-            'Experiment': '',
-            'Resolution': 0,
-            'R work': 0,
-            'R free': 0
-        }
-        if report:
-            self._report.update(report)
+        super().__init__(report)
 
     @property
     def pdb_id(self) -> str:
@@ -55,7 +223,7 @@ class SimpleReport(object):
         :return: PDB ID
         :rtype: str
         """
-        return self._report['PDB ID']
+        return self._get('PDB ID')
 
     @property
     def ndb_id(self) -> str:
@@ -64,7 +232,7 @@ class SimpleReport(object):
         :return: NDB ID
         :rtype: str
         """
-        return self._report['NDB ID']
+        return self._get('NDB ID')
 
     @property
     def title(self) -> str:
@@ -73,7 +241,7 @@ class SimpleReport(object):
         :return: title
         :rtype: str
         """
-        return self._report['Title']
+        return self._get('Title')
 
     @property
     def classification(self) -> str:
@@ -82,7 +250,7 @@ class SimpleReport(object):
         :return: classification
         :rtype: str
         """
-        return self._report['Classification']
+        return self._get('Classification')
 
     @property
     def release_date(self) -> str:
@@ -91,7 +259,7 @@ class SimpleReport(object):
         :return: release date
         :rtype: str
         """
-        return self._report['PDB Release Date']
+        return self._get('PDB Release Date')
 
     @property
     def authors(self) -> str:
@@ -100,7 +268,7 @@ class SimpleReport(object):
         :return: authots
         :rtype: str
         """
-        return self._report['Authors']
+        return self._get('Authors')
 
     @property
     def citation_title(self) -> str:
@@ -109,7 +277,7 @@ class SimpleReport(object):
         :return: citation title
         :rtype: str
         """
-        return self._report['Citation Title']
+        return self._get('Citation Title')
 
     @property
     def citation_detail(self) -> str:
@@ -118,7 +286,7 @@ class SimpleReport(object):
         :return: citation detail
         :rtype: str
         """
-        return self._report['Citation Detail']
+        return self._get('Citation Detail')
 
     @property
     def experimental_method(self) -> str:
@@ -127,7 +295,7 @@ class SimpleReport(object):
         :return: experimental method
         :rtype: str
         """
-        return self._report['Experiment']
+        return self._get('Experiment')
 
     @property
     def resolution(self) -> float:
@@ -136,7 +304,7 @@ class SimpleReport(object):
         :return: resolution
         :rtype: float
         """
-        return self._report['Resolution']
+        return self._get('Resolution')
 
     @property
     def r_work(self) -> float:
@@ -145,7 +313,7 @@ class SimpleReport(object):
         :return: r work
         :rtype: float
         """
-        return self._report['R work']
+        return self._get('R work')
 
     @property
     def r_free(self) -> float:
@@ -154,7 +322,7 @@ class SimpleReport(object):
         :return: r free
         :rtype: float
         """
-        return self._report['R free']
+        return self._get('R free')
 
     def download(self, download_type: DownloadType = DownloadType.Pdb, save: bool = False, target_dir: str = '') -> str:
         """Download PDB from ndb
@@ -175,34 +343,21 @@ class SimpleReport(object):
 
         return DownloadHelper.download(id_structure, download_type, save, target_dir)
 
-    def get_dict(self) -> dict:
-        """Gets simple report as dict
-
-        :return: simple report dict
-        :rtype: dict
-        """
-        return self._report
 
-    def __str__(self) -> str:
-        return str(self._report)
-
-
-class _AdvancedBaseReport(object):
+class _AdvancedBaseReport(_Report):
     """Base class for advanced reports"""
-    def __init__(self):
-        """Default constructor"""
-        self._report = {
-            'NDB ID': ''
-        }
+    __slots__ = ()
+    _schema = _Schema(
+        ('NDB ID', str),
+    )
 
-    def _update(self, report: dict) -> None:
-        """Private method to update inner report dict
+    def __init__(self, report: dict = None):
+        """Default constructor
 
-        :param report: extending report dict
+        :param report: report dict to make report (default value = None)
         :type report: dict
-        :return: None
         """
-        self._report.update(report)
+        super().__init__(report)
 
     @staticmethod
     def report_type() -> str:
@@ -216,41 +371,30 @@ class _AdvancedBaseReport(object):
         :return: NDB ID
         :rtype: str
         """
-        return self._report['NDB ID']
+        return self._get('NDB ID')
 
     def download(self, download_type: DownloadType = DownloadType.Pdb, save: bool = False, target_dir: str = '') -> str:
         """To download files from NDB - only works for some reports"""
         raise NotImplementedError
 
-    def get_dict(self) -> dict:
-        """Gets advanced report as dict
-
-        :return: advanced report dict
-        :rtype: dict
-        """
-        return self._report
-
-    def __str__(self) -> str:
-        return str(self._report)
-
 
 class NDBStatusReport(_AdvancedBaseReport):
     """Class for NDB status search report extending _AdvancedBaseReport"""
-    def __init__(self, report: dict= None):
+    __slots__ = ()
+    _schema = _AdvancedBaseReport._schema.extend(
+        ('PDB ID', str),
+        ('Title', str),
+        ('NDB Release Date', str),
+        ('Authors', str),
+        ('Initial Deposition Date', str)
+    )
+
+    def __init__(self, report: dict = None):
         """Default constructor
 
         :param report: report dict to make report (default value = None)
         :type report: dict"""
-        super().__init__()
-        self._update({
-            'PDB ID': '',
-            'Title': '',
-            'NDB Release Date': '',
-            'Authors': '',
-            'Initial Deposition Date': ''
-        })
-        if report:
-            self._update(report)
+        super().__init__(report)
 
     @staticmethod
     def report_type() -> str:
@@ -263,7 +407,7 @@ class NDBStatusReport(_AdvancedBaseReport):
         :return: PDB ID
         :rtype: str
         """
-        return self._report['PDB ID']
+        return self._get('PDB ID')
 
     @property
     def title(self) -> str:
@@ -272,7 +416,7 @@ class NDBStatusReport(_AdvancedBaseReport):
         :return: title
         :rtype: str
         """
-        return self._report['Title']
+        return self._get('Title')
 
     @property
     def release_date(self) -> str:
@@ -281,7 +425,7 @@ class NDBStatusReport(_AdvancedBaseReport):
         :return: release date
         :rtype: str
         """
-        return self._report['NDB Release Date']
+        return self._get('NDB Release Date')
 
     @property
     def deposition_date(self) -> str:
@@ -290,7 +434,7 @@ class NDBStatusReport(_AdvancedBaseReport):
         :return: initial deposition date
         :rtype: str
         """
-        return self._report['Initial Deposition Date']
+        return self._get('Initial Deposition Date')
 
     @property
     def authors(self) -> str:
@@ -299,7 +443,7 @@ class NDBStatusReport(_AdvancedBaseReport):
         :return: authors
         :rtype: str
         """
-        return self._report['Authors']
+        return self._get('Authors')
 
     def download(self, download_type: DownloadType = DownloadType.Pdb, save: bool = False, target_dir: str = '') -> str:
         """Download PDB from NDB
@@ -323,24 +467,23 @@ class NDBStatusReport(_AdvancedBaseReport):
 
 class CellDimensionsReport(_AdvancedBaseReport):
     """Class for cell dimensions search report extending _AdvancedBaseReport"""
+    __slots__ = ()
+    _schema = _AdvancedBaseReport._schema.extend(
+        ('Length A', float),
+        ('Length B', float),
+        ('Length C', float),
+        ('Angle Alpha', float),
+        ('Angle Beta', float),
+        ('Angle Gamma', float),
+        ('Space Group', str)
+    )
 
     def __init__(self, report: dict = None):
         """Default constructor
 
         :param report: report dict to make report (default value = None)
         :type report: dict"""
-        super().__init__()
-        self._update({
-            'Length A': 0,
-            'Length B': 0,
-            'Length C': 0,
-            'Angle Alpha': 0,
-            'Angle Beta': 0,
-            'Angle Gamma': 0,
-            'Space Group': ''
-        })
-        if report:
-            self._update(_assign_numbers(report))
+        super().__init__(report)
 
     @staticmethod
     def report_type() -> str:
@@ -353,7 +496,7 @@ class CellDimensionsReport(_AdvancedBaseReport):
         :return: cell a
         :rtype: float
         """
-        return self._report['Length A']
+        return self._get('Length A')
 
     @property
     def cell_b(self) -> float:
@@ -362,7 +505,7 @@ class CellDimensionsReport(_AdvancedBaseReport):
         :return: cell b
         :rtype: float
         """
-        return self._report['Length B']
+        return self._get('Length B')
 
     @property
     def cell_c(self) -> float:
@@ -371,7 +514,7 @@ class CellDimensionsReport(_AdvancedBaseReport):
         :return: cell c
         :rtype: float
         """
-        return self._report['Length C']
+        return self._get('Length C')
 
     @property
     def cell_alpha(self) -> float:
@@ -380,7 +523,7 @@ class CellDimensionsReport(_AdvancedBaseReport):
         :return: alpha
         :rtype: float
         """
-        return self._report['Angle Alpha']
+        return self._get('Angle Alpha')
 
     @property
     def cell_beta(self) -> float:
@@ -389,7 +532,7 @@ class CellDimensionsReport(_AdvancedBaseReport):
         :return: beta
         :rtype: float
         """
-        return self._report['Angle Beta']
+        return self._get('Angle Beta')
 
     @property
     def cell_gamma(self) -> float:
@@ -398,7 +541,7 @@ class CellDimensionsReport(_AdvancedBaseReport):
         :return: gamma
         :rtype: float
         """
-        return self._report['Angle Gamma']
+        return self._get('Angle Gamma')
 
     @property
     def space_group(self) -> str:
@@ -407,7 +550,7 @@ class CellDimensionsReport(_AdvancedBaseReport):
         :return: space group
         :rtype: float
         """
-        return self._report['Space Group']
+        return self._get('Space Group')
 
     def download(self, download_type: DownloadType = DownloadType.Pdb, save: bool = False, target_dir: str = '') -> str:
         """NOT WORKS ON THIS REPORT TYPE"""
@@ -416,22 +559,22 @@ class CellDimensionsReport(_AdvancedBaseReport):
 
 class CitationReport(_AdvancedBaseReport):
     """Class for citation search report extending _AdvancedBaseReport"""
+    __slots__ = ()
+    _schema = _AdvancedBaseReport._schema.extend(
+        ('PDB ID', str),
+        ('Citation Title', str),
+        ('Citation Authors', str),
+        ('Journal', str),
+        ('Pubmed ID', str),
+        ('Year', int)
+    )
+
     def __init__(self, report: dict = None):
         """Default constructor
 
         :param report: report dict to make report (default value = None)
         :type report: dict"""
-        super().__init__()
-        self._update({
-            'PDB ID': '',
-            'Citation Title': '',
-            'Citation Authors': '',
-            'Journal': '',
-            'Pubmed ID': '',
-            'Year': 0
-        })
-        if report:
-            self._update(_assign_numbers(report))
+        super().__init__(report)
 
     @staticmethod
     def report_type() -> str:
@@ -444,7 +587,7 @@ class CitationReport(_AdvancedBaseReport):
         :return: PDB ID
         :rtype: str
         """
-        return self._report['PDB ID']
+        return self._get('PDB ID')
 
     @property
     def citation_title(self) -> str:
@@ -453,7 +596,7 @@ class CitationReport(_AdvancedBaseReport):
         :return: citation title
         :rtype: str
         """
-        return self._report['Citation Title']
+        return self._get('Citation Title')
 
     @property
     def citation_authors(self) -> str:
@@ -462,7 +605,7 @@ class CitationReport(_AdvancedBaseReport):
         :return: citation authors
         :rtype: str
         """
-        return self._report['Citation Authors']
+        return self._get('Citation Authors')
 
     @property
     def journal(self) -> str:
@@ -471,7 +614,7 @@ class CitationReport(_AdvancedBaseReport):
         :return: Journal
         :rtype: str
         """
-        return self._report['Journal']
+        return self._get('Journal')
 
     @property
     def pubmed_id(self) -> str:
@@ -480,7 +623,7 @@ class CitationReport(_AdvancedBaseReport):
         :return: PDB ID
         :rtype: str
         """
-        return self._report['Pubmed ID']
+        return self._get('Pubmed ID')
 
     @property
     def year(self) -> int:
@@ -489,7 +632,7 @@ class CitationReport(_AdvancedBaseReport):
         :return: year
         :rtype: int
         """
-        return self._report['Year']
+        return self._get('Year')
 
     def download(self, download_type: DownloadType = DownloadType.Pdb, save: bool = False, target_dir: str = '') -> str:
         """Download PDB from NDB
@@ -513,23 +656,23 @@ class CitationReport(_AdvancedBaseReport):
 
 class RefinementDataReport(_AdvancedBaseReport):
     """Class for refinement data search report extending _AdvancedBaseReport"""
+    __slots__ = ()
+    _schema = _AdvancedBaseReport._schema.extend(
+        ('R-value_work', float),
+        ('R-value_obs', float),
+        ('R-value_free', float),
+        ('Higher Resolution Limit', float),
+        ('Lower Resolution Limit', float),
+        ('Reflections Observed', int),
+        ('Structure Refinement', str)
+    )
+
     def __init__(self, report: dict = None):
         """Default constructor
 
         :param report: report dict to make report (default value = None)
         :type report: dict"""
-        super().__init__()
-        self._update({
-            'R-value_work': 0,
-            'R-value_obs': 0,
-            'R-value_free': 0,
-            'Higher Resolution Limit': 0,
-            'Lower Resolution Limit': 0,
-            'Reflections Observed': 0,
-            'Structure Refinement': ''
-        })
-        if report:
-            self._update(_assign_numbers(report))
+        super().__init__(report)
 
     @staticmethod
     def report_type() -> str:
@@ -542,7 +685,7 @@ class RefinementDataReport(_AdvancedBaseReport):
         :return: r work
         :rtype: float
         """
-        return self._report['R-value_work']
+        return self._get('R-value_work')
 
     @property
     def r_obs(self) -> float:
@@ -551,7 +694,7 @@ class RefinementDataReport(_AdvancedBaseReport):
         :return: r obs
         :rtype: float
         """
-        return self._report['R-value_obs']
+        return self._get('R-value_obs')
 
     @property
     def r_free(self) -> float:
@@ -560,7 +703,7 @@ class RefinementDataReport(_AdvancedBaseReport):
         :return: r free
         :rtype: float
         """
-        return self._report['R-value_free']
+        return self._get('R-value_free')
 
     @property
     def higher_resolution(self) -> float:
@@ -569,7 +712,7 @@ class RefinementDataReport(_AdvancedBaseReport):
         :return: higher resolution limit
         :rtype: float
         """
-        return self._report['Higher Resolution Limit']
+        return self._get('Higher Resolution Limit')
 
     @property
     def lower_resolution(self) -> float:
@@ -578,7 +721,7 @@ class RefinementDataReport(_AdvancedBaseReport):
         :return: lower resolution limit
         :rtype: float
         """
-        return self._report['Lower Resolution Limit']
+        return self._get('Lower Resolution Limit')
 
     @property
     def reflections(self) -> int:
@@ -587,7 +730,7 @@ class RefinementDataReport(_AdvancedBaseReport):
         :return: reflections observed
         :rtype: int
         """
-        return self._report['Reflections Observed']
+        return self._get('Reflections Observed')
 
     @property
     def structure_ref(self) -> str:
@@ -596,7 +739,7 @@ class RefinementDataReport(_AdvancedBaseReport):
         :return: structure refinement
         :rtype: str
         """
-        return self._report['Structure Refinement']
+        return self._get('Structure Refinement')
 
     def download(self, download_type: DownloadType = DownloadType.Pdb, save: bool = False, target_dir: str = '') -> str:
         """NOT WORKS ON THIS REPORT TYPE"""
@@ -605,27 +748,27 @@ class RefinementDataReport(_AdvancedBaseReport):
 
 class NABackboneTorsionReport(_AdvancedBaseReport):
     """Class for refinement data search report extending _AdvancedBaseReport"""
+    __slots__ = ()
+    _schema = _AdvancedBaseReport._schema.extend(
+        ('Model ID', str),
+        ('Chain ID', str),
+        ('Residue Num', int),
+        ('Residue Name', str),
+        ("O3'-P-O5'-C5'", float),
+        ("P-O5'-C5'-C4'", float),
+        ("O5'-C5'-C4'-C3'", float),
+        ("C5'-C4'-C3'-O3'", float),
+        ("C4'-C3'-O3'-P", float),
+        ("C3'-O3'-P-O5'", float),
+        ("O4'-C1'-N1-9-C2-4", float)
+    )
+
     def __init__(self, report: dict = None):
         """Default constructor
 
         :param report: report dict to make report (default value = None)
         :type report: dict"""
-        super().__init__()
-        self._update({
-            'Model ID': '',
-            'Chain ID': '',
-            'Residue Num': 0,
-            'Residue Name': '',
-            "O3'-P-O5'-C5": 0,
-            "P-O5'-C5'-C4'": 0,
-            "O5'-C5'-C4'-C3'": 0,
-            "C5'-C4'-C3'-O3'": 0,
-            "C4'-C3'-O3'-P": 0,
-            "C3'-O3'-P-O5'": 0,
-            "O4'-C1'-N1-9-C2-4": 0
-        })
-        if report:
-            self._update(_assign_numbers(report))
+        super().__init__(report)
 
     @staticmethod
     def report_type() -> str:
@@ -638,7 +781,7 @@ class NABackboneTorsionReport(_AdvancedBaseReport):
         :return: model ID
         :rtype: str
         """
-        return self._report['Model ID']
+        return self._get('Model ID')
 
     @property
     def chain_id(self) -> str:
@@ -647,7 +790,7 @@ class NABackboneTorsionReport(_AdvancedBaseReport):
         :return: chain ID
         :rtype: str
         """
-        return self._report['Chain ID']
+        return self._get('Chain ID')
 
     @property
     def residue_number(self) -> int:
@@ -656,7 +799,7 @@ class NABackboneTorsionReport(_AdvancedBaseReport):
         :return: residue number
         :rtype: int
         """
-        return self._report['Residue Num']
+        return self._get('Residue Num')
 
     @property
     def residue_name(self) -> str:
@@ -665,7 +808,7 @@ class NABackboneTorsionReport(_AdvancedBaseReport):
         :return: residue name
         :rtype: str
         """
-        return self._report['Residue Name']
+        return self._get('Residue Name')
 
     @property
     def o3_p_o5_c5(self) -> float:
@@ -674,7 +817,7 @@ class NABackboneTorsionReport(_AdvancedBaseReport):
         :return: O3'-P-O5'-C5'
         :rtype: float
         """
-        return self._report["O3'-P-O5'-C5'"]
+        return self._get("O3'-P-O5'-C5'")
 
     @property
     def p_o5_c5_c4(self) -> float:
@@ -683,7 +826,7 @@ class NABackboneTorsionReport(_AdvancedBaseReport):
         :return: P-O5'-C5'-C4'
         :rtype: float
         """
-        return self._report["P-O5'-C5'-C4'"]
+        return self._get("P-O5'-C5'-C4'")
 
     @property
     def o5_c5_c4_c3(self) -> float:
@@ -692,7 +835,7 @@ class NABackboneTorsionReport(_AdvancedBaseReport):
         :return: O5'-C5'-C4'-C3'
         :rtype: float
         """
-        return self._report["O5'-C5'-C4'-C3'"]
+        return self._get("O5'-C5'-C4'-C3'")
 
     @property
     def c5_c4_c3_o3(self) -> float:
@@ -701,7 +844,7 @@ class NABackboneTorsionReport(_AdvancedBaseReport):
         :return: C5'-C4'-C3'-O3'
         :rtype: float
         """
-        return self._report["C5'-C4'-C3'-O3'"]
+        return self._get("C5'-C4'-C3'-O3'")
 
     @property
     def c4_c3_o3_p(self) -> float:
@@ -710,7 +853,7 @@ class NABackboneTorsionReport(_AdvancedBaseReport):
         :return: C4'-C3'-O3'-P
         :rtype: float
         """
-        return self._report["C4'-C3'-O3'-P"]
+        return self._get("C4'-C3'-O3'-P")
 
     @property
     def c3_o3_p_o5(self) -> float:
@@ -719,7 +862,7 @@ class NABackboneTorsionReport(_AdvancedBaseReport):
         :return: C3'-O3'-P-O5'
         :rtype: float
         """
-        return self._report["C3'-O3'-P-O5'"]
+        return self._get("C3'-O3'-P-O5'")
 
     @property
     def o4_c1_n1_9_c2_4(self) -> float:
@@ -728,7 +871,7 @@ class NABackboneTorsionReport(_AdvancedBaseReport):
         :return: O4'-C1'-N1-9-C2-4
         :rtype: float
         """
-        return self._report["O4'-C1'-N1-9-C2-4"]
+        return self._get("O4'-C1'-N1-9-C2-4")
 
     def download(self, download_type: DownloadType = DownloadType.Pdb, save: bool = False, target_dir: str = '') -> str:
         """NOT WORKS ON THIS REPORT TYPE"""
@@ -737,25 +880,25 @@ class NABackboneTorsionReport(_AdvancedBaseReport):
 
 class BasePairParameterReport(_AdvancedBaseReport):
     """Class for base pair parameter search report extending _AdvancedBaseReport"""
+    __slots__ = ()
+    _schema = _AdvancedBaseReport._schema.extend(
+        ('Model Number', int),
+        ('Pair Number', int),
+        ('Pair Name', str),
+        ('Shear', float),
+        ('Stretch', float),
+        ('Stagger', float),
+        ('Buckle', float),
+        ('Propellor', float),
+        ('Opening', float)
+    )
+
     def __init__(self, report: dict = None):
         """Default constructor
 
         :param report: report dict to make report (default value = None)
         :type report: dict"""
-        super().__init__()
-        self._update({
-            'Model Number': 0,
-            'Pair Number': 0,
-            'Pair Name': '',
-            'Shear': 0,
-            'Stretch': 0,
-            'Stagger': 0,
-            'Buckle': 0,
-            'Propellor': 0,
-            'Opening': 0
-        })
-        if report:
-            self._update(_assign_numbers(report))
+        super().__init__(report)
 
     @staticmethod
     def report_type() -> str:
@@ -768,7 +911,7 @@ class BasePairParameterReport(_AdvancedBaseReport):
         :return: model number
         :rtype: int
         """
-        return self._report['Model Number']
+        return self._get('Model Number')
 
     @property
     def pair_num(self) -> int:
@@ -777,7 +920,7 @@ class BasePairParameterReport(_AdvancedBaseReport):
         :return: pair number
         :rtype: int
         """
-        return self._report['Pair Number']
+        return self._get('Pair Number')
 
     @property
     def pair_name(self) -> str:
@@ -786,7 +929,7 @@ class BasePairParameterReport(_AdvancedBaseReport):
         :return: pair name
         :rtype: str
         """
-        return self._report['Pair Name']
+        return self._get('Pair Name')
 
     @property
     def shear(self) -> float:
@@ -795,7 +938,7 @@ class BasePairParameterReport(_AdvancedBaseReport):
         :return: shear
         :rtype: float
         """
-        return self._report['Shear']
+        return self._get('Shear')
 
     @property
     def stretch(self) -> float:
@@ -804,7 +947,7 @@ class BasePairParameterReport(_AdvancedBaseReport):
         :return: stretch
         :rtype: float
         """
-        return self._report['Stretch']
+        return self._get('Stretch')
 
     @property
     def stagger(self) -> float:
@@ -813,7 +956,7 @@ class BasePairParameterReport(_AdvancedBaseReport):
         :return: stagger
         :rtype: float
         """
-        return self._report['Stagger']
+        return self._get('Stagger')
 
     @property
     def buckle(self) -> float:
@@ -822,7 +965,7 @@ class BasePairParameterReport(_AdvancedBaseReport):
         :return: buckle
         :rtype: float
         """
-        return self._report['Buckle']
+        return self._get('Buckle')
 
     @property
     def propellor(self) -> float:
@@ -831,7 +974,7 @@ class BasePairParameterReport(_AdvancedBaseReport):
         :return: propellor
         :rtype: float
         """
-        return self._report['Propellor']
+        return self._get('Propellor')
 
     @property
     def opening(self) -> float:
@@ -840,7 +983,7 @@ class BasePairParameterReport(_AdvancedBaseReport):
         :return: opening
         :rtype: float
         """
-        return self._report['Opening']
+        return self._get('Opening')
 
     def download(self, download_type: DownloadType = DownloadType.Pdb, save: bool = False, target_dir: str = '') -> str:
         """NOT WORKS ON THIS REPORT TYPE"""
@@ -849,31 +992,31 @@ class BasePairParameterReport(_AdvancedBaseReport):
 
 class BasePairStepParameterReport(_AdvancedBaseReport):
     """Class for base pair parameter search report extending _AdvancedBaseReport"""
+    __slots__ = ()
+    _schema = _AdvancedBaseReport._schema.extend(
+        ('Model Number', int),
+        ('Step Number', int),
+        ('Step Name', str),
+        ('Shift', float),
+        ('Slide', float),
+        ('Rise', float),
+        ('Tilt', float),
+        ('Roll', float),
+        ('Twist', float),
+        ('X-Displacement', float),
+        ('Y-Displacement', float),
+        ('Helical Rise', float),
+        ('Inclination', float),
+        ('Tip', float),
+        ('Helical Twist', float)
+    )
+
     def __init__(self, report: dict = None):
         """Default constructor
 
         :param report: report dict to make report (default value = None)
         :type report: dict"""
-        super().__init__()
-        self._update({
-            'Model Number': 0,
-            'Step Number': 0,
-            'Step Name': '',
-            'Shift': 0,
-            'Slide': 0,
-            'Rise': 0,
-            'Tilt': 0,
-            'Roll': 0,
-            'Twist': 0,
-            'X-Displacement': 0,
-            'Y-Displacement': 0,
-            'Helical Rise': 0,
-            'Inclination': 0,
-            'Tip': 0,
-            'Helical Twist': 0
-        })
-        if report:
-            self._update(_assign_numbers(report))
+        super().__init__(report)
 
     @staticmethod
     def report_type() -> str:
@@ -886,7 +1029,7 @@ class BasePairStepParameterReport(_AdvancedBaseReport):
         :return: model number
         :rtype: int
         """
-        return self._report['Model Number']
+        return self._get('Model Number')
 
     @property
     def step_num(self) -> int:
@@ -895,7 +1038,7 @@ class BasePairStepParameterReport(_AdvancedBaseReport):
         :return: step number
         :rtype: int
         """
-        return self._report['Step Number']
+        return self._get('Step Number')
 
     @property
     def step_name(self) -> str:
@@ -904,7 +1047,7 @@ class BasePairStepParameterReport(_AdvancedBaseReport):
         :return: step name
         :rtype: str
         """
-        return self._report['Step Name']
+        return self._get('Step Name')
 
     @property
     def shift(self) -> float:
@@ -913,7 +1056,7 @@ class BasePairStepParameterReport(_AdvancedBaseReport):
         :return: shift
         :rtype: float
         """
-        return self._report['Shift']
+        return self._get('Shift')
 
     @property
     def slide(self) -> float:
@@ -922,7 +1065,7 @@ class BasePairStepParameterReport(_AdvancedBaseReport):
         :return: slide
         :rtype: float
         """
-        return self._report['Slide']
+        return self._get('Slide')
 
     @property
     def rise(self) -> float:
@@ -931,7 +1074,7 @@ class BasePairStepParameterReport(_AdvancedBaseReport):
         :return: rise
         :rtype: float
         """
-        return self._report['Rise']
+        return self._get('Rise')
 
     @property
     def tilt(self) -> float:
@@ -940,7 +1083,7 @@ class BasePairStepParameterReport(_AdvancedBaseReport):
         :return: tilt
         :rtype: float
         """
-        return self._report['Tilt']
+        return self._get('Tilt')
 
     @property
     def roll(self) -> float:
@@ -949,7 +1092,7 @@ class BasePairStepParameterReport(_AdvancedBaseReport):
         :return: roll
         :rtype: float
         """
-        return self._report['Roll']
+        return self._get('Roll')
 
     @property
     def x_disp(self) -> float:
@@ -958,7 +1101,7 @@ class BasePairStepParameterReport(_AdvancedBaseReport):
         :return: x displacement
         :rtype: float
         """
-        return self._report['X-Displacement']
+        return self._get('X-Displacement')
 
     @property
     def y_disp(self) -> float:
@@ -967,7 +1110,7 @@ class BasePairStepParameterReport(_AdvancedBaseReport):
         :return: x displacement
         :rtype: float
         """
-        return self._report['Y-Displacement']
+        return self._get('Y-Displacement')
 
     @property
     def helical_rise(self) -> float:
@@ -976,7 +1119,7 @@ class BasePairStepParameterReport(_AdvancedBaseReport):
         :return: helical rise
         :rtype: float
         """
-        return self._report['Helical Rise']
+        return self._get('Helical Rise')
 
     @property
     def inclination(self) -> float:
@@ -985,7 +1128,7 @@ class BasePairStepParameterReport(_AdvancedBaseReport):
         :return: inclination
         :rtype: float
         """
-        return self._report['Inclination']
+        return self._get('Inclination')
 
     @property
     def tip(self) -> float:
@@ -994,7 +1137,7 @@ class BasePairStepParameterReport(_AdvancedBaseReport):
         :return: tip
         :rtype: float
         """
-        return self._report['Tip']
+        return self._get('Tip')
 
     @property
     def helical_twist(self) -> float:
@@ -1003,7 +1146,7 @@ class BasePairStepParameterReport(_AdvancedBaseReport):
         :return: helical twist
         :rtype: float
         """
-        return self._report['Helical Twist']
+        return self._get('Helical Twist')
 
     def download(self, download_type: DownloadType = DownloadType.Pdb, save: bool = False, target_dir: str = '') -> str:
         """NOT WORKS ON THIS REPORT TYPE"""
@@ -1012,17 +1155,17 @@ class BasePairStepParameterReport(_AdvancedBaseReport):
 
 class DescriptorReport(_AdvancedBaseReport):
     """Class for descriptor search report extending _AdvancedBaseReport"""
+    __slots__ = ()
+    _schema = _AdvancedBaseReport._schema.extend(
+        ('Structure Description', str)
+    )
+
     def __init__(self, report: dict = None):
         """Default constructor
 
         :param report: report dict to make report (default value = None)
         :type report: dict"""
-        super().__init__()
-        self._update({
-            'Structure Description': '',
-        })
-        if report:
-            self._update(report)
+        super().__init__(report)
 
     @staticmethod
     def report_type() -> str:
@@ -1035,7 +1178,7 @@ class DescriptorReport(_AdvancedBaseReport):
         :return: description
         :rtype: str
         """
-        return self._report['Structure Description']
+        return self._get('Structure Description')
 
     def download(self, download_type: DownloadType = DownloadType.Pdb, save: bool = False, target_dir: str = '') -> str:
         """NOT WORKS ON THIS REPORT TYPE"""
@@ -1044,18 +1187,18 @@ class DescriptorReport(_AdvancedBaseReport):
 
 class SequencesReport(_AdvancedBaseReport):
     """Class for sequences search report extending _AdvancedBaseReport"""
+    __slots__ = ()
+    _schema = _AdvancedBaseReport._schema.extend(
+        ('NA Sequence', str),
+        ('Structure Description', str)
+    )
+
     def __init__(self, report: dict = None):
         """Default constructor
 
         :param report: report dict to make report (default value = None)
         :type report: dict"""
-        super().__init__()
-        self._update({
-            'NA Sequence': '',
-            'Structure Description': '',
-        })
-        if report:
-            self._update(report)
+        super().__init__(report)
 
     @staticmethod
     def report_type() -> str:
@@ -1068,7 +1211,7 @@ class SequencesReport(_AdvancedBaseReport):
         :return: sequence
         :rtype: str
         """
-        return self._report['NA Sequence']
+        return self._get('NA Sequence')
 
     @property
     def description(self) -> str:
@@ -1077,7 +1220,7 @@ class SequencesReport(_AdvancedBaseReport):
         :return: description
         :rtype: str
         """
-        return self._report['Structure Description']
+        return self._get('Structure Description')
 
     def download(self, download_type: DownloadType = DownloadType.Pdb, save: bool = False, target_dir: str = '') -> str:
         """NOT WORKS ON THIS REPORT TYPE"""
@@ -1086,6 +1229,8 @@ class SequencesReport(_AdvancedBaseReport):
 
 class StatisticReport(object):
     """Class for statistic search report"""
+    __slots__ = ('_stats',)
+
     def __init__(self, report: dict = None):
         """Default constructor
 
@@ -1105,29 +1250,29 @@ class StatisticReport(object):
 
 class RNA3DBasePairRelFreqReport(_AdvancedBaseReport):
     """Class for RNA 3D Base Pair Relative Frequency Report search report extending _AdvancedBaseReport"""
+    __slots__ = ()
+    _schema = _AdvancedBaseReport._schema.extend(
+        ('PDB ID', str),
+        ('Relative cWW', float),
+        ('Relative tWW', float),
+        ('Relative cWH', float),
+        ('Relative tWH', float),
+        ('Relative cWS', float),
+        ('Relative tWS', float),
+        ('Relative cHH', float),
+        ('Relative tHH', float),
+        ('Relative cHS', float),
+        ('Relative tHS', float),
+        ('Relative cSS', float),
+        ('Relative tSS', float)
+    )
+
     def __init__(self, report: dict = None):
         """Default constructor
 
         :param report: report dict to make report (default value = None)
         :type report: dict"""
-        super().__init__()
-        self._update({
-            'PDB ID': '',
-            'Relative cWW': 0,
-            'Relative tWW': 0,
-            'Relative cWH': 0,
-            'Relative tWH': 0,
-            'Relative cWS': 0,
-            'Relative tWS': 0,
-            'Relative cHH': 0,
-            'Relative tHH': 0,
-            'Relative cHS': 0,
-            'Relative tHS': 0,
-            'Relative cSS': 0,
-            'Relative tSS': 0
-        })
-        if report:
-            self._update(_assign_numbers(report))
+        super().__init__(report)
 
     @staticmethod
     def report_type() -> str:
@@ -1140,7 +1285,7 @@ class RNA3DBasePairRelFreqReport(_AdvancedBaseReport):
         :return: PDB ID
         :rtype: str
         """
-        return self._report['PDB ID']
+        return self._get('PDB ID')
 
     @property
     def cww(self) -> float:
@@ -1149,7 +1294,7 @@ class RNA3DBasePairRelFreqReport(_AdvancedBaseReport):
         :return: relative cWW
         :rtype: float
         """
-        return self._report['Relative cWW']
+        return self._get('Relative cWW')
 
     @property
     def tww(self) -> float:
@@ -1158,7 +1303,7 @@ class RNA3DBasePairRelFreqReport(_AdvancedBaseReport):
         :return: relative tWW
         :rtype: float
         """
-        return self._report['Relative tWW']
+        return self._get('Relative tWW')
 
     @property
     def cwh(self) -> float:
@@ -1167,7 +1312,7 @@ class RNA3DBasePairRelFreqReport(_AdvancedBaseReport):
         :return: relative qWH
         :rtype: float
         """
-        return self._report['Relative cWH']
+        return self._get('Relative cWH')
 
     @property
     def twh(self) -> float:
@@ -1176,7 +1321,7 @@ class RNA3DBasePairRelFreqReport(_AdvancedBaseReport):
         :return: relative tWH
         :rtype: float
         """
-        return self._report['Relative tWH']
+        return self._get('Relative tWH')
 
     @property
     def cws(self) -> float:
@@ -1185,7 +1330,7 @@ class RNA3DBasePairRelFreqReport(_AdvancedBaseReport):
         :return: relative cWS
         :rtype: float
         """
-        return self._report['Relative cWS']
+        return self._get('Relative cWS')
 
     @property
     def tws(self) -> float:
@@ -1194,7 +1339,7 @@ class RNA3DBasePairRelFreqReport(_AdvancedBaseReport):
         :return: relative tWS
         :rtype: float
         """
-        return self._report['Relative tWS']
+        return self._get('Relative tWS')
 
     @property
     def chh(self) -> float:
@@ -1203,7 +1348,7 @@ class RNA3DBasePairRelFreqReport(_AdvancedBaseReport):
         :return: relative cHH
         :rtype: float
         """
-        return self._report['Relative cHH']
+        return self._get('Relative cHH')
 
     @property
     def thh(self) -> float:
@@ -1212,7 +1357,7 @@ class RNA3DBasePairRelFreqReport(_AdvancedBaseReport):
         :return: relative tHH
         :rtype: float
         """
-        return self._report['Relative tHH']
+        return self._get('Relative tHH')
 
     @property
     def chs(self) -> float:
@@ -1221,7 +1366,7 @@ class RNA3DBasePairRelFreqReport(_AdvancedBaseReport):
         :return: relative cHS
         :rtype: float
         """
-        return self._report['Relative cHS']
+        return self._get('Relative cHS')
 
     @property
     def ths(self) -> float:
@@ -1230,7 +1375,7 @@ class RNA3DBasePairRelFreqReport(_AdvancedBaseReport):
         :return: relative tHS
         :rtype: float
         """
-        return self._report['Relative tHS']
+        return self._get('Relative tHS')
 
     @property
     def css(self) -> float:
@@ -1239,7 +1384,7 @@ class RNA3DBasePairRelFreqReport(_AdvancedBaseReport):
         :return: relative cSS
         :rtype: float
         """
-        return self._report['Relative cSS']
+        return self._get('Relative cSS')
 
     @property
     def tss(self) -> float:
@@ -1248,7 +1393,7 @@ class RNA3DBasePairRelFreqReport(_AdvancedBaseReport):
         :return: relative tWS
         :rtype: float
         """
-        return self._report['Relative tSS']
+        return self._get('Relative tSS')
 
     def download(self, download_type: DownloadType = DownloadType.Pdb, save: bool = False, target_dir: str = '') -> str:
         """Download PDB from NDB
@@ -1272,27 +1417,27 @@ class RNA3DBasePairRelFreqReport(_AdvancedBaseReport):
 
 class RNA3DBasePhosphateRelFreqReport(_AdvancedBaseReport):
     """Class for RNA 3D Base Phosphate Relative Frequency Report search report extending _AdvancedBaseReport"""
+    __slots__ = ()
+    _schema = _AdvancedBaseReport._schema.extend(
+        ('PDB ID', str),
+        ('Relative 1BPh', float),
+        ('Relative 2BPh', float),
+        ('Relative 3BPh', float),
+        ('Relative 4BPh', float),
+        ('Relative 5BPh', float),
+        ('Relative 6BPh', float),
+        ('Relative 7BPh', float),
+        ('Relative 8BPh', float),
+        ('Relative 9BPh', float),
+        ('Relative 0BPh', float)
+    )
+
     def __init__(self, report: dict = None):
         """Default constructor
 
         :param report: report dict to make report (default value = None)
         :type report: dict"""
-        super().__init__()
-        self._update({
-            'PDB ID': '',
-            'Relative 1BPh': 0,
-            'Relative 2BPh': 0,
-            'Relative 3BPh': 0,
-            'Relative 4BPh': 0,
-            'Relative 5BPh': 0,
-            'Relative 6BPh': 0,
-            'Relative 7BPh': 0,
-            'Relative 8BPh': 0,
-            'Relative 9BPh': 0,
-            'Relative 0BPh': 0
-        })
-        if report:
-            self._update(_assign_numbers(report))
+        super().__init__(report)
 
     @staticmethod
     def report_type() -> str:
@@ -1305,7 +1450,7 @@ class RNA3DBasePhosphateRelFreqReport(_AdvancedBaseReport):
         :return: PDB ID
         :rtype: str
         """
-        return self._report['PDB ID']
+        return self._get('PDB ID')
 
     @property
     def bph_1(self) -> float:
@@ -1314,7 +1459,7 @@ class RNA3DBasePhosphateRelFreqReport(_AdvancedBaseReport):
         :return: relative 1BPh
         :rtype: float
         """
-        return self._report['Relative 1BPh']
+        return self._get('Relative 1BPh')
 
     @property
     def bph_2(self) -> float:
@@ -1323,7 +1468,7 @@ class RNA3DBasePhosphateRelFreqReport(_AdvancedBaseReport):
         :return: relative 2BPh
         :rtype: float
         """
-        return self._report['Relative 2BPh']
+        return self._get('Relative 2BPh')
 
     @property
     def bph_3(self) -> float:
@@ -1332,7 +1477,7 @@ class RNA3DBasePhosphateRelFreqReport(_AdvancedBaseReport):
         :return: relative 3BPh
         :rtype: float
         """
-        return self._report['Relative 3BPh']
+        return self._get('Relative 3BPh')
 
     @property
     def bph_4(self) -> float:
@@ -1341,7 +1486,7 @@ class RNA3DBasePhosphateRelFreqReport(_AdvancedBaseReport):
         :return: relative 4BPh
         :rtype: float
         """
-        return self._report['Relative 4BPh']
+        return self._get('Relative 4BPh')
 
     @property
     def bph_5(self) -> float:
@@ -1350,7 +1495,7 @@ class RNA3DBasePhosphateRelFreqReport(_AdvancedBaseReport):
         :return: relative 5BPh
         :rtype: float
         """
-        return self._report['Relative 5BPh']
+        return self._get('Relative 5BPh')
 
     @property
     def bph_6(self) -> float:
@@ -1359,7 +1504,7 @@ class RNA3DBasePhosphateRelFreqReport(_AdvancedBaseReport):
         :return: relative 6BPh
         :rtype: float
         """
-        return self._report['Relative 6BPh']
+        return self._get('Relative 6BPh')
 
     @property
     def bph_7(self) -> float:
@@ -1368,7 +1513,7 @@ class RNA3DBasePhosphateRelFreqReport(_AdvancedBaseReport):
         :return: relative 7BPh
         :rtype: float
         """
-        return self._report['Relative 7BPh']
+        return self._get('Relative 7BPh')
 
     @property
     def bph_8(self) -> float:
@@ -1377,7 +1522,7 @@ class RNA3DBasePhosphateRelFreqReport(_AdvancedBaseReport):
         :return: relative 8BPh
         :rtype: float
         """
-        return self._report['Relative 8BPh']
+        return self._get('Relative 8BPh')
 
     @property
     def bph_9(self) -> float:
@@ -1386,7 +1531,7 @@ class RNA3DBasePhosphateRelFreqReport(_AdvancedBaseReport):
         :return: relative 9BPh
         :rtype: float
         """
-        return self._report['Relative 9BPh']
+        return self._get('Relative 9BPh')
 
     @property
     def bph_0(self) -> float:
@@ -1395,7 +1540,7 @@ class RNA3DBasePhosphateRelFreqReport(_AdvancedBaseReport):
         :return: relative 0BPh
         :rtype: float
         """
-        return self._report['Relative 0BPh']
+        return self._get('Relative 0BPh')
 
     def download(self, download_type: DownloadType = DownloadType.Pdb, save: bool = False, target_dir: str = '') -> str:
         """Download PDB from NDB
@@ -1419,20 +1564,20 @@ class RNA3DBasePhosphateRelFreqReport(_AdvancedBaseReport):
 
 class RNA3DBaseStackingRelFreqReport(_AdvancedBaseReport):
     """Class for RNA 3D Base Stacking Relative Frequency Report search report extending _AdvancedBaseReport"""
+    __slots__ = ()
+    _schema = _AdvancedBaseReport._schema.extend(
+        ('PDB ID', str),
+        ('Relative s33', float),
+        ('Relative s53', float),
+        ('Relative s55', float)
+    )
+
     def __init__(self, report: dict = None):
         """Default constructor
 
         :param report: report dict to make report (default value = None)
         :type report: dict"""
-        super().__init__()
-        self._update({
-            'PDB ID': '',
-            'Relative s33': 0,
-            'Relative s53': 0,
-            'Relative s55': 0
-        })
-        if report:
-            self._update(_assign_numbers(report))
+        super().__init__(report)
 
     @staticmethod
     def report_type() -> str:
@@ -1445,7 +1590,7 @@ class RNA3DBaseStackingRelFreqReport(_AdvancedBaseReport):
         :return: PDB ID
         :rtype: str
         """
-        return self._report['PDB ID']
+        return self._get('PDB ID')
 
     @property
     def s33(self) -> float:
@@ -1454,7 +1599,7 @@ class RNA3DBaseStackingRelFreqReport(_AdvancedBaseReport):
         :return: relative s33
         :rtype: float
         """
-        return self._report['Relative s33']
+        return self._get('Relative s33')
 
     @property
     def s53(self) -> float:
@@ -1463,7 +1608,7 @@ class RNA3DBaseStackingRelFreqReport(_AdvancedBaseReport):
         :return: relative s53
         :rtype: float
         """
-        return self._report['Relative s53']
+        return self._get('Relative s53')
 
     @property
     def s55(self) -> float:
@@ -1472,7 +1617,7 @@ class RNA3DBaseStackingRelFreqReport(_AdvancedBaseReport):
         :return: relative s55
         :rtype: float
         """
-        return self._report['Relative s55']
+        return self._get('Relative s55')
 
     def download(self, download_type: DownloadType = DownloadType.Pdb, save: bool = False, target_dir: str = '') -> str:
         """Download PDB from NDB
@@ -1496,20 +1641,20 @@ class RNA3DBaseStackingRelFreqReport(_AdvancedBaseReport):
 
 class RNA3DMotifReport(_AdvancedBaseReport):
     """Class for RNA 3D Base Phosphate Relative Frequency Report search report extending _AdvancedBaseReport"""
+    __slots__ = ()
+    _schema = _AdvancedBaseReport._schema.extend(
+        ('PDB ID', str),
+        ('Motif ID', str),
+        ('Common Name', str),
+        ('Annotation', str)
+    )
+
     def __init__(self, report: dict = None):
         """Default constructor
 
         :param report: report dict to make report (default value = None)
         :type report: dict"""
-        super().__init__()
-        self._update({
-            'PDB ID': '',
-            'Motif ID': '',
-            'Common Name': '',
-            'Annotation': ''
-        })
-        if report:
-            self._update(report)
+        super().__init__(report)
 
     @staticmethod
     def report_type() -> str:
@@ -1522,7 +1667,7 @@ class RNA3DMotifReport(_AdvancedBaseReport):
         :return: PDB ID
         :rtype: str
         """
-        return self._report['PDB ID']
+        return self._get('PDB ID')
 
     @property
     def motif_id(self) -> str:
@@ -1531,7 +1676,7 @@ class RNA3DMotifReport(_AdvancedBaseReport):
         :return: motif ID
         :rtype: str
         """
-        return self._report['Motif ID']
+        return self._get('Motif ID')
 
     @property
     def common_name(self) -> str:
@@ -1540,7 +1685,7 @@ class RNA3DMotifReport(_AdvancedBaseReport):
         :return: common name
         :rtype: str
         """
-        return self._report['Common Name']
+        return self._get('Common Name')
 
     @property
     def annotation(self) -> str:
@@ -1549,7 +1694,7 @@ class RNA3DMotifReport(_AdvancedBaseReport):
         :return: annotation
         :rtype: str
         """
-        return self._report['Annotation']
+        return self._get('Annotation')
 
     def download(self, download_type: DownloadType = DownloadType.Pdb, save: bool = False, target_dir: str = '') -> str:
         """Download PDB from NDB
@@ -1,7 +1,118 @@
-from typing import List
+import csv
+from collections.abc import Sequence
+from typing import Callable, Dict, Iterator, List, Union
+from ndb_adapter.bulk_download import BulkDownloader
 from ndb_adapter.search_report import *
 from ndb_adapter.statistics import Statistics
 
+try:
+    import numpy
+except ImportError:  # optional columnar backend
+    numpy = None
+
+
+class LazyReportList(Sequence):
+    """Class for advanced search report list which keeps csv lines and makes report objects only when they are \
+    accessed - by index, slice or iteration
+
+    :cvar _batchSize: private number of rows made at once during iteration
+    """
+    _batchSize = 1024
+
+    def __init__(self, table: List[str], result_class: Callable[[dict], AdvancedReport]):
+        """Default constructor
+
+        :param table: csv lines of report, first line is header
+        :type table: List[str]
+        :param result_class: class that init report objects
+        :type result_class: Callable[[dict], AdvancedReport]
+        """
+        self._header = table[0] if table else ''
+        self._headers = next(csv.reader(table[:1]), [])
+        self._rows = LazyReportList._split_rows(table[1:])
+        self._result_class = result_class
+        self._reports = [None] * len(self._rows)
+
+    @staticmethod
+    def _split_rows(lines: List[str]) -> List[str]:
+        """Private method to group csv lines into rows - skips blank lines and joins quoted values spanning lines
+
+        :param lines: csv lines
+        :type lines: List[str]
+        :return: csv rows
+        :rtype: List[str]
+        """
+        rows = []
+        open_quotes = False
+        for line in lines:
+            if open_quotes:
+                rows[-1] += '\n' + line
+            elif line:
+                rows.append(line)
+            else:
+                continue
+            if line.count('"') % 2:
+                open_quotes = not open_quotes
+        return rows
+
+    def get_table(self) -> List[str]:
+        """Gets csv lines of report - header line and rows, quoted values spanning lines are joined
+
+        :return: csv lines of report
+        :rtype: List[str]
+        """
+        return [self._header] + self._rows if self._header else []
+
+    def _make(self, start: int, rows: List[List[str]]) -> None:
+        """Private method to make missing report objects of rows starting at index
+
+        :param start: index of first row
+        :type start: int
+        :param rows: csv values of rows
+        :type rows: List[List[str]]
+        :return: None
+        """
+        reports = self._reports
+        from_rows = getattr(self._result_class, '_from_rows', None)
+        if from_rows is not None and all(report is None for report in reports[start:start + len(rows)]):
+            reports[start:start + len(rows)] = from_rows(self._headers, rows)
+            return
+
+        for i, row in enumerate(rows, start):
+            if reports[i] is None:
+                reports[i] = self._result_class(dict(zip(self._headers, row)))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[AdvancedReport, List[AdvancedReport]]:
+        if isinstance(index, slice):
+            indexes = range(*index.indices(len(self._rows)))
+            if indexes.step == 1 and indexes:
+                self._make(indexes.start, list(csv.reader(self._rows[indexes.start:indexes.stop])))
+            return [self[i] for i in indexes]
+
+        report = self._reports[index]
+        if report is None:
+            index = index % len(self._rows)
+            self._make(index, [next(csv.reader([self._rows[index]]))])
+            report = self._reports[index]
+        return report
+
+    def __iter__(self) -> Iterator[AdvancedReport]:
+        size = LazyReportList._batchSize
+        for start in range(0, len(self._rows), size):
+            batch = self._reports[start:start + size]
+            if None in batch:
+                self._make(start, list(csv.reader(self._rows[start:start + size])))
+                batch = self._reports[start:start + size]
+            yield from batch
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, LazyReportList)):
+            return len(self) == len(other) and all(a is b or a == b for a, b in zip(self, other))
+        return NotImplemented
+
 
 class SearchResult(object):
     """Base class for search result"""
@@ -67,9 +178,10 @@ class SimpleResult(SearchResult):
         """
         return self._report
 
-    def download(self, download_type: DownloadType = DownloadType.Pdb,
-                 save: bool = False, target_dir: str = '') -> List[str]:
-        """Download PDB files from NDB
+    def download(self, download_type: DownloadType = DownloadType.Pdb, save: bool = False, target_dir: str = '',
+                 max_workers: int = 8, progress: Callable[[int, int, str, bool], None] = None,
+                 raw: bool = False, compressed: bool = False) -> List[str]:
+        """Download PDB files from NDB in parallel
 
         :param download_type: files download type (default value is DownloadType.PDB)
         :type download_type: DownloadType
@@ -77,24 +189,22 @@ class SimpleResult(SearchResult):
         :type target_dir: str
         :param save: tells if files should be saved or not (default value = False)
         :type save: bool
-        :return: list of strings or None
+        :param max_workers: max number of downloads running at once (default value = 8)
+        :type max_workers: int
+        :param progress: callback called after every download with (done, total, structure_id, success) \
+        (default value = None)
+        :type progress: Callable[[int, int, str, bool], None]
+        :param raw: tells if files should be returned as bytes without decoding (default value = False)
+        :type raw: bool
+        :param compressed: tells if gz compressed files should be returned or saved as they are on server - \
+        implies raw (default value = False)
+        :type compressed: bool
+        :return: list of strings, bytes or None in report order, failed downloads are left out
         :rtype: List[str]
         """
-        files = []
-        for rep in self.get_report():
-            file = ''
-            try:
-                file = rep.download(download_type, save, target_dir)
-            except FileNotFoundError:
-                print("No file with pdb_id: " + rep.pdb_id)
-                pass
-            except AttributeError:
-                print("Structure has not pdb_id and ndb_id in report")
-                pass
-
-            files.append(file)
-
-        return files
+        ids = [rep.pdb_id or rep.ndb_id for rep in self.get_report()]
+        downloader = BulkDownloader(max_workers=max_workers, progress=progress)
+        return downloader.download(ids, download_type, save, target_dir, raw, compressed)
 
 
 class AdvancedResult(SearchResult):
@@ -103,18 +213,22 @@ class AdvancedResult(SearchResult):
         """Default constructor"""
         super().__init__()
         self._statistics = Statistics()
+        self._types = None
+        self._columns = None
 
     def get_report(self) -> List[AdvancedReport]:
-        """Gets advanced search results report list. You should annotate return type depending on ReportType.
+        """Gets advanced search results report list. You should annotate return type depending on ReportType. \
+        Parsed reports are lazy list - report objects are made when accessed.
 
         :return: list of advanced search reports
         :rtype: List[AdvancedReport]
         """
         return self._report
 
-    def download(self, download_type: DownloadType = DownloadType.Pdb,
-                 save: bool = False, target_dir: str = '') -> List[str]:
-        """Download PDB files from NDB
+    def download(self, download_type: DownloadType = DownloadType.Pdb, save: bool = False, target_dir: str = '',
+                 max_workers: int = 8, progress: Callable[[int, int, str, bool], None] = None,
+                 raw: bool = False, compressed: bool = False) -> List[str]:
+        """Download PDB files from NDB in parallel. Reports without PDB ID don't support download and are left out.
 
         :param download_type: files download type (default value is DownloadType.PDB)
         :type download_type: DownloadType
@@ -122,28 +236,80 @@ class AdvancedResult(SearchResult):
         :type target_dir: str
         :param save: tells if files should be saved or not (default value = False)
         :type save: bool
-        :return: list of strings or None
+        :param max_workers: max number of downloads running at once (default value = 8)
+        :type max_workers: int
+        :param progress: callback called after every download with (done, total, structure_id, success) \
+        (default value = None)
+        :type progress: Callable[[int, int, str, bool], None]
+        :param raw: tells if files should be returned as bytes without decoding (default value = False)
+        :type raw: bool
+        :param compressed: tells if gz compressed files should be returned or saved as they are on server - \
+        implies raw (default value = False)
+        :type compressed: bool
+        :return: list of strings, bytes or None in report order, failed downloads are left out
         :rtype: List[str]
         """
-        try:
-            files = []
-            for rep in self._report:
-                file = ''
-                try:
-                    file = rep.download(download_type, save, target_dir)
-                except FileNotFoundError:
-                    print("No file with id: " + rep.pdb_id)
-                    pass
-                except AttributeError:
-                    print("Structure has not pdb_id in report")
-                    pass
-                files.append(file)
-
-            return files
-        except (NotImplementedError, KeyError):
-            print("This report type doesn't support download")
-
-        return []
+        ids = []
+        for rep in self._report:
+            pdb_id = getattr(rep, 'pdb_id', None)
+            if pdb_id is not None:
+                ids.append(pdb_id or rep.ndb_id)
+
+        downloader = BulkDownloader(max_workers=max_workers, progress=progress)
+        return downloader.download(ids, download_type, save, target_dir, raw, compressed)
+
+    def set_column_types(self, types: Dict[str, type]) -> None:
+        """Sets column types of report - columnar views of lazy report are parsed with them
+
+        :param types: dictionary of header -> column type, None to guess types
+        :type types: Dict[str, type]
+        :return: None
+        """
+        self._types = types
+        self._columns = None
+
+    def set_report(self, report: list) -> None:
+        """Sets result report list
+
+        :param report: list to be set as report
+        :type report: list
+        :return: None
+        """
+        self._report = report
+        self._columns = None
+
+    def to_arrays(self) -> Dict[str, list]:
+        """Gets report as dictionary of columns parsed straight from csv lines of lazy report, without report \
+        objects. Columns are converted to report schema types, numeric columns are typed numpy arrays (blank values \
+        are NaN) if numpy is installed, lists otherwise.
+
+        :return: dictionary of header -> column values
+        :rtype: Dict[str, list]
+        """
+        if self._columns is None:
+            if isinstance(self._report, LazyReportList):
+                import ndb_adapter.report_parser as parser
+                self._columns = parser.parse_csv_columns(self._report.get_table(), self._types)
+            else:
+                rows = [rep.get_dict() for rep in self._report]
+                self._columns = {key: [row.get(key) for row in rows] for key in (rows[0] if rows else {})}
+                if numpy is not None:
+                    self._columns = {key: numpy.array(column) for key, column in self._columns.items()}
+
+        return self._columns
+
+    def to_records(self) -> 'numpy.recarray':
+        """Gets report as numpy record array with one field per column - requires numpy
+
+        :return: record array
+        :rtype: numpy.recarray
+        """
+        if numpy is None:
+            raise ImportError("numpy is required for record arrays")
+
+        columns = self.to_arrays()
+        arrays = [column.astype(str) if column.dtype == object else column for column in columns.values()]
+        return numpy.rec.fromarrays(arrays, names=list(columns)) if arrays else numpy.recarray(0, dtype=[])
 
     def get_statistics(self) -> Statistics:
         """Get statistics of advanced search
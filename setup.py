@@ -18,6 +18,7 @@ setup(
     license='MIT',
     keywords=['ndbserver', 'ndb', 'nucleic acid database', 'adapter'],
     install_requires=['requests', 'xlrd'],
+    extras_require={'numpy': ['numpy'], 'pyarrow': ['numpy', 'pyarrow']},
     classifiers=[
             'Development Status :: 5 - Production/Stable',
             'Environment :: Console',
@@ -0,0 +1,30 @@
+import asyncio
+import unittest
+from ndb_adapter.async_ndb import AsyncNDB
+from ndb_adapter.ndb_session import NDBSession
+
+
+class AsyncNDBTest(unittest.TestCase):
+    def test_summary(self) -> None:
+        async def run():
+            async with AsyncNDB(concurrency=2) as ndb:
+                return await asyncio.gather(ndb.summary('5F8K'), ndb.summary('4Z4B'))
+
+        loop = asyncio.new_event_loop()
+        reports = loop.run_until_complete(run())
+        loop.close()
+        self.assertEqual(len(reports), 2)
+        self.assertEqual(reports[1].ndb_id, '4Z4B')
+
+    def test_concurrency(self) -> None:
+        with self.assertRaises(AttributeError):
+            AsyncNDB(concurrency=0)
+
+        NDBSession.set_default(NDBSession(pool_maxsize=4))
+        try:
+            self.assertEqual(AsyncNDB().concurrency, 4)
+        finally:
+            NDBSession.set_default(NDBSession())
+
+if __name__ == '__main__':
+    unittest.main()
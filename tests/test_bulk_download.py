@@ -0,0 +1,36 @@
+import unittest
+from unittest import mock
+from ndb_adapter.bulk_download import BulkDownloader
+from ndb_adapter.ndb_download import DownloadType
+from ndb_adapter.search_report import NDBStatusReport, SimpleReport
+from ndb_adapter.search_result import AdvancedResult, SimpleResult
+
+
+class BulkDownloadTests(unittest.TestCase):
+    def test_download(self):
+        progress = []
+        downloader = BulkDownloader(max_workers=4, per_host=2, progress=lambda *args: progress.append(args))
+        files = downloader.download(["5dg7", "NotExistingOne", "1kog"], DownloadType.Pdb)
+        self.assertEqual(len(files), 2)
+        self.assertIn("5DG7", files[0])
+        self.assertIn("1KOG", files[1])
+        self.assertEqual(len(progress), 3)
+        self.assertEqual(progress[-1][:2], (3, 3))
+
+    def test_workers(self):
+        with self.assertRaises(AttributeError):
+            BulkDownloader(max_workers=0)
+
+    def test_result_download_options(self):
+        simple = SimpleResult()
+        simple.report = [SimpleReport({'NDB ID': '5DG7', 'PDB ID': '5DG7'})]
+        advanced = AdvancedResult()
+        advanced.report = [NDBStatusReport({'NDB ID': '1KOG', 'PDB ID': '1KOG'})]
+        with mock.patch.object(BulkDownloader, 'download', return_value=[b'file']) as download:
+            self.assertEqual(simple.download(DownloadType.Cif, compressed=True), [b'file'])
+            download.assert_called_with(['5DG7'], DownloadType.Cif, False, '', False, True)
+            advanced.download(save=True, target_dir='files', raw=True)
+            download.assert_called_with(['1KOG'], DownloadType.Pdb, True, 'files', True, False)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,33 @@
+import threading
 import unittest
-from os.path import isfile, sep
-from os import getcwd, remove
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from os.path import isfile, join, sep
+from os import getcwd, listdir, remove
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import mock
 from ndb_adapter.ndb_download import DownloadHelper, DownloadType
 
 
+class FilesHandler(BaseHTTPRequestHandler):
+    """Handler serving files of server and counting requests"""
+    def do_GET(self):
+        name = self.path.rpartition('/')[-1]
+        with self.server.lock:
+            self.server.requests.append(name)
+        body = self.server.files.get(name)
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
 class DownloadTests(unittest.TestCase):
     def test_download(self):
         pdb_id = "5dg7"
@@ -25,6 +49,74 @@ class DownloadTests(unittest.TestCase):
         file = DownloadHelper.download("5DC3", DownloadType.CifStructureFactors)
         self.assertTrue(file)
 
+    def test_download_bio_assembly(self):
+        files = DownloadHelper.download("4ZM0", DownloadType.PdbBioAssembly)
+        self.assertGreaterEqual(len(files), 2)
+
+        DownloadHelper.download("4ZM0", DownloadType.PdbBioAssembly, save=True)
+        for i in range(1, len(files) + 1):
+            path = getcwd() + sep + "4zm0.pdb" + str(i)
+            self.assertTrue(isfile(path))
+            remove(path)
+        self.assertFalse(isfile(getcwd() + sep + "4zm0.pdb" + str(len(files) + 1)))
+
+    def test_download_bio_assembly_probes(self):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), FilesHandler)
+        server.lock = threading.Lock()
+        server.requests = []
+        server.files = {"1abc.pdb1": b"ONE", "1abc.pdb2": b"TWO", "1abc.pdb3": b"THREE", "1abc.pdb5": b"FIVE",
+                        "2abc.pdb1": b"ONE"}
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        url = "http://127.0.0.1:%d/biounit/" % server.server_port
+        directory = mkdtemp()
+        try:
+            with mock.patch.object(DownloadType.PdbBioAssembly.value, 'Url', url):
+                files = DownloadHelper.download("1ABC", DownloadType.PdbBioAssembly)
+                self.assertEqual(files, ["ONE", "TWO", "THREE"])
+                self.assertEqual(sorted(server.requests), ["1abc.pdb1", "1abc.pdb2", "1abc.pdb3", "1abc.pdb4"])
+
+                with open(join(directory, "1abc.pdb5"), 'wb') as file:
+                    file.write(b"USER FILE")
+                DownloadHelper.download("1ABC", DownloadType.PdbBioAssembly, save=True, target_dir=directory)
+                self.assertEqual(sorted(listdir(directory)), ["1abc.pdb1", "1abc.pdb2", "1abc.pdb3", "1abc.pdb5"])
+                with open(join(directory, "1abc.pdb5"), 'rb') as file:
+                    self.assertEqual(file.read(), b"USER FILE")
+
+                server.requests.clear()
+                DownloadHelper.load_listing(DownloadType.PdbBioAssembly, server.files)
+                self.assertEqual(DownloadHelper.download("2ABC", DownloadType.PdbBioAssembly), ["ONE"])
+                self.assertEqual(server.requests, ["2abc.pdb1"])
+        finally:
+            DownloadHelper.load_listing(DownloadType.PdbBioAssembly, None)
+            rmtree(directory)
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    def test_download_raw(self):
+        pdb_id = "5dg7"
+        text = DownloadHelper.download(pdb_id)
+        self.assertEqual(DownloadHelper.download(pdb_id, raw=True), text.encode("utf-8"))
+
+        compressed = DownloadHelper.download(pdb_id, compressed=True)
+        self.assertEqual(compressed[:2], b'\x1f\x8b')
+
+        path = getcwd() + sep + "pdb" + pdb_id + ".ent.gz"
+        DownloadHelper.download(pdb_id, save=True, compressed=True)
+        with open(path, 'rb') as file:
+            self.assertEqual(file.read(), compressed)
+        remove(path)
+
+        self.assertFalse(DownloadHelper.is_compressed(DownloadType.PdbBioAssembly))
+        self.assertTrue(DownloadHelper.is_compressed(DownloadType.Cif))
+
+    def test_load_listing(self):
+        DownloadHelper.load_listing(DownloadType.Pdb, ["pdb1kog.ent.gz"])
+        with self.assertRaises(FileNotFoundError):
+            DownloadHelper.download("5dg7", DownloadType.Pdb)
+        DownloadHelper.load_listing(DownloadType.Pdb, None)
+
     def test_download_file(self):
         url = "http://ndbserver.rutgers.edu/files/ftp/NDB/coordinates/na-chiral-correct/pdb5dg7.ent.gz"
         file = DownloadHelper.download_file(url)
@@ -34,5 +126,48 @@ class DownloadTests(unittest.TestCase):
             url = "http://ndbserver.rutgers.edu/files/ftp/NDB/coordinates/na-chiral-correct/NotExistingOne.ent.gz"
             DownloadHelper.download_file(url)
 
+    def test_download_to_file(self):
+        url = "http://ndbserver.rutgers.edu/files/ftp/NDB/coordinates/na-chiral-correct/pdb5dg7.ent.gz"
+        path = getcwd() + sep + "pdb5dg7.ent"
+        DownloadHelper.download_to_file(url, path)
+        with open(path, 'rb') as file:
+            self.assertEqual(file.read().decode("utf-8"), DownloadHelper.download("5dg7"))
+        remove(path)
+
+        with self.assertRaises(FileNotFoundError):
+            url = "http://ndbserver.rutgers.edu/files/ftp/NDB/coordinates/na-chiral-correct/NotExistingOne.ent.gz"
+            DownloadHelper.download_to_file(url, path)
+        self.assertFalse(isfile(path))
+
+    def test_download_resume(self):
+        url = "http://ndbserver.rutgers.edu/files/ftp/NDB/coordinates/na-chiral-correct/pdb5dg7.ent.gz"
+        path = getcwd() + sep + "pdb5dg7.ent.gz"
+        file = DownloadHelper.download_file(url).getvalue()
+        with open(path + ".part", 'wb') as part:
+            part.write(file[:len(file) // 2])
+
+        DownloadHelper.download_to_file(url, path, decompress=False)
+        self.assertFalse(isfile(path + ".part"))
+        with open(path, 'rb') as saved:
+            self.assertEqual(saved.read(), file)
+        remove(path)
+
+    def test_download_stale_part(self):
+        url = "http://ndbserver.rutgers.edu/files/ftp/NDB/coordinates/na-chiral-correct/pdb5dg7.ent.gz"
+        path = getcwd() + sep + "pdb5dg7.ent.gz"
+        file = DownloadHelper.download_file(url).getvalue()
+        for validator in (None, '"changed"'):
+            with open(path + ".part", 'wb') as part:
+                part.write(b'old version' * 100)
+            if validator:
+                with open(path + ".part.validator", 'w') as part_validator:
+                    part_validator.write(validator)
+
+            DownloadHelper.download_to_file(url, path, decompress=False)
+            self.assertFalse(isfile(path + ".part.validator"))
+            with open(path, 'rb') as saved:
+                self.assertEqual(saved.read(), file)
+            remove(path)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,81 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from os.path import isfile
+from shutil import rmtree
+from tempfile import mkdtemp
+from ndb_adapter.download_cache import DownloadCache
+from ndb_adapter.ndb_download import DownloadHelper, DownloadType
+
+
+class FileHandler(BaseHTTPRequestHandler):
+    """Handler serving current content of server file"""
+    def do_GET(self):
+        body = self.server.content
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class DownloadCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = mkdtemp()
+        self.cache = DownloadCache(self.directory, max_size=1024 ** 2, max_age=0)
+        DownloadHelper.set_cache(self.cache)
+
+    def tearDown(self):
+        DownloadHelper.set_cache(None)
+        self.cache.close()
+        rmtree(self.directory)
+
+    def test_download(self):
+        self.assertIsNone(self.cache.get(DownloadType.Pdb, "5dg7"))
+
+        file = DownloadHelper.download("5dg7")
+        path = self.cache.get(DownloadType.Pdb, "5DG7")
+        self.assertTrue(isfile(path))
+        self.assertGreater(self.cache.size, 0)
+
+        self.assertEqual(DownloadHelper.download("5dg7"), file)
+        self.assertEqual(self.cache.get(DownloadType.Pdb, "5dg7"), path)
+
+        with self.assertRaises(FileNotFoundError):
+            DownloadHelper.download("NotExistingOne", DownloadType.Cif)
+
+    def test_eviction(self):
+        cache = DownloadCache(self.directory, max_size=1)
+        url = "http://ndbserver.rutgers.edu/files/ftp/NDB/coordinates/na-mmcif/5dg7.cif.gz"
+        first = cache.fetch(url, DownloadType.Cif, "5dg7")
+        url = "http://ndbserver.rutgers.edu/files/ftp/NDB/coordinates/na-mmcif/1kog.cif.gz"
+        cache.fetch(url, DownloadType.Cif, "1kog")
+        self.assertFalse(isfile(first))
+        self.assertIsNone(cache.get(DownloadType.Cif, "5dg7"))
+        cache.close()
+
+    def test_changed_file(self):
+        server = HTTPServer(('127.0.0.1', 0), FileHandler)
+        server.content = b"first version"
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        url = "http://127.0.0.1:%d/5dg7.cif.gz" % server.server_port
+        try:
+            first = self.cache.fetch(url, DownloadType.Cif, "5dg7")
+            server.content = b"second version"
+            second = self.cache.fetch(url, DownloadType.Cif, "5dg7")
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+        self.assertNotEqual(first, second)
+        self.assertFalse(isfile(first))
+        with open(second, 'rb') as file:
+            self.assertEqual(file.read(), b"second version")
+        self.assertEqual(self.cache.size, len(b"second version"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from ndb_adapter.html_parser import NDBHtmlParser
+from ndb_adapter.html_parser import NDBHtmlParser, NDBHtmlExtractor
 
 
 class HtmlParserTests(unittest.TestCase):
@@ -46,6 +46,45 @@ class HtmlParserTests(unittest.TestCase):
         found = self.parser.find_all(params=params)
         self.assertFalse(found)
 
+    def test_parse_find_range(self):
+        self.parser.analyze("<div><p id='a'>1</p><p class='x'>2</p><br><p class='x'>3</p></br><p id='b'>4</p></div>")
+        first = self.parser.find_one(params={'id': 'a'})
+        last = self.parser.find_one(params={'id': 'b'})
+        br = self.parser.find_one('br')
+
+        found = self.parser.find_all('p', after=first, before=last)
+        self.assertEqual([tag.data for tag in found], ['1', '2', '3'])
+        found = self.parser.find_all(params={'class': 'x'}, after=br)
+        self.assertEqual([tag.data for tag in found], ['3'])
+        found = self.parser.find_all('p', after=last, before=first)
+        self.assertEqual([tag.data for tag in found], ['4'])
+        self.assertEqual(self.parser.find_one('p', after=br, params={'id': 'b', 'class': 'x'}).data, '3')
+        self.assertIsNone(self.parser.find_one('p', after=first, before=first))
+
+    def test_parse_data(self):
+        self.parser.analyze("<div>\n\tFirst <b>1</b> second&nbsp;<i>2</i>\xa0third</div>")
+        self.assertEqual(self.parser.get_tree().data, "Firstsecondthird")
+
+        depth = 5000
+        self.parser.analyze("<p>x" * depth + "</p>" * depth)
+        self.assertEqual(str(self.parser.get_tree()), "<p>x" * depth + "</p>" * depth)
+
+    def test_extract(self):
+        html = "<div><p>Skip</p><span id='numRec'>12</span><ul><li><a href='a.xls'>A</a></li></ul>" \
+               "<div id='summary'><h2>Test</h2><a href='b'>B</a></div></div>"
+        extractor = NDBHtmlExtractor([('span', {'id': 'numRec'}), ('div', {'id': 'summary'})])
+        extractor.register('a')
+        extractor.analyze(html)
+
+        self.assertEqual([tag.name for tag in extractor.get_tree().children], ['span', 'a', 'div'])
+        self.assertIsNone(extractor.find_one('p'))
+        count = extractor.find_one('span', params={'id': 'numRec'})
+        self.assertEqual(count.data, '12')
+        self.assertEqual([tag.attrs['href'] for tag in extractor.find_all('a', after=count)], ['a.xls', 'b'])
+        self.assertEqual(str(extractor.find_one('div')), "<div id=\"summary\"><h2>Test</h2><a href=\"b\">B</a></div>")
+
+        extractor.analyze("<p>Skip</p>")
+        self.assertIsNone(extractor.find_one('span'))
 
 if __name__ == '__main__':
     unittest.main()
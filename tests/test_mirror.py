@@ -0,0 +1,74 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from os import listdir, path
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import mock
+from ndb_adapter.mirror import Mirror
+from ndb_adapter.ndb_download import DownloadType
+
+
+class ListingHandler(BaseHTTPRequestHandler):
+    """Handler serving files of server as directory listing in format of NDB server"""
+    def do_GET(self):
+        name = self.path.rpartition('/')[-1]
+        files = self.server.files
+        if name:
+            body = files[name][1] if name in files else None
+        else:
+            body = ''.join("<a href=\"%s\">%s</a>  %s  %dK\n" % (file, file, modified, len(data))
+                           for file, (modified, data) in files.items()).encode()
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class MirrorTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = mkdtemp()
+
+    def tearDown(self):
+        rmtree(self.directory)
+
+    def test_directory(self):
+        mirror = Mirror(self.directory)
+        self.assertEqual(mirror.directory(DownloadType.Cif), path.join(self.directory, "na-mmcif"))
+        self.assertEqual(mirror.directory(DownloadType.CifStructureFactors),
+                         path.join(self.directory, "structure-factors"))
+
+    def test_sync(self):
+        server = HTTPServer(('127.0.0.1', 0), ListingHandler)
+        server.files = {"1a1t.mr": ("2016-06-08 12:00", b"restraints 1"), "2a2t.mr": ("2016-06-08 12:00", b"r2")}
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        url = "http://127.0.0.1:%d/nmr-restraints/" % server.server_port
+        try:
+            with mock.patch.object(DownloadType.CifNmrRestraints.value, 'Url', url):
+                progress = []
+                mirror = Mirror(self.directory, max_workers=2, progress=lambda *args: progress.append(args))
+                fetched = mirror.sync([DownloadType.CifNmrRestraints])
+                directory = mirror.directory(DownloadType.CifNmrRestraints)
+                self.assertEqual(sorted(path.basename(file) for file in fetched), ["1a1t.mr", "2a2t.mr"])
+                self.assertEqual(len(progress), len(fetched))
+                self.assertIn("1a1t.mr", listdir(directory))
+                with open(path.join(directory, "2a2t.mr"), 'rb') as file:
+                    self.assertEqual(file.read(), b"r2")
+
+                self.assertEqual(mirror.sync([DownloadType.CifNmrRestraints]), [])
+                server.files["2a2t.mr"] = ("2017-01-01 12:00", b"r2 updated")
+                self.assertEqual(mirror.sync([DownloadType.CifNmrRestraints]), [path.join(directory, "2a2t.mr")])
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+from os import path
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import mock
+from ndb_adapter.mirror_index import MirrorIndex
+from ndb_adapter.ndb_download import DownloadHelper, DownloadType
+
+
+class MirrorIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = mkdtemp()
+        self.path = path.join(self.directory, "index.json.gz")
+
+    def tearDown(self):
+        DownloadHelper.load_listing(DownloadType.Cif, None)
+        rmtree(self.directory)
+
+    def test_available(self):
+        index = MirrorIndex(self.path)
+        index.refresh([DownloadType.Cif])
+        self.assertTrue(path.isfile(self.path))
+        self.assertTrue(index.available("5DG7", DownloadType.Cif))
+        self.assertFalse(index.available("NotExistingOne", DownloadType.Cif))
+
+        index = MirrorIndex(self.path)
+        self.assertEqual(index.filter(["NotExistingOne", "5dg7"], DownloadType.Cif), ["5dg7"])
+
+        index.attach([DownloadType.Cif])
+        with self.assertRaises(FileNotFoundError):
+            DownloadHelper.download("NotExistingOne", DownloadType.Cif)
+
+    def test_candidate_names(self):
+        self.assertEqual(DownloadHelper.candidate_names("5DG7"), ["pdb5dg7.ent.gz", "5dg7.ent.gz"])
+        self.assertEqual(DownloadHelper.candidate_names("5DG7", DownloadType.PdbBioAssembly), ["5dg7.pdb1"])
+
+        index = MirrorIndex(self.path)
+        files = {"5dg7.pdb1": ("", ""), "5dg7.pdb2": ("", "")}
+        with mock.patch.object(index, 'files', return_value=files):
+            self.assertTrue(index.available("5DG7", DownloadType.PdbBioAssembly))
+            self.assertFalse(index.available("1ABC", DownloadType.PdbBioAssembly))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,48 @@
+import threading
 import unittest
 import os
 from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+import requests
 from ndb_adapter.advanced_search_options import AdvancedSearchOptions
 from ndb_adapter.dna_search_options import DnaSearchOptions
-from ndb_adapter.ndb import NDB
+from ndb_adapter.ndb import NDB, _PageSizer
+from ndb_adapter.ndb_base import NDBBase
 from ndb_adapter.enums import *
 from ndb_adapter.ndb_download import DownloadType
 from typing import List
 
 
+class SummaryHandler(BaseHTTPRequestHandler):
+    """Handler answering summary of structure, or error status for ids starting with BAD"""
+    def do_POST(self):
+        structure_id = self.rfile.read(int(self.headers['Content-Length'])).decode().rpartition('=')[-1]
+        body = ("<div id=\"summary\"><h2 class=\"justHeading\">NDB ID: <span>%s</span><span>%s</span></h2>"
+                "<h3 id=\"dataKey\">End</h3></div>" % (structure_id, structure_id)).encode()
+        self.send_response(403 if structure_id.startswith('BAD') else 200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ErrorHandler(BaseHTTPRequestHandler):
+    """Handler answering every request with error page"""
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        body = b"<html><body>Forbidden</body></html>"
+        self.send_response(403)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
 class NDBTest(unittest.TestCase):
 
     def test_advanced_search(self) -> None:
@@ -28,6 +62,21 @@ class NDBTest(unittest.TestCase):
             self.assertTrue(result)
             self.assertGreater(result.count, 0)
 
+    def test_iter_advanced_search(self) -> None:
+        opt = AdvancedSearchOptions(ReportType.Citation)
+        result = NDB.iter_advanced_search(opt)
+        first = next(result)  # type: ReportType.Citation
+        self.assertTrue(isinstance(first.year, int))
+        self.assertGreater(sum(1 for _ in result), 8019)
+
+    def test_advanced_search_arrays(self) -> None:
+        opt = AdvancedSearchOptions(ReportType.NABackboneTorsion)
+        opt.set_ndb_id('1D66')
+        result = NDB.advanced_search(opt)
+        arrays = result.to_arrays()
+        self.assertEqual(len(arrays["Residue Num"]), len(result.report))
+        self.assertEqual(arrays["Chain ID"][0], result.report[0].chain_id)
+
     def test_advanced_search_statistic(self) -> None:
         opt = AdvancedSearchOptions(ReportType.RNABasePairRelFreq)
         opt.set_hybrid(yes_no_ignore=YesNoIgnore.Yes)
@@ -99,6 +148,29 @@ class NDBTest(unittest.TestCase):
         self.assertGreaterEqual(count, 392)
         self.assertIsNot(result.report, [])
 
+    def test_iter_dna_search(self) -> None:
+        opt = DnaSearchOptions()
+        opt.set_structural_features(StructuralFeatures.A_DNA)
+        count = NDB.dna_search(opt).count
+        reports = list(NDB.iter_dna_search(opt))
+        self.assertEqual(len(reports), count)
+        self.assertEqual(len(set(report.ndb_id for report in reports)), count)
+
+    def test_page_sizer(self) -> None:
+        sizer = _PageSizer()
+        size = sizer.size
+        sizer.update(size, 0.01)
+        self.assertEqual(sizer.size, 2 * size)
+        sizer.update(sizer.size, 60)
+        self.assertEqual(sizer.size, size)
+        sizer.cap(30)
+        sizer.update(30, 0.01)
+        self.assertEqual(sizer.size, 30)
+
+        fixed = _PageSizer(25)
+        fixed.update(25, 0.01)
+        self.assertEqual(fixed.size, 25)
+
     def test_rna_search(self) -> None:
         result = NDB.rna_search()
         count = result.count
@@ -117,6 +189,45 @@ class NDBTest(unittest.TestCase):
         self.assertTrue(report)
         self.assertTrue(file)
 
+    def test_summaries(self) -> None:
+        ids = ['5F8K', '4Z4B', '5F8K']
+        calls = []
+        reports = NDB.summaries(ids, max_workers=2, progress=lambda *args: calls.append(args))
+        self.assertEqual(list(reports), ['5F8K', '4Z4B'])
+        self.assertEqual([call[2:] for call in sorted(calls)], [('5F8K', True), ('4Z4B', True)])
+        self.assertEqual(reports['4Z4B'].get_dict(), NDB.summary('4Z4B').get_dict())
+        self.assertEqual(dict(NDB.iter_summaries(ids, processes=2)).keys(), reports.keys())
+
+    def test_iter_advanced_search_error_status(self) -> None:
+        server = ThreadingHTTPServer(('127.0.0.1', 0), ErrorHandler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            with mock.patch.object(NDBBase, '_advancedUrl', "http://127.0.0.1:%d/search" % server.server_port):
+                with self.assertRaises(requests.HTTPError):
+                    next(NDB.iter_advanced_search())
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    def test_summaries_error_status(self) -> None:
+        server = ThreadingHTTPServer(('127.0.0.1', 0), SummaryHandler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            with mock.patch.object(NDBBase, '_summaryUrl', "http://127.0.0.1:%d/summary" % server.server_port):
+                calls = []
+                reports = NDB.summaries(['1ABC', 'BAD1'], max_workers=2, progress=lambda *args: calls.append(args))
+                self.assertEqual(list(reports), ['1ABC'])
+                self.assertEqual(reports['1ABC'].ndb_id, '1ABC')
+                self.assertEqual(sorted(call[2:] for call in calls), [('1ABC', True), ('BAD1', False)])
+                self.assertEqual(NDB.summary('BAD1').ndb_id, 'BAD1')
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
     def test_ndb_download_search(self) -> None:
         opt = AdvancedSearchOptions()
         opt.set_drug(yes_no_ignore=YesNoIgnore.Yes)
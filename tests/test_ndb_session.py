@@ -0,0 +1,26 @@
+import unittest
+from ndb_adapter.ndb_session import NDBSession
+
+
+class NDBSessionTests(unittest.TestCase):
+    def test_default(self):
+        session = NDBSession.get_default()
+        self.assertIs(session, NDBSession.get_default())
+
+        custom = NDBSession(pool_maxsize=4, max_retries=1, timeout=5)
+        NDBSession.set_default(custom)
+        self.assertIs(NDBSession.get_default(), custom)
+        self.assertEqual(NDBSession.get_default().timeout, 5)
+
+        NDBSession.set_default(NDBSession())
+
+    def test_reuse(self):
+        url = "http://ndbserver.rutgers.edu/files/ftp/NDB/coordinates/na-chiral-correct/pdb5dg7.ent.gz"
+        with NDBSession(keep_alive=True) as session:
+            first = session.get(url)
+            second = session.get(url)
+            self.assertEqual(first.status_code, 200)
+            self.assertEqual(first.content, second.content)
+
+if __name__ == '__main__':
+    unittest.main()
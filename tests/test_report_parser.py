@@ -1,7 +1,8 @@
 import unittest
 from os import getcwd, path
 from io import BytesIO
-from ndb_adapter import report_parser, NDBStatusReport
+from ndb_adapter import report_parser, NDBStatusReport, NABackboneTorsionReport, ReportType
+from ndb_adapter.html_parser import NDBHtmlParser
 
 
 class ReportParserTests(unittest.TestCase):
@@ -25,6 +26,83 @@ class ReportParserTests(unittest.TestCase):
         self.assertEqual(result[0].ndb_id, "5DG7")
         self.assertEqual(result[1].release_date, "2016-06-08")
 
+    def test_parse_csv_quoted(self):
+        to_test = ["NDB ID,Model ID,Chain ID,Residue Num,Residue Name",
+                   "1D66,1,\"A\",5,DG"]
+        result = report_parser.parse_csv(table=to_test, result_class=NABackboneTorsionReport)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].chain_id, "A")
+        self.assertEqual(result[0].residue_number, 5)
+        self.assertEqual(report_parser.parse_csv(table=[], result_class=NABackboneTorsionReport), [])
+
+    def test_parse_csv_columns(self):
+        to_test = ["NDB ID,Residue Num,Chain ID,O3'-P-O5'-C5'",
+                   "1D66,1,\"A\",-131.6",
+                   "1D66,2,\"B, C\",103.9"]
+        result = report_parser.parse_csv_columns(to_test)
+        self.assertEqual(list(result.keys()), ["NDB ID", "Residue Num", "Chain ID", "O3'-P-O5'-C5'"])
+        self.assertEqual(list(result["NDB ID"]), ["1D66", "1D66"])
+        self.assertEqual(list(result["Residue Num"]), [1, 2])
+        self.assertEqual(list(result["Chain ID"]), ["A", "B, C"])
+        self.assertEqual(list(result["O3'-P-O5'-C5'"]), [-131.6, 103.9])
+        self.assertEqual(report_parser.parse_csv_columns([]), {})
+
+    def test_parse_advanced_search_report_arrays(self):
+        to_test = "NA Backbone Torsion Report\nNumber of records: 2\n" + \
+                  "NDB ID,Model ID,Chain ID,Residue Num,Residue Name,O3'-P-O5'-C5'\n" + \
+                  "1D66,1,A,5,DG,-131.6\n" + \
+                  "1D66,1,A,6,DC,103.9"
+        result = report_parser.parse_advanced_search_report(to_test, "", ReportType.NABackboneTorsion)
+        self.assertEqual(result.count, 2)
+        arrays = result.to_arrays()
+        self.assertEqual(list(arrays["Model ID"]), ["1", "1"])
+        self.assertEqual(list(arrays["Residue Num"]), [5, 6])
+        self.assertEqual(list(arrays["O3'-P-O5'-C5'"]), [-131.6, 103.9])
+
+        if report_parser.numpy is not None:
+            records = result.to_records()
+            self.assertEqual(records.shape, (2,))
+            self.assertEqual(records[1]["Residue Name"], "DC")
+            self.assertEqual(records["Residue Num"].dtype.kind, "i")
+
+    def test_parse_advanced_search_report_lazy(self):
+        to_test = "NA Backbone Torsion Report\nNumber of records: 3\n" + \
+                  "NDB ID,Model ID,Chain ID,Residue Num,Residue Name\n" + \
+                  "1D66,1,A,5,DG\n\n" + \
+                  "1D66,1,A,6,DC\n" + \
+                  "1D66,1,\"B\",7,\"D\nA\""
+        result = report_parser.parse_advanced_search_report(to_test, "", ReportType.NABackboneTorsion)
+        self.assertEqual(list(result.to_arrays()["Residue Name"]), ["DG", "DC", "D\nA"])
+        report = result.report
+        self.assertEqual(len(report), 3)
+        self.assertEqual(report[-1].chain_id, "B")
+        self.assertIs(report[1], report[1])
+        self.assertEqual([r.residue_number for r in report[:2]], [5, 6])
+        self.assertEqual([r.residue_number for r in report], [5, 6, 7])
+        with self.assertRaises(IndexError):
+            report[3]
+
+    def test_iter_advanced_search_report(self):
+        to_test = iter(["NA Backbone Torsion Report",
+                        "Number of records: 2",
+                        "NDB ID,Model ID,Chain ID,Residue Num,Residue Name",
+                        "1D66,1,A,5,DG",
+                        "1D66,1,A,6,DC"])
+        result = report_parser.iter_advanced_search_report(to_test, ReportType.NABackboneTorsion)
+        first = next(result)
+        self.assertEqual(first.residue_number, 5)
+        self.assertEqual([report.residue_number for report in result], [6])
+
+    def test_parse_listing(self):
+        to_test = "<a href=\"?C=N;O=D\">Name</a>\n" + \
+                  "<a href=\"/files/ftp/NDB/coordinates/\">Parent Directory</a>\n" + \
+                  "<a href=\"100d.cif.gz\">100d.cif.gz</a>             2016-06-08 12:00   44K\n" + \
+                  "<tr><td><a href=\"101d.cif.gz\">101d.cif.gz</a></td><td align=\"right\">2016-06-09 10:00" + \
+                  "</td><td align=\"right\">1.2M</td></tr>"
+        result = report_parser.parse_listing(to_test)
+        self.assertEqual(result, {'100d.cif.gz': ('2016-06-08 12:00', '44K'),
+                                  '101d.cif.gz': ('2016-06-09 10:00', '1.2M')})
+
     def test_parse_xls(self):
         with open(getcwd() + path.sep + "test.xls", "rb") as file:
             result = report_parser.parse_xls(BytesIO(file.read()))
@@ -33,5 +111,40 @@ class ReportParserTests(unittest.TestCase):
             self.assertEqual(result[0].ndb_id, "5DG7")
             self.assertEqual(result[1].release_date, "2016-06-08")
 
+    def test_gallery_file_url(self):
+        xls_only = "<span id=\"numRec\">2</span><a id=\"fileGal\" href=\"/files/gal.xls\">xls</a>"
+        other_csv = xls_only + "<a href=\"/help/example.csv\">example</a>"
+        with_csv = other_csv + "<a href=\"/files/gal.CSV?x=1\">csv</a>"
+        csv_id = other_csv + "<a id=\"fileGalCsv\" href=\"/files/result.csv\">csv</a>"
+        for html, expected in ((xls_only, '/files/gal.xls'), (other_csv, '/files/gal.xls'),
+                               (with_csv, '/files/gal.CSV?x=1'), (csv_id, '/files/result.csv'), ('', '')):
+            html_parser = NDBHtmlParser()
+            html_parser.analyze(html)
+            self.assertEqual(report_parser.gallery_file_url(html_parser), expected)
+
+    def test_parse_gallery_file(self):
+        text = "NDB ID,PDB ID,PDB Release Date,Resolution\n5DG7,5DG7,2016-06-08,2.26\n"
+        result = report_parser.parse_gallery_file(BytesIO(text.encode('utf-8')), '/files/gal.csv')
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].ndb_id, "5DG7")
+        self.assertEqual(result[0].resolution, 2.26)
+
+    def test_parse_summary(self):
+        html = "<html><body><ul><li>Menu</li></ul><div id=\"summary\">" + \
+               "<h2 class=\"justHeading\">NDB ID: <span>1ABC</span><span>1ABC</span></h2>" + \
+               "<h3 id=\"dataKey\">Title:</h3><p>Some title</p>" + \
+               "<h3 id=\"dataKey\">Nucleic Acid Sequence:</h3><div id=\"naSeq\">" + \
+               "<span class=\"blueBoldTxt\">Chain A</span><span>CGCG</span></div>" + \
+               "<h3 id=\"dataKey\">Cell Constants:</h3><p>a = 24.87 b = 40.39</p>" + \
+               "<h3 id=\"dataKey\">End</h3></div><table><tr><td>Footer</td></tr></table></body></html>"
+        result = report_parser.parse_summary(html)
+        html_parser = NDBHtmlParser()
+        html_parser.analyze(html)
+        self.assertEqual(result.get_dict(), report_parser._parse_summary_tree(html_parser).get_dict())
+        self.assertEqual(result.ndb_id, "1ABC")
+        self.assertEqual(result.title, "Some title")
+        self.assertEqual(result.get_dict()['Nucleic Acid Sequence'], {'Chain A': 'CGCG'})
+        self.assertEqual(result.get_dict()['Cell Constants'], {'a': 24.87, 'b': 40.39})
+
 if __name__ == '__main__':
     unittest.main()
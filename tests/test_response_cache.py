@@ -0,0 +1,41 @@
+import unittest
+from os import path
+from shutil import rmtree
+from tempfile import mkdtemp
+from ndb_adapter.ndb import NDB
+from ndb_adapter.response_cache import ResponseCache, MemoryResponseCache, SQLiteResponseCache
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def test_make_key(self):
+        first = ResponseCache.make_key("url", {'a': '1', 'b': '2'})
+        self.assertEqual(first, ResponseCache.make_key("url", {'b': '2', 'a': '1'}))
+        self.assertNotEqual(first, ResponseCache.make_key("other", {'a': '1', 'b': '2'}))
+
+    def test_memory(self):
+        cache = MemoryResponseCache(max_entries=1)
+        cache.set("one", 1)
+        self.assertEqual(cache.get("one"), 1)
+        cache.set("two", 2)
+        self.assertIsNone(cache.get("one"))
+        cache.set("two", 2, ttl=-1)
+        self.assertIsNone(cache.get("two"))
+
+    def test_sqlite(self):
+        directory = mkdtemp()
+        cache = SQLiteResponseCache(path.join(directory, "cache.sqlite"))
+        cache.set("one", {'a': [1, 2]})
+        self.assertEqual(cache.get("one"), {'a': [1, 2]})
+        cache.clear()
+        self.assertIsNone(cache.get("one"))
+        cache.close()
+        rmtree(directory)
+
+    def test_summary(self):
+        NDB.set_cache(MemoryResponseCache())
+        first = NDB.summary('5F8K')
+        self.assertIs(NDB.summary('5F8K'), first)
+        NDB.set_cache(None)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -31,6 +31,15 @@ class SearchOptionsTests(unittest.TestCase):
         self.assertEqual(opt.get_protein_func(), ProteinFunc.Regulatory)
         self.assertEqual(opt.get()["strGalType"], "dna")
 
+    def test_search_options_page(self):
+        opt = DnaSearchOptions()
+        self.assertEqual((opt.get_start(), opt.get_limit()), (0, 10))
+        opt.set_start(20)
+        opt.set_limit(50)
+        self.assertEqual((opt.get()["start"], opt.get()["limit"]), ("20", "50"))
+        self.assertRaises(AttributeError, opt.set_start, -1)
+        self.assertRaises(AttributeError, opt.set_limit, 0)
+
     def test_rna_search_options(self):
         opt = RnaSearchOptions()
         opt.set_filter_text("args")
@@ -0,0 +1,51 @@
+import unittest
+import pickle
+from ndb_adapter.enums import ReportType
+from ndb_adapter.search_report import SimpleReport, NABackboneTorsionReport, CitationReport, \
+    BasePairStepParameterReport
+
+
+class SearchReportTests(unittest.TestCase):
+    def test_defaults(self):
+        report = SimpleReport()
+        self.assertEqual(report.pdb_id, '')
+        self.assertEqual(report.resolution, 0)
+        self.assertEqual(report.get_dict()['Title'], '')
+
+    def test_slots(self):
+        for report_type in ReportType:
+            report = report_type.value({'NDB ID': '1D66'})
+            self.assertFalse(hasattr(report, '__dict__'))
+            self.assertEqual(report.ndb_id, '1D66')
+
+    def test_values(self):
+        report = NABackboneTorsionReport({'NDB ID': '1D66', 'Model ID': '1', 'Chain ID': 'A', 'Residue Num': '5',
+                                          "O3'-P-O5'-C5'": '-131.6', 'Other': 'x'})
+        self.assertEqual(report.chain_id, 'A')
+        self.assertEqual(report.residue_number, 5)
+        self.assertEqual(report.o3_p_o5_c5, -131.6)
+        self.assertEqual(report.get_dict()['Other'], 'x')
+
+        copy = pickle.loads(pickle.dumps(report))
+        self.assertEqual(copy.get_dict(), report.get_dict())
+
+    def test_column_types(self):
+        types = CitationReport.column_types()
+        self.assertIs(types['Year'], int)
+        self.assertIs(types['Pubmed ID'], str)
+
+        report = CitationReport({'PDB ID': '1234', 'Pubmed ID': '998877', 'Year': '2001'})
+        self.assertEqual(report.pdb_id, '1234')
+        self.assertEqual(report.pubmed_id, '998877')
+        self.assertEqual(report.year, 2001)
+
+    def test_from_rows(self):
+        headers = ['NDB ID', 'Model Number', 'Step Name', 'Shift', 'Other']
+        reports = BasePairStepParameterReport._from_rows(headers, [['1D66', '1', 'CG/CG', '0.5', 'x'],
+                                                                   ['1D67', '1', 'GC/GC', '', 'y']])
+        self.assertEqual([r.shift for r in reports], [0.5, ''])
+        self.assertEqual(reports[0].model_num, 1)
+        self.assertEqual(reports[1].get_dict()['Other'], 'y')
+
+if __name__ == '__main__':
+    unittest.main()